@@ -19,6 +19,26 @@ class Settings(BaseSettings):
         SECRET_KEY (str): The secret key for JWT token generation.
         OPENAI_API_KEY (str): The OpenAI API key.
         OPENAI_API_KEY (str): The OpenAI API key.
+        EMBEDDING_MODEL (str): The OpenAI embedding model; part of every embedding cache key.
+        EMBEDDING_CACHE_PATH (str): SQLite file for the persistent embedding cache tier.
+        EMBEDDING_CACHE_MEMORY_ENTRIES (int): Capacity of the in-process LRU embedding cache.
+        EMBEDDING_CACHE_MAX_BYTES (int): Size cap of the persistent embedding cache.
+        EMBEDDING_MAX_CONCURRENCY (int): OpenAI embedding requests allowed in flight at once.
+        EMBEDDING_TIMEOUT_SECONDS (float): Timeout of a single OpenAI embedding request.
+        EMBEDDING_MAX_RETRIES (int): Retries of a rate-limited or timed-out embedding request.
+        AUDIT_BUFFER_READS (bool): Queue READ audit logs in memory and write them in batches.
+        AUDIT_FLUSH_SIZE (int): Buffered READ audit logs that trigger a flush.
+        AUDIT_FLUSH_INTERVAL_SECONDS (float): Longest time a READ audit log stays buffered.
+        AUDIT_MAX_BUFFERED (int): Buffered READ audit logs above which callers flush inline.
+        READ_QUERIES_IN_TRANSACTION (bool): Wrap read endpoints in interactive transactions.
+        DAGSTER_EXECUTE_URL (str): The dagster API endpoint that launches pipeline runs.
+        DAGSTER_TIMEOUT_SECONDS (float): Timeout of a single pipeline launch request.
+        DAGSTER_MAX_CONNECTIONS (int): Pooled connections to the dagster API.
+        OUTBOX_MAX_CONCURRENCY (int): Pipeline launches the outbox dispatcher runs at once.
+        OUTBOX_MAX_ATTEMPTS (int): Launch attempts before a queued pipeline run is failed.
+        OUTBOX_POLL_INTERVAL_SECONDS (float): Longest wait between scans of the outbox.
+        OUTBOX_RETRY_BACKOFF_SECONDS (float): Delay before the first retry, doubled after each.
+        OUTBOX_LEASE_SECONDS (float): Age after which a claimed outbox entry is claimed again.
     """
 
     SUPABASE_URL: AnyHttpUrl = Field(default=os.getenv("SUPABASE_URL"))
@@ -45,6 +65,74 @@ class Settings(BaseSettings):
     DATABASE_URL: PostgresDsn = Field(
         default=(os.getenv("DATABASE_URL") if os.getenv("DATABASE_URL") else "")
     )
+    EMBEDDING_MODEL: str = Field(
+        default=(
+            os.getenv("EMBEDDING_MODEL")
+            if os.getenv("EMBEDDING_MODEL")
+            else "text-embedding-ada-002"
+        )
+    )
+    EMBEDDING_CACHE_PATH: str = Field(
+        default=(
+            os.getenv("EMBEDDING_CACHE_PATH")
+            if os.getenv("EMBEDDING_CACHE_PATH")
+            else str(
+                Path(__file__).resolve().parent.parent / "db" / "embeddings.sqlite3"
+            )
+        )
+    )
+    EMBEDDING_CACHE_MEMORY_ENTRIES: int = Field(
+        default=int(os.getenv("EMBEDDING_CACHE_MEMORY_ENTRIES", "1024"))
+    )
+    EMBEDDING_CACHE_MAX_BYTES: int = Field(
+        default=int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    )
+    EMBEDDING_MAX_CONCURRENCY: int = Field(
+        default=int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "8"))
+    )
+    EMBEDDING_TIMEOUT_SECONDS: float = Field(
+        default=float(os.getenv("EMBEDDING_TIMEOUT_SECONDS", "30"))
+    )
+    EMBEDDING_MAX_RETRIES: int = Field(
+        default=int(os.getenv("EMBEDDING_MAX_RETRIES", "3"))
+    )
+    AUDIT_BUFFER_READS: bool = Field(
+        default=os.getenv("AUDIT_BUFFER_READS", "true").lower() == "true"
+    )
+    AUDIT_FLUSH_SIZE: int = Field(default=int(os.getenv("AUDIT_FLUSH_SIZE", "100")))
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "1.0"))
+    )
+    AUDIT_MAX_BUFFERED: int = Field(
+        default=int(os.getenv("AUDIT_MAX_BUFFERED", "10000"))
+    )
+    READ_QUERIES_IN_TRANSACTION: bool = Field(
+        default=os.getenv("READ_QUERIES_IN_TRANSACTION", "false").lower() == "true"
+    )
+
+    DAGSTER_EXECUTE_URL: str = Field(
+        default=os.getenv("DAGSTER_EXECUTE_URL", "http://dagster_api:8001/execute")
+    )
+    DAGSTER_TIMEOUT_SECONDS: float = Field(
+        default=float(os.getenv("DAGSTER_TIMEOUT_SECONDS", "30"))
+    )
+    DAGSTER_MAX_CONNECTIONS: int = Field(
+        default=int(os.getenv("DAGSTER_MAX_CONNECTIONS", "20"))
+    )
+
+    OUTBOX_MAX_CONCURRENCY: int = Field(
+        default=int(os.getenv("OUTBOX_MAX_CONCURRENCY", "4"))
+    )
+    OUTBOX_MAX_ATTEMPTS: int = Field(default=int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5")))
+    OUTBOX_POLL_INTERVAL_SECONDS: float = Field(
+        default=float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "5.0"))
+    )
+    OUTBOX_RETRY_BACKOFF_SECONDS: float = Field(
+        default=float(os.getenv("OUTBOX_RETRY_BACKOFF_SECONDS", "2.0"))
+    )
+    OUTBOX_LEASE_SECONDS: float = Field(
+        default=float(os.getenv("OUTBOX_LEASE_SECONDS", "300"))
+    )
 
     model_config = SettingsConfigDict(
         case_sensitive=False,
@@ -4,6 +4,7 @@ from typing import Generator
 from fastapi import Depends
 from prisma import Prisma
 from backend.app.database import prisma_client
+from backend.app.registry import ServiceRegistry, service_registry
 from backend.app.features.core.controllers.block_controller import BlockController
 from backend.app.features.core.controllers.edge_controller import EdgeController
 from backend.app.features.core.controllers.pipeline_controller import PipelineController
@@ -13,13 +14,25 @@ def get_prisma() -> Prisma:
     return prisma_client
 
 
-def get_block_controller(prisma: Prisma = Depends(get_prisma)) -> BlockController:
-    return BlockController(prisma)
+async def get_registry(prisma: Prisma = Depends(get_prisma)) -> ServiceRegistry:
+    # The registry is normally started by the FastAPI startup hook; start and warm it up
+    # lazily for callers (scripts, tests) that resolve dependencies without the hook.
+    return await service_registry.ensure_started(prisma)
 
 
-def get_edge_controller(prisma: Prisma = Depends(get_prisma)) -> EdgeController:
-    return EdgeController(prisma)
+def get_block_controller(
+    registry: ServiceRegistry = Depends(get_registry),
+) -> BlockController:
+    return registry.block_controller
 
 
-def get_pipeline_controller(prisma: Prisma = Depends(get_prisma)) -> PipelineController:
-    return PipelineController(prisma)
+def get_edge_controller(
+    registry: ServiceRegistry = Depends(get_registry),
+) -> EdgeController:
+    return registry.edge_controller
+
+
+def get_pipeline_controller(
+    registry: ServiceRegistry = Depends(get_registry),
+) -> PipelineController:
+    return registry.pipeline_controller
@@ -13,7 +13,9 @@ Responsibilities:
 - Manage taxonomy associations for blocks.
 - Perform search operations based on taxonomy filters.
 - Handle audit logging for all block operations.
+- Bulk-create blocks with batched embeddings and `create_many` writes.
 - Ensure transactional safety and data consistency.
+- Run read-only operations on the shared client, without interactive transactions.
 """
 
 import sys
@@ -28,7 +30,7 @@ sys.path.append(
 import traceback
 from prisma import Prisma
 from uuid import UUID, uuid4
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from backend.app.features.core.services.block_service import BlockService
 from backend.app.features.core.services.taxonomy_service import TaxonomyService
 from backend.app.features.core.services.audit_service import AuditService
@@ -42,19 +44,35 @@ from backend.app.utils.serialization_utils import (
 import asyncio
 from prisma import Prisma
 from backend.app.logger import ConstellationLogger
+from backend.app.utils.transaction_utils import read_session
 from prisma.models import AuditLog as PrismaAuditLog
 import traceback
 import json
 
 
 class BlockController:
-    def __init__(self, prisma: Prisma, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        prisma: Prisma,
+        api_key: Optional[str] = None,
+        block_service: Optional[BlockService] = None,
+        taxonomy_service: Optional[TaxonomyService] = None,
+        audit_service: Optional[AuditService] = None,
+        vector_embedding_service: Optional[VectorEmbeddingService] = None,
+        paper_service: Optional[PaperService] = None,
+    ):
+        """
+        Services may be injected (see backend.app.registry) so that the expensive ones,
+        such as BlockService, are built once per process instead of once per request.
+        """
         self.prisma = prisma
-        self.block_service = BlockService()
-        self.taxonomy_service = TaxonomyService()
-        self.audit_service = AuditService()
-        self.vector_embedding_service = VectorEmbeddingService(api_key)
-        self.paper_service = PaperService()
+        self.block_service = block_service or BlockService()
+        self.taxonomy_service = taxonomy_service or TaxonomyService()
+        self.audit_service = audit_service or AuditService()
+        self.vector_embedding_service = (
+            vector_embedding_service or VectorEmbeddingService(api_key)
+        )
+        self.paper_service = paper_service or PaperService()
         self.logger = ConstellationLogger()
 
     async def create_block(
@@ -157,6 +175,228 @@ class BlockController:
             )
             return None
 
+    async def create_blocks_bulk(
+        self, blocks_data: List[Dict[str, Any]], user_id: UUID
+    ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Creates many blocks at once, reporting per-item failures instead of aborting.
+
+        Embeddings are generated in batches before the transaction. Inside one
+        transaction the blocks, papers, taxonomy links and audit logs are each written
+        with a single `create_many`, then all vectors with a single upsert, which is
+        undone if the transaction rolls back. Items that fail validation, embedding or
+        taxonomy resolution are reported and left out; a failure of one of the batched
+        writes rolls the transaction back and fails every remaining item.
+
+        Args:
+            blocks_data (List[Dict[str, Any]]): One dict per block, as for
+                `create_block`.
+            user_id (UUID): ID of the user performing the operation.
+
+        Returns:
+            Optional[Dict[str, List[Dict[str, Any]]]]: "created" lists index, block_id
+                and name of each new block; "failed" lists index, name and error of each
+                rejected item. None on unexpected exception.
+        """
+        try:
+            failed: Dict[int, str] = {}
+            items: Dict[int, Dict[str, Any]] = {}
+            seen_names = set()
+
+            # Step 0: Split each item into block, paper, taxonomy and embedding text
+            for index, data in enumerate(blocks_data):
+                data = dict(data)
+                name = data.get("name")
+                if not name or not data.get("block_type"):
+                    failed[index] = "Missing name or block_type."
+                    continue
+                if name in seen_names:
+                    failed[index] = f"Duplicate block name '{name}' in request."
+                    continue
+                seen_names.add(name)
+
+                content = data.pop("content", None)
+                if data["block_type"] == "paper":
+                    content = data.get("abstract")
+                items[index] = {
+                    "content": content,
+                    "taxonomy": data.pop("taxonomy", None),
+                    "paper": {
+                        "pdf_url": data.pop("pdf_url", None) or "",
+                        "title": data.pop("title", None) or "",
+                        "abstract": data.pop("abstract", None) or "",
+                    },
+                    "block": data,
+                }
+
+            # Step 1: Batched embeddings, outside the transaction
+            to_embed = [index for index, item in items.items() if item["content"]]
+            embeddings = await self.vector_embedding_service.generate_text_embeddings(
+                [items[index]["content"] for index in to_embed]
+            )
+            for index, embedding in zip(to_embed, embeddings):
+                if embedding is None:
+                    failed[index] = "Failed to generate embedding."
+                    items.pop(index)
+                else:
+                    items[index]["vector"] = embedding
+
+            created: List[Dict[str, Any]] = []
+            try:
+                async with self.prisma.tx(timeout=60000) as tx:
+                    created = await self._write_blocks_bulk(tx, items, failed, user_id)
+            except Exception as e:
+                # The transaction rolled back; every item still pending failed with it.
+                # Its vectors may already be written if the commit itself failed.
+                await self.block_service.delete_block_vectors(
+                    [
+                        item["block_id"]
+                        for item in items.values()
+                        if "block_id" in item and "vector" in item
+                    ],
+                )
+                for index in items:
+                    failed.setdefault(index, str(e))
+                created = []
+                self.logger.log(
+                    "BlockController",
+                    "error",
+                    "Bulk block creation rolled back",
+                    error=str(e),
+                    extra=traceback.format_exc(),
+                )
+
+            self.logger.log(
+                "BlockController",
+                "info",
+                "Bulk block creation finished.",
+                requested=len(blocks_data),
+                created=len(created),
+                failed=len(failed),
+            )
+            return {
+                "created": created,
+                "failed": [
+                    {
+                        "index": index,
+                        "name": blocks_data[index].get("name"),
+                        "error": error,
+                    }
+                    for index, error in sorted(failed.items())
+                ],
+            }
+
+        except Exception as e:
+            self.logger.log(
+                "BlockController",
+                "error",
+                "Failed to bulk create blocks",
+                error=str(e),
+                extra=traceback.format_exc(),
+            )
+            return None
+
+    async def _write_blocks_bulk(
+        self,
+        tx: Prisma,
+        items: Dict[int, Dict[str, Any]],
+        failed: Dict[int, str],
+        user_id: UUID,
+    ) -> List[Dict[str, Any]]:
+        """
+        Writes the prepared items of `create_blocks_bulk` inside `tx`.
+
+        Items that cannot be created are moved from `items` to `failed`. Raises if one
+        of the batched writes fails, so the caller's transaction rolls back.
+        """
+        # Skip names that already exist, with one query
+        existing = await tx.block.find_many(
+            where={"name": {"in": [item["block"]["name"] for item in items.values()]}}
+        )
+        existing_names = {block.name for block in existing}
+        for index in list(items):
+            if items[index]["block"]["name"] in existing_names:
+                failed[index] = "Block name already exists."
+                items.pop(index)
+
+        # Resolve taxonomy categories, each distinct one once
+        resolved_categories = {}
+        for index in list(items):
+            taxonomy = items[index]["taxonomy"]
+            if not taxonomy:
+                continue
+            category_ids = await self.taxonomy_service.resolve_taxonomy_categories(
+                tx, taxonomy, resolved_categories
+            )
+            if category_ids is None:
+                failed[index] = "Failed to resolve taxonomy."
+                items.pop(index)
+            else:
+                items[index]["category_ids"] = category_ids
+
+        indices = list(items)
+        if not indices:
+            return []
+
+        # One create_many per table, then one vector upsert
+        block_ids = await self.block_service.create_blocks(
+            tx, [items[index]["block"] for index in indices]
+        )
+        if block_ids is None:
+            raise ValueError("Failed to create blocks.")
+        for index, block_id in zip(indices, block_ids):
+            items[index]["block_id"] = block_id
+
+        block_categories = {
+            items[index]["block_id"]: items[index]["category_ids"]
+            for index in indices
+            if "category_ids" in items[index]
+        }
+        if not await self.taxonomy_service.associate_blocks_with_categories(
+            tx, block_categories
+        ):
+            raise ValueError("Failed to associate blocks with taxonomy.")
+
+        papers = [
+            {**items[index]["paper"], "block_id": items[index]["block_id"]}
+            for index in indices
+            if items[index]["block"]["block_type"] == "paper"
+        ]
+        if await self.paper_service.create_papers(tx, papers) is None:
+            raise ValueError("Failed to create papers.")
+
+        audit_logs = [
+            {
+                "user_id": str(user_id),
+                "action_type": "CREATE",
+                "entity_type": "block",
+                "entity_id": items[index]["block_id"],
+                "details": {"block_name": items[index]["block"]["name"]},
+            }
+            for index in indices
+        ]
+        if await self.audit_service.create_audit_logs(tx, audit_logs) is None:
+            raise Exception("Failed to create audit logs for blocks.")
+
+        # The vector store commits on its own connection, so write the vectors only
+        # once every Prisma write has succeeded
+        vectors = {
+            items[index]["block_id"]: items[index]["vector"]
+            for index in indices
+            if "vector" in items[index]
+        }
+        if not await self.block_service.set_block_vectors(tx, vectors):
+            raise ValueError("Failed to write block vectors.")
+
+        return [
+            {
+                "index": index,
+                "block_id": items[index]["block_id"],
+                "name": items[index]["block"]["name"],
+            }
+            for index in indices
+        ]
+
     async def get_block_by_id(
         self, block_id: UUID, user_id: UUID
     ) -> Optional[Dict[str, Any]]:
@@ -171,7 +411,7 @@ class BlockController:
             Optional[Dict[str, Any]]: The retrieved block data if found, None otherwise.
         """
         try:
-            async with self.prisma.tx() as tx:
+            async with read_session(self.prisma) as tx:
                 block = await self.block_service.get_block_by_id(
                     tx=tx, block_id=block_id
                 )
@@ -340,7 +580,7 @@ class BlockController:
             Optional[List[Dict[str, Any]]]: List of matching blocks, or None if an error occurs.
         """
         try:
-            async with self.prisma.tx() as tx:
+            async with read_session(self.prisma) as tx:
                 blocks = await self.taxonomy_service.search_blocks(tx, search_filters)
                 if blocks is None:
                     raise Exception("Failed to search blocks with the provided filters")
@@ -361,8 +601,7 @@ class BlockController:
                 }
                 # Align the audit_log without relation fields
                 # aligned_audit_log = align_dict_with_model(audit_log, PrismaAuditLog)
-                audit_log = await self.audit_service.create_audit_log(tx, audit_log)
-                if not audit_log:
+                if not await self.audit_service.log_read(tx, audit_log):
                     raise Exception("Failed to create audit log for block search")
 
                 return [block.dict() for block in blocks]
@@ -387,13 +626,13 @@ class BlockController:
             if not query_vector:
                 raise ValueError("Failed to generate vector for the query.")
 
-            async with self.prisma.tx() as tx:
+            async with read_session(self.prisma) as tx:
                 # Step 2: Call block service
-                blocks = await self.block_service.search_blocks_by_vector_similarity(
+                hits = await self.block_service.search_blocks_by_vector_similarity(
                     tx, query_vector, top_k=top_k
                 )
 
-                if blocks is None:
+                if hits is None:
                     raise Exception("Failed to search blocks with the provided vector")
 
                 # Audit Logging for Search by vector
@@ -402,20 +641,19 @@ class BlockController:
                     "action_type": "READ",  # Use 'READ' for searches
                     "entity_type": "block",  # If 'block_search' is not in enum, use 'block'
                     "entity_id": (
-                        blocks[0].block_id if blocks else str(UUID(int=0))
+                        hits[0]["block"].block_id if hits else str(UUID(int=0))
                     ),  # TODO: temporary using first block id
-                    "details": {"results_count": len(blocks)},
+                    "details": {"results_count": len(hits)},
                     # Removed 'users' field
                 }
                 # Align the audit_log without relation fields
                 # aligned_audit_log = align_dict_with_model(audit_log, PrismaAuditLog)
-                audit_log = await self.audit_service.create_audit_log(tx, audit_log)
-                if not audit_log:
+                if not await self.audit_service.log_read(tx, audit_log):
                     raise Exception(
                         "Failed to create audit log for block search by vector"
                     )
 
-                return [block.dict() for block in blocks]
+                return [{**hit["block"].dict(), "score": hit["score"]} for hit in hits]
         except Exception as e:
             self.logger.log(
                 "BlockController",
@@ -428,7 +666,7 @@ class BlockController:
 
     async def get_all_blocks(self, user_id: UUID) -> Optional[List[Dict[str, Any]]]:
         try:
-            async with self.prisma.tx() as tx:
+            async with read_session(self.prisma) as tx:
                 blocks = await self.block_service.get_all_blocks(tx)
                 result = [block.model_dump() for block in blocks]
                 return result
@@ -443,19 +681,72 @@ class BlockController:
             print(f"error: {e}")
             return None
 
+    async def get_blocks_page(
+        self, user_id: UUID, limit: int = 100, cursor: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves one page of blocks in (created_at, block_id) order.
+
+        Args:
+            user_id (UUID): UUID of the user performing the operation.
+            limit (int): Maximum number of blocks in the page.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
+
+        Returns:
+            Optional[Dict[str, Any]]: {"items": [...], "next_cursor": Optional[str]},
+                or None on error.
+        """
+        try:
+            async with read_session(self.prisma) as tx:
+                page = await self.block_service.list_blocks_page(tx, limit, cursor)
+            if page is None:
+                raise Exception("Failed to list blocks page")
+
+            blocks, cursor = page
+            return {
+                "items": [block.model_dump() for block in blocks],
+                "next_cursor": cursor,
+            }
+        except Exception as e:
+            self.logger.log(
+                "BlockController",
+                "error",
+                "Failed to get blocks page",
+                error=str(e),
+                extra=traceback.format_exc(),
+            )
+            return None
+
+    async def stream_blocks(
+        self, user_id: UUID, chunk_size: int = 500
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yields every block, as dicts, in chunks of at most `chunk_size`.
+
+        Each chunk is one keyset page, so memory stays flat however large the catalog
+        grows. Errors raised after the first chunk end the stream early.
+
+        Args:
+            user_id (UUID): UUID of the user performing the operation.
+            chunk_size (int): Blocks read per query.
+        """
+        async with read_session(self.prisma) as tx:
+            async for blocks in self.block_service.iter_blocks(tx, chunk_size):
+                yield [block.model_dump() for block in blocks]
+
     async def construct_pipeline(
         self, query: str, user_id: UUID
     ) -> Optional[Dict[str, Any]]:
         try:
             # retrieve all blocks and organize the pipeline file with LLM
-            async with self.prisma.tx() as tx:
-                blocks = await self.block_service.get_all_blocks(tx)
+            async with read_session(self.prisma) as tx:
+                # Filter by type in the database instead of loading the whole catalog
                 dataset_model_blocks = [
                     block
+                    async for blocks in self.block_service.iter_blocks(
+                        tx, block_types=["dataset", "model", "exports"]
+                    )
                     for block in blocks
-                    if block.block_type == "dataset"
-                    or block.block_type == "model"
-                    or block.block_type == "exports"
                 ]
                 self.logger.log(
                     "BlockController",
@@ -488,7 +779,7 @@ class BlockController:
                     "Creating audit log for construct pipeline",
                     audit_log=audit_log,
                 )
-                _ = await self.audit_service.create_audit_log(tx, audit_log)
+                _ = await self.audit_service.log_read(tx, audit_log)
 
                 return {"pipeline": json.loads(output)}
         except Exception as e:
@@ -681,7 +972,7 @@ async def main():
         if vector_search_results:
             print(f"Found {len(vector_search_results)} block(s):")
             for blk in vector_search_results:
-                print(f"block id: {blk["id"]}, similarity score: {blk["score"]}")
+                print(f"block id: {blk['block_id']}, similarity score: {blk['score']}")
         else:
             print("No blocks found. Should not happen")
 
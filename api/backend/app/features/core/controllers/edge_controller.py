@@ -11,6 +11,7 @@ Design Pattern:
 Key Integrations:
 1. Audit Logging: Each operation logs relevant audit information via AuditService.
 2. Schema Usage: Utilizes existing schemas from schemas.py to ensure consistency.
+3. Read Paths: Reads query the shared client via `read_session`, without an interactive transaction.
 """
 
 import asyncio
@@ -21,16 +22,22 @@ from uuid import UUID
 from prisma import Prisma
 
 from backend.app.logger import ConstellationLogger
+from backend.app.utils.transaction_utils import read_session
 from backend.app.features.core.services.audit_service import AuditService
 from backend.app.features.core.services.edge_service import EdgeService
 
 
 class EdgeController:
-    def __init__(self, prisma_client: Prisma):
+    def __init__(
+        self,
+        prisma_client: Prisma,
+        edge_service: Optional[EdgeService] = None,
+        audit_service: Optional[AuditService] = None,
+    ):
         self.prisma = prisma_client
         self.logger = ConstellationLogger()
-        self.edge_service = EdgeService()
-        self.audit_service = AuditService()
+        self.edge_service = edge_service or EdgeService()
+        self.audit_service = audit_service or AuditService()
 
     async def create_edge(
         self, edge_data: Dict[str, Any], user_id: UUID
@@ -93,7 +100,7 @@ class EdgeController:
             Optional[Dict[str, Any]]: The edge if found, None otherwise.
         """
         try:
-            async with self.prisma.tx() as tx:
+            async with read_session(self.prisma) as tx:
                 edge = await self.edge_service.get_edge_by_id(tx, edge_id)
                 if edge:
                     # Audit Logging
@@ -104,10 +111,7 @@ class EdgeController:
                         "entity_id": str(edge.edge_id),
                         "details": {"read_action": True},
                     }
-                    audit_log = await self.audit_service.create_audit_log(
-                        tx, audit_data
-                    )
-                    if not audit_log:
+                    if not await self.audit_service.log_read(tx, audit_data):
                         raise Exception("Failed to create audit log")
 
                     self.logger.log(
@@ -139,7 +143,7 @@ class EdgeController:
         user_id: UUID,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         List edges with optional filtering, pagination.
@@ -147,14 +151,42 @@ class EdgeController:
         Args:
             filters (Optional[Dict[str, Any]]): Filters to apply.
             limit (int): Maximum number of edges to retrieve.
-            offset (int): Number of edges to skip.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
 
         Returns:
             List[Dict[str, Any]]: A list of edges.
         """
+        page = await self.get_edges_page(user_id, filters, limit, cursor)
+        return page["items"] if page else []
+
+    async def get_edges_page(
+        self,
+        user_id: UUID,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve one page of edges in (created_at, edge_id) order.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): Filters to apply.
+            limit (int): Maximum number of edges in the page.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
+
+        Returns:
+            Optional[Dict[str, Any]]: {"items": [...], "next_cursor": Optional[str]},
+                or None on error.
+        """
         try:
-            async with self.prisma.tx() as tx:
-                edges = await self.edge_service.list_edges(tx, filters, limit, offset)
+            async with read_session(self.prisma) as tx:
+                page = await self.edge_service.list_edges_page(
+                    tx, filters, limit, cursor
+                )
+                if page is None:
+                    raise Exception("Failed to list edges page")
+
+                edges, next_cursor = page
                 if edges:
                     # Audit Logging
                     audit_data = {
@@ -169,19 +201,15 @@ class EdgeController:
                         "details": {
                             "filters": filters,
                             "limit": limit,
-                            "offset": offset,
+                            "cursor": cursor,
                         },
                     }
-                    audit_log = await self.audit_service.create_audit_log(
-                        tx, audit_data
-                    )
-                    if not audit_log:
+                    if not await self.audit_service.log_read(tx, audit_data):
                         raise Exception("Failed to create audit log")
 
                     self.logger.log(
                         "EdgeController", "info", f"Listed {len(edges)} edges."
                     )
-                    return [edge.dict() for edge in edges]
                 else:
                     self.logger.log(
                         "EdgeController",
@@ -189,9 +217,12 @@ class EdgeController:
                         "No edges found.",
                         filters=filters,
                         limit=limit,
-                        offset=offset,
+                        cursor=cursor,
                     )
-                    return []
+                return {
+                    "items": [edge.dict() for edge in edges],
+                    "next_cursor": next_cursor,
+                }
         except Exception as e:
             self.logger.log(
                 "EdgeController",
@@ -199,7 +230,7 @@ class EdgeController:
                 f"Exception in list_edges: {str(e)}",
                 extra={"traceback": traceback.format_exc()},
             )
-            return []
+            return None
 
     async def update_edge(
         self, edge_id: UUID, update_data: Dict[str, Any], user_id: UUID
@@ -13,6 +13,7 @@ Responsibilities:
 - Handling CRUD operations for pipelines, including the association of blocks and edges.
 - Managing advanced workflows such as creating or deleting pipelines along with their dependencies.
 - Ensuring transactional integrity and robust error handling.
+- Running read-only operations without interactive transactions (see `read_session`).
 - Managing audit logs through AuditService.
 
 Design Philosophy:
@@ -32,12 +33,15 @@ from backend.app.features.core.services.pipeline_service import PipelineService
 from backend.app.features.core.services.block_service import BlockService
 from backend.app.features.core.services.edge_service import EdgeService
 from backend.app.features.core.services.audit_service import AuditService
+from backend.app.features.core.services.pipeline_outbox_service import (
+    PipelineOutboxService,
+)
 from backend.app.features.core.services.user_service import UserService
 from backend.app.logger import ConstellationLogger
+from backend.app.utils.transaction_utils import read_session
 from prisma import Prisma
 import asyncio
 from collections import defaultdict
-import requests
 
 
 class PipelineController:
@@ -46,16 +50,29 @@ class PipelineController:
     BlockService, EdgeService, and AuditService to perform CRUD operations and handle complex workflows.
     """
 
-    def __init__(self, prisma: Prisma):
+    def __init__(
+        self,
+        prisma: Prisma,
+        pipeline_service: Optional[PipelineService] = None,
+        block_service: Optional[BlockService] = None,
+        edge_service: Optional[EdgeService] = None,
+        audit_service: Optional[AuditService] = None,
+        outbox_service: Optional[PipelineOutboxService] = None,
+    ):
         """
         Initializes the PipelineController with instances of PipelineService, BlockService,
-        EdgeService, and AuditService, along with the ConstellationLogger for logging purposes.
+        EdgeService, AuditService and PipelineOutboxService, along with the
+        ConstellationLogger for logging purposes. Shared instances may be injected; any that
+        are omitted are created here.
         """
         self.prisma = prisma
-        self.pipeline_service = PipelineService()
-        self.block_service = BlockService()
-        self.edge_service = EdgeService()
-        self.audit_service = AuditService()
+        self.pipeline_service = pipeline_service or PipelineService()
+        self.block_service = block_service or BlockService()
+        self.edge_service = edge_service or EdgeService()
+        self.audit_service = audit_service or AuditService()
+        self.outbox_service = outbox_service or PipelineOutboxService(
+            pipeline_service=self.pipeline_service
+        )
         # self.user_service = UserService(self.prisma)
         self.logger = ConstellationLogger()
 
@@ -138,7 +155,7 @@ class PipelineController:
             Dict[str, Any]: The pipeline data if found, None otherwise.
         """
         try:
-            async with self.prisma.tx() as tx:
+            async with read_session(self.prisma) as tx:
                 # Retrieve the pipeline using the PipelineService
                 pipeline = await self.pipeline_service.get_pipeline_by_id(
                     tx, pipeline_id
@@ -156,7 +173,7 @@ class PipelineController:
                         "pipeline_name": pipeline.name,
                     },
                 }
-                audit_log = await self.audit_service.create_audit_log(tx, audit_log)
+                audit_log = await self.audit_service.log_read(tx, audit_log)
 
                 # Log the retrieval event
                 self.logger.log(
@@ -314,12 +331,42 @@ class PipelineController:
         Returns:
             List[Dict[str, Any]]: A list of pipelines if successful, empty list otherwise.
         """
+        page = await self.get_pipelines_page(user_id, filters, limit, offset=offset)
+        return page["items"] if page else []
+
+    async def get_pipelines_page(
+        self,
+        user_id: UUID,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves one page of pipelines in (created_at, pipeline_id) order.
+
+        Args:
+            user_id (UUID): The UUID of the user listing the pipelines.
+            filters (Optional[Dict[str, Any]]): Key-value pairs to filter the pipelines.
+                Supported filters: 'name', 'user_id'.
+            limit (int): The maximum number of pipelines in the page.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
+            offset (int): The number of pipelines to skip; ignored when `cursor` is given.
+
+        Returns:
+            Optional[Dict[str, Any]]: {"items": [...], "next_cursor": Optional[str]},
+                or None on error.
+        """
         try:
-            async with self.prisma.tx() as tx:
+            async with read_session(self.prisma) as tx:
                 # List pipelines using the PipelineService
-                pipelines = await self.pipeline_service.list_pipelines(
-                    tx, filters, limit, offset
+                page = await self.pipeline_service.list_pipelines_page(
+                    tx, filters, limit, cursor, offset
                 )
+                if page is None:
+                    raise Exception("Failed to list pipelines page")
+
+                pipelines, cursor = page
                 if pipelines:
                     # Log the listing in Audit Logs
                     audit_log = {
@@ -333,7 +380,7 @@ class PipelineController:
                             "filters": filters,
                         },
                     }
-                    audit_log = await self.audit_service.create_audit_log(tx, audit_log)
+                    audit_log = await self.audit_service.log_read(tx, audit_log)
 
                     # Log the listing event
                     self.logger.log(
@@ -342,16 +389,6 @@ class PipelineController:
                         f"Listed {len(pipelines)} pipelines successfully.",
                         extra={"filters": filters},
                     )
-                    pipelines = [
-                        {
-                            **pipeline.model_dump(),
-                            "config": json.dumps(
-                                pipeline.config
-                            ),  # Serialize config to JSON string
-                        }
-                        for pipeline in pipelines
-                    ]
-                    return pipelines
                 else:
                     self.logger.log(
                         "PipelineController",
@@ -359,9 +396,20 @@ class PipelineController:
                         "No pipelines found.",
                         filters=filters,
                         limit=limit,
-                        offset=offset,
                     )
-                    return []
+
+                return {
+                    "items": [
+                        {
+                            **pipeline.model_dump(),
+                            "config": json.dumps(
+                                pipeline.config
+                            ),  # Serialize config to JSON string
+                        }
+                        for pipeline in pipelines
+                    ],
+                    "next_cursor": cursor,
+                }
 
         except Exception as e:
             # Log unexpected exceptions with critical level
@@ -371,7 +419,7 @@ class PipelineController:
                 f"Exception during pipeline listing: {str(e)}",
                 extra={"traceback": traceback.format_exc(), "filters": filters},
             )
-            return []
+            return None
 
     # -------------------
     # Advanced Pipeline Operations
@@ -699,7 +747,7 @@ class PipelineController:
                     },
                 }
 
-                audit_log = await self.audit_service.create_audit_log(tx, audit_log)
+                audit_log = await self.audit_service.log_read(tx, audit_log)
 
                 self.logger.log(
                     "PipelineController",
@@ -774,53 +822,56 @@ class PipelineController:
             )
             return False
 
-    async def run_pipeline(self, config: str, user_id: UUID) -> bool:
+    async def run_pipeline(
+        self, config: List[Dict[str, Any]], user_id: UUID
+    ) -> Optional[Dict[str, Any]]:
         """
-        Runs a pipeline with the given config.
+        Stores a pipeline for the given config and queues its launch on Dagster.
+
+        The pipeline and its outbox entry are written in one transaction, and the outbox
+        dispatcher launches the run in the background, so a slow Dagster webserver never
+        holds up the request and a queued run survives a restart. The pipeline starts out
+        "pending"; once Dagster accepts the run it gets the run ID and becomes "running",
+        and if the launch keeps failing it becomes "failed" with the reason in its message.
+
+        Args:
+            config (List[Dict[str, Any]]): The instructions for the dagster API.
+            user_id (UUID): The UUID of the user running the pipeline.
+
+        Returns:
+            Optional[Dict[str, Any]]: The pending run handle ({"pipeline_id", "status"}),
+                or None if the pipeline could not be stored and queued.
         """
         # Based on the config, store the pipeline in the database
         pipeline_data = {
             "user_id": str(user_id),
             "config": json.dumps(config),
+            "status": "pending",
         }
-        pipeline = await self.pipeline_service.create_pipeline(
-            self.prisma, pipeline_data
-        )
-
         try:
-            print(f"config: {config}")
-            response = requests.post(
-                "http://dagster_api:8001/execute", json={"instructions": config}
-            )
-
-            response = response.json()
-            print(f"response: {response}")
-
-            if response["status"] == "success":
-                run_id = response["run_id"]
-                async with self.prisma.tx() as tx:
-                    # assign the run_id to the pipeline
-                    await self.pipeline_service.update_pipeline(
-                        tx, pipeline.pipeline_id, {"run_id": run_id}
-                    )
-                    # change the pipeline status to running
-                    await self.pipeline_service.update_pipeline_status(
-                        tx, pipeline.pipeline_id, "running"
-                    )
-
-                return True
-
-            elif response["status"] == "failure":
-                # delete the pipeline
-                delete_result = await self.delete_pipeline(pipeline.pipeline_id)
-                if not delete_result:
-                    raise Exception("Failed to delete pipeline.")
+            async with self.prisma.tx() as tx:
+                pipeline = await self.pipeline_service.create_pipeline(
+                    tx, pipeline_data
+                )
+                if not pipeline:
+                    raise ValueError("Failed to create pipeline.")
 
-                return False
+                entry = await self.outbox_service.enqueue(
+                    tx, pipeline.pipeline_id, config
+                )
+                if not entry:
+                    raise ValueError("Failed to queue pipeline run.")
+        except Exception as e:
+            self.logger.log(
+                "PipelineController",
+                "error",
+                f"Exception during pipeline run: {str(e)}",
+                extra={"traceback": traceback.format_exc()},
+            )
+            return None
 
-        except HTTPException as e:
-            print(f"HTTPException: {e}")
-            raise e
+        self.outbox_service.notify()
+        return {"pipeline_id": pipeline.pipeline_id, "status": "pending"}
 
     async def main(self):
         from backend.app.features.core.services.block_service import BlockService
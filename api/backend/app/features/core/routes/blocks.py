@@ -1,7 +1,8 @@
 # routes/blocks.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Dict, Any, Optional
 from uuid import UUID
 
 from prisma.partials import (
@@ -14,6 +15,14 @@ from prisma.partials import (
 
 from backend.app.features.core.controllers.block_controller import BlockController
 from backend.app.dependencies import get_block_controller
+from backend.app.schemas import (
+    BlockBulkCreateItemSchema,
+    BlockBulkCreateResponseSchema,
+    BlockPageSchema,
+    BlockSearchResultSchema,
+    BlockSummarySchema,
+)
+from backend.app.utils.pagination import decode_cursor
 
 router = APIRouter()
 
@@ -43,6 +52,24 @@ async def create_block(
     return created_block
 
 
+@router.post(
+    "/bulk",
+    response_model=BlockBulkCreateResponseSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_blocks_bulk(
+    blocks: List[BlockBulkCreateItemSchema],
+    user_id: UUID,
+    controller: BlockController = Depends(get_block_controller),
+):
+    blocks_data = [block.dict(exclude_unset=True) for block in blocks]
+
+    result = await controller.create_blocks_bulk(blocks_data, user_id)
+    if result is None:
+        raise HTTPException(status_code=500, detail="Bulk block creation failed.")
+    return result
+
+
 @router.get("/{block_id}", response_model=BlockBasicInfoWithID)
 async def get_block(
     block_id: UUID,
@@ -99,7 +126,7 @@ async def search_blocks_by_filters(
     return results
 
 
-@router.post("/search-by-vector/", response_model=List[BlockBasicInfo])
+@router.post("/search-by-vector/", response_model=List[BlockSearchResultSchema])
 async def search_blocks_by_vector(
     query: str,
     user_id: UUID,
@@ -112,15 +139,94 @@ async def search_blocks_by_vector(
     return results
 
 
+async def _open_block_stream(
+    controller: BlockController, user_id: UUID, chunk_size: int
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Starts the block stream and reads its first chunk before the response starts, so a
+    failing query still returns a 500 instead of a truncated 200.
+    """
+    chunks = controller.stream_blocks(user_id, chunk_size)
+    try:
+        first = await anext(chunks, [])
+    except Exception:
+        raise HTTPException(status_code=500, detail="Failed to get all blocks.")
+
+    async def resumed():
+        yield first
+        async for chunk in chunks:
+            yield chunk
+
+    return resumed()
+
+
+def _serialize_block(block: Dict[str, Any]) -> str:
+    return BlockSummarySchema.model_validate(block).model_dump_json()
+
+
 @router.get("/get-all-blocks/", response_model=List[BlockBasicInfoWithID])
 async def get_all_blocks(
     user_id: str,
+    chunk_size: int = Query(500, ge=1, le=5000),
     controller: BlockController = Depends(get_block_controller),
 ):
-    blocks = await controller.get_all_blocks(user_id)
-    if blocks is None:
-        raise HTTPException(status_code=500, detail="Failed to get all blocks.")
-    return blocks
+    """
+    Returns every block as one JSON array, streamed chunk by chunk.
+    """
+    chunks = await _open_block_stream(controller, user_id, chunk_size)
+
+    async def body():
+        yield "["
+        first = True
+        async for blocks in chunks:
+            if not blocks:
+                continue
+            yield ("" if first else ",") + ",".join(map(_serialize_block, blocks))
+            first = False
+        yield "]"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+@router.get("/stream/")
+async def stream_blocks(
+    user_id: UUID,
+    chunk_size: int = Query(500, ge=1, le=5000),
+    controller: BlockController = Depends(get_block_controller),
+):
+    """
+    Streams every block as newline-delimited JSON, one block per line.
+    """
+    chunks = await _open_block_stream(controller, user_id, chunk_size)
+
+    async def body():
+        async for blocks in chunks:
+            if blocks:
+                yield "".join(_serialize_block(block) + "\n" for block in blocks)
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+@router.get("/paginated/", response_model=BlockPageSchema)
+async def get_blocks_page(
+    user_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    controller: BlockController = Depends(get_block_controller),
+):
+    """
+    Returns one page of blocks; pass `next_cursor` back as `cursor` for the next page.
+    """
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    page = await controller.get_blocks_page(user_id, limit, cursor)
+    if page is None:
+        raise HTTPException(status_code=500, detail="Failed to get blocks page.")
+    return page
 
 
 @router.get("/construct-pipeline/", response_model=Dict[str, Any])
@@ -26,6 +26,8 @@ from backend.app.features.core.controllers.edge_controller import EdgeController
 from prisma.partials import EdgeBasicInfo, EdgeBasicInfoWithID, EdgeUpdate
 
 from backend.app.dependencies import get_edge_controller
+from backend.app.schemas import EdgePageSchema
+from backend.app.utils.pagination import decode_cursor
 
 router = APIRouter()
 
@@ -127,6 +129,40 @@ async def delete_edge(
     return
 
 
+@router.get("/paginated/", response_model=EdgePageSchema)
+async def get_edges_page(
+    user_id: UUID,
+    source_block_id: Optional[UUID] = None,
+    target_block_id: Optional[UUID] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    controller: EdgeController = Depends(get_edge_controller),
+):
+    """
+    Returns one page of edges; pass `next_cursor` back as `cursor` for the next page.
+
+    Args:
+        source_block_id (Optional[UUID]): Only edges leaving this block.
+        target_block_id (Optional[UUID]): Only edges entering this block.
+    """
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    filters = {}
+    if source_block_id:
+        filters["source_block_id"] = source_block_id
+    if target_block_id:
+        filters["target_block_id"] = target_block_id
+
+    page = await controller.get_edges_page(user_id, filters, limit, cursor)
+    if page is None:
+        raise HTTPException(status_code=500, detail="Failed to get edges page.")
+    return page
+
+
 # @router.get("/", response_model=List[EdgeBasicInfoWithID])
 # async def list_edges(
 #     user_id: UUID,
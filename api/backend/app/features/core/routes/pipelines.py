@@ -19,7 +19,7 @@ Design Philosophy:
 - Ensure clear separation between HTTP handling and business logic.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from backend.app.features.core.controllers.pipeline_controller import PipelineController
@@ -32,6 +32,8 @@ from prisma.partials import (
 )
 
 from backend.app.dependencies import get_pipeline_controller
+from backend.app.schemas import PipelinePageSchema
+from backend.app.utils.pagination import decode_cursor
 
 router = APIRouter()
 
@@ -142,12 +144,14 @@ async def list_pipelines(
     controller: PipelineController = Depends(get_pipeline_controller),
 ):
     """
-    List pipelines by filters.
+    List pipelines by filters. Pages by offset; deep pages are cheaper through
+    `/pipelines/paginated/`, which pages by cursor.
 
     Args:
         filters (Optional[Dict[str, Any]]): Key-value pairs to filter the pipelines.
             Supported filters: 'name', 'user_id'.
         user_id (Optional[UUID]): Filter pipelines by the user's UUID.
+        offset (int): The number of pipelines to skip.
 
     Returns:
         List[PipelineBasicInfoWithID]: A list of pipelines matching the filters.
@@ -158,6 +162,36 @@ async def list_pipelines(
     return pipelines
 
 
+@router.get("/paginated/", response_model=PipelinePageSchema)
+async def get_pipelines_page(
+    user_id: UUID,
+    filters: Optional[Dict[str, Any]] = None,
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    controller: PipelineController = Depends(get_pipeline_controller),
+):
+    """
+    Returns one page of pipelines; pass `next_cursor` back as `cursor` for the next page.
+
+    Args:
+        filters (Optional[Dict[str, Any]]): Key-value pairs to filter the pipelines, as
+            for `/pipelines/`. Pass the same filters with every cursor.
+    """
+    _validate_cursor(cursor)
+    page = await controller.get_pipelines_page(user_id, filters, limit, cursor)
+    if page is None:
+        raise HTTPException(status_code=500, detail="Failed to get pipelines page.")
+    return page
+
+
+def _validate_cursor(cursor: Optional[str]) -> None:
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
 @router.put("/status/{run_id}/{status}", status_code=200)
 async def update_pipeline_status_by_run_id(
     run_id: str,
@@ -180,13 +214,20 @@ async def update_pipeline_status_by_run_id(
     return {"message": "Pipeline status updated successfully."}
 
 
-@router.post("/run", status_code=200)
+@router.post("/run", status_code=202)
 async def run_pipeline(
     request: Request,
     controller: PipelineController = Depends(get_pipeline_controller),
 ):
     """
     Run a pipeline with a given config.
+
+    Returns as soon as the pipeline is stored; it is launched on Dagster in the
+    background. Its status moves from "pending" to "running", or to "failed" with the
+    reason in its message.
+
+    Returns:
+        Dict[str, Any]: A message, the pipeline ID and its status ("pending").
     """
     try:
         request_body = await request.json()
@@ -197,10 +238,10 @@ async def run_pipeline(
                 status_code=400, detail="Config or user_id not provided."
             )
 
-        result = await controller.run_pipeline(config, user_id)
-        if not result:
+        handle = await controller.run_pipeline(config, user_id)
+        if not handle:
             raise HTTPException(status_code=400, detail="Pipeline run failed.")
-        return {"message": "Pipeline run successfully."}
+        return {"message": "Pipeline run submitted.", **handle}
     except HTTPException as e:
         raise e
 
@@ -12,12 +12,16 @@ Key Design Decisions:
 2. Use Timezone-Aware Datetimes: Replaced `utcnow` with `datetime.now(timezone.utc)` to handle timezone-aware objects.
 3. Enum Handling: Utilizes Python Enums to mirror Prisma enums for `action_type` and `entity_type`.
 4. Main Function for Testing: Added a main function to demonstrate and test the AuditService functionalities.
+5. Buffered READ Events: When started with `buffer_reads=True`, `log_read` queues READ events in
+   memory and a background task writes them with `create_many` once `flush_size` events are
+   queued or every `flush_interval` seconds, outside any request transaction. `stop` drains the
+   queue on shutdown. Mutations keep using `create_audit_log` inside their own transaction.
 """
 
 import asyncio
 import traceback
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from prisma import Prisma
@@ -28,12 +32,37 @@ from prisma.enums import (
 from prisma.models import AuditLog as PrismaAuditLog
 from prisma.errors import UniqueViolationError, PrismaError
 
+from backend.app.config import settings
 from backend.app.logger import ConstellationLogger
+from backend.app.utils.pagination import keyset_order, keyset_where, next_cursor
 
 
 class AuditService:
-    def __init__(self):
+    def __init__(
+        self,
+        buffer_reads: bool = False,
+        flush_size: int = settings.AUDIT_FLUSH_SIZE,
+        flush_interval: float = settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+        max_buffered: int = settings.AUDIT_MAX_BUFFERED,
+    ):
+        """
+        Args:
+            buffer_reads (bool): Queue READ events and write them in batches once started.
+            flush_size (int): Queued READ events that trigger a flush.
+            flush_interval (float): Seconds between periodic flushes.
+            max_buffered (int): Queue length above which `log_read` flushes inline.
+        """
         self.logger = ConstellationLogger()
+        self.buffer_reads = buffer_reads
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+
+        self._prisma: Optional[Prisma] = None
+        self._buffer: List[Dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_requested = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def create_audit_log(
         self, tx: Prisma, audit_data: Dict[str, Any]
@@ -55,59 +84,10 @@ class AuditService:
             Optional[PrismaAuditLog]: The created audit log entry if successful, None otherwise.
         """
         try:
-            # Validate required fields
-            required_fields = {"user_id", "action_type", "entity_type", "entity_id"}
-            for field in required_fields:
-                if field not in audit_data:
-                    self.logger.log(
-                        "AuditService",
-                        "error",
-                        "Missing required field in audit_data.",
-                        extra={"audit_data": audit_data},
-                    )
-                    return None
-
-            # Ensure enums are valid
-            if audit_data["action_type"] not in PrismaActionTypeEnum.__members__:
-                self.logger.log(
-                    "AuditService",
-                    "error",
-                    f"Invalid action_type: {audit_data['action_type']}",
-                )
+            create_data = self._prepare_audit_data(audit_data)
+            if create_data is None:
                 return None
 
-            if audit_data["entity_type"] not in PrismaAuditEntityTypeEnum.__members__:
-                self.logger.log(
-                    "AuditService",
-                    "error",
-                    f"Invalid entity_type: {audit_data['entity_type']}",
-                )
-                return None
-
-            # Validate and sanitize 'details' field
-            details = audit_data.get("details")
-            if details is not None and not isinstance(details, dict):
-                self.logger.log(
-                    "AuditService",
-                    "error",
-                    "`details` must be a dictionary representing JSON data.",
-                    extra={"details": details},
-                )
-                return None
-
-            # Prepare data for creation
-            create_data = {
-                "log_id": str(uuid4()),
-                "user_id": str(audit_data["user_id"]),
-                "action_type": str(PrismaActionTypeEnum[audit_data["action_type"]]),
-                "entity_type": str(
-                    PrismaAuditEntityTypeEnum[audit_data["entity_type"]]
-                ),
-                "entity_id": str(audit_data["entity_id"]),
-                "timestamp": str(datetime.now(timezone.utc)),
-                "details": json.dumps(details),  # Ensure this is a dict
-            }
-
             self.logger.log(
                 "AuditService",
                 "info",
@@ -139,6 +119,229 @@ class AuditService:
             )
             return None
 
+    def _prepare_audit_data(
+        self, audit_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Validates audit log input and converts it to Prisma create data.
+
+        Returns:
+            Optional[Dict[str, Any]]: The create data, or None if the input is invalid.
+        """
+        # Validate required fields
+        required_fields = {"user_id", "action_type", "entity_type", "entity_id"}
+        for field in required_fields:
+            if field not in audit_data:
+                self.logger.log(
+                    "AuditService",
+                    "error",
+                    "Missing required field in audit_data.",
+                    extra={"audit_data": audit_data},
+                )
+                return None
+
+        # Ensure enums are valid
+        if audit_data["action_type"] not in PrismaActionTypeEnum.__members__:
+            self.logger.log(
+                "AuditService",
+                "error",
+                f"Invalid action_type: {audit_data['action_type']}",
+            )
+            return None
+
+        if audit_data["entity_type"] not in PrismaAuditEntityTypeEnum.__members__:
+            self.logger.log(
+                "AuditService",
+                "error",
+                f"Invalid entity_type: {audit_data['entity_type']}",
+            )
+            return None
+
+        # Validate and sanitize 'details' field
+        details = audit_data.get("details")
+        if details is not None and not isinstance(details, dict):
+            self.logger.log(
+                "AuditService",
+                "error",
+                "`details` must be a dictionary representing JSON data.",
+                extra={"details": details},
+            )
+            return None
+
+        # Prepare data for creation
+        return {
+            "log_id": str(uuid4()),
+            "user_id": str(audit_data["user_id"]),
+            "action_type": str(PrismaActionTypeEnum[audit_data["action_type"]]),
+            "entity_type": str(PrismaAuditEntityTypeEnum[audit_data["entity_type"]]),
+            "entity_id": str(audit_data["entity_id"]),
+            "timestamp": str(datetime.now(timezone.utc)),
+            "details": json.dumps(details),  # Ensure this is a dict
+        }
+
+    async def create_audit_logs(
+        self, tx: Prisma, audit_data_list: List[Dict[str, Any]]
+    ) -> Optional[int]:
+        """
+        Create several audit log entries with a single `create_many` query.
+
+        Args:
+            tx (Prisma): The Prisma client instance.
+            audit_data_list (List[Dict[str, Any]]): Audit log data, as for `create_audit_log`.
+
+        Returns:
+            Optional[int]: The number of entries created, or None if any entry is
+                invalid or the insert failed.
+        """
+        try:
+            create_data = []
+            for audit_data in audit_data_list:
+                prepared = self._prepare_audit_data(audit_data)
+                if prepared is None:
+                    return None
+                create_data.append(prepared)
+
+            if not create_data:
+                return 0
+
+            count = await tx.auditlog.create_many(data=create_data)
+            self.logger.log(
+                "AuditService",
+                "info",
+                "Audit logs created successfully.",
+                count=count,
+            )
+            return count
+
+        except Exception as e:
+            self.logger.log(
+                "AuditService",
+                "error",
+                f"Exception during bulk audit log creation: {str(e)}",
+                extra={"traceback": traceback.format_exc()},
+            )
+            return None
+
+    # -------------------
+    # Buffered READ events
+    # -------------------
+
+    async def start(self, prisma: Prisma) -> None:
+        """
+        Starts the background flush task if READ events are buffered.
+
+        Args:
+            prisma (Prisma): The shared Prisma client used for flushing, outside any
+                request transaction.
+        """
+        if not self.buffer_reads or self._flush_task is not None:
+            return
+        self._prisma = prisma
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self.logger.log(
+            "AuditService",
+            "info",
+            "Buffered audit writer started.",
+            flush_size=self.flush_size,
+            flush_interval=self.flush_interval,
+        )
+
+    async def stop(self) -> None:
+        """
+        Stops the background flush task and writes every queued READ event.
+        """
+        if self._flush_task is None:
+            return
+        self._flush_task.cancel()
+        try:
+            await self._flush_task
+        except asyncio.CancelledError:
+            pass
+        self._flush_task = None
+        await self.flush()
+        self.logger.log("AuditService", "info", "Buffered audit writer stopped.")
+
+    async def log_read(self, tx: Prisma, audit_data: Dict[str, Any]) -> bool:
+        """
+        Records a READ event.
+
+        While the buffered writer runs, the event is validated and queued, and `tx` is
+        not touched. Otherwise it is written immediately with `create_audit_log`.
+
+        Args:
+            tx (Prisma): The Prisma client or transaction for unbuffered writes.
+            audit_data (Dict[str, Any]): Audit log data, as for `create_audit_log`.
+
+        Returns:
+            bool: True if the event was queued or written, False otherwise.
+        """
+        if self._flush_task is None:
+            return await self.create_audit_log(tx, audit_data) is not None
+
+        create_data = self._prepare_audit_data(audit_data)
+        if create_data is None:
+            return False
+
+        self._buffer.append(create_data)
+        if len(self._buffer) >= self.max_buffered:
+            # The writer is falling behind; make this caller wait for it
+            await self.flush()
+        elif len(self._buffer) >= self.flush_size:
+            self._flush_requested.set()
+        return True
+
+    async def flush(self) -> int:
+        """
+        Writes the queued READ events with a single `create_many`.
+
+        On failure the events are put back at the front of the queue, keeping at most
+        `max_buffered` of them. If the write is cancelled, the whole batch is put back
+        and the cancellation is re-raised.
+
+        Returns:
+            int: The number of events written.
+        """
+        async with self._flush_lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+            try:
+                count = await self._prisma.auditlog.create_many(data=batch)
+                self.logger.log(
+                    "AuditService",
+                    "info",
+                    "Flushed buffered audit logs.",
+                    count=count,
+                )
+                return count
+            except asyncio.CancelledError:
+                # Cancelled mid-write, e.g. by `stop`: requeue the batch so the final
+                # flush writes it
+                self._buffer = batch + self._buffer
+                raise
+            except Exception as e:
+                pending = batch + self._buffer
+                self._buffer = pending[-self.max_buffered :]
+                self.logger.log(
+                    "AuditService",
+                    "error",
+                    f"Failed to flush buffered audit logs: {str(e)}",
+                    queued=len(self._buffer),
+                    dropped=len(pending) - len(self._buffer),
+                )
+                return 0
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
     async def get_audit_log_by_id(
         self, tx: Prisma, log_id: UUID
     ) -> Optional[PrismaAuditLog]:
@@ -185,10 +388,10 @@ class AuditService:
         tx: Prisma,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[PrismaAuditLog]:
         """
-        List audit log entries, optionally filtered.
+        List audit log entries, newest first, optionally filtered.
 
         Args:
             tx (Prisma): The Prisma client instance.
@@ -199,11 +402,34 @@ class AuditService:
                     - 'entity_type': AuditEntityTypeEnum
                     - 'entity_id': UUID (string)
             limit (int): The maximum number of audit logs to retrieve.
-            offset (int): The number of audit logs to skip before starting to collect the result set.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
 
         Returns:
             List[PrismaAuditLog]: A list of audit log entries matching the filters.
         """
+        page = await self.list_audit_logs_page(tx, filters, limit, cursor)
+        return page[0] if page else []
+
+    async def list_audit_logs_page(
+        self,
+        tx: Prisma,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Optional[Tuple[List[PrismaAuditLog], Optional[str]]]:
+        """
+        Retrieve one page of audit log entries in (timestamp, log_id) descending order.
+
+        Args:
+            tx (Prisma): The Prisma client instance.
+            filters (Optional[Dict[str, Any]]): Optional filters, as for `list_audit_logs`.
+            limit (int): The maximum number of audit logs in the page.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
+
+        Returns:
+            Optional[Tuple[List[PrismaAuditLog], Optional[str]]]: The audit logs and the
+                cursor of the next page (None on the last page), or None on error.
+        """
         try:
             prisma_filters = {}
 
@@ -217,7 +443,7 @@ class AuditService:
                             "error",
                             f"Invalid action_type filter: {filters['action_type']}",
                         )
-                        return []
+                        return [], None
                     prisma_filters["action_type"] = PrismaActionTypeEnum[
                         filters["action_type"]
                     ]
@@ -231,19 +457,25 @@ class AuditService:
                             "error",
                             f"Invalid entity_type filter: {filters['entity_type']}",
                         )
-                        return []
+                        return [], None
                     prisma_filters["entity_type"] = PrismaAuditEntityTypeEnum[
                         filters["entity_type"]
                     ]
                 if "entity_id" in filters:
                     prisma_filters["entity_id"] = filters["entity_id"]
 
-            audit_logs = await tx.auditlog.find_many(
-                where=prisma_filters,
-                take=limit,
-                skip=offset,
-                order={"timestamp": "desc"},
+            # Newest first; one extra row tells whether another page follows
+            rows = await tx.auditlog.find_many(
+                where={
+                    "AND": [
+                        prisma_filters,
+                        keyset_where(cursor, "timestamp", "log_id", descending=True),
+                    ]
+                },
+                order=keyset_order("timestamp", "log_id", descending=True),
+                take=limit + 1,
             )
+            audit_logs = rows[:limit]
 
             self.logger.log(
                 "AuditService",
@@ -251,15 +483,15 @@ class AuditService:
                 f"Retrieved {len(audit_logs)} audit logs.",
                 filters=filters,
                 limit=limit,
-                offset=offset,
+                cursor=cursor,
             )
 
-            return audit_logs
+            return audit_logs, next_cursor(rows, limit, "timestamp", "log_id")
         except Exception as e:
             self.logger.log(
                 "AuditService", "error", "Failed to list audit logs.", error=str(e)
             )
-            return []
+            return None
 
     async def update_audit_log(
         self, tx: Prisma, log_id: UUID, update_data: Dict[str, Any]
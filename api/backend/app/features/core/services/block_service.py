@@ -16,15 +16,20 @@ Key Design Decisions:
 2. Prisma Models: We use Prisma-generated models (Block) for type hinting and as return types.
    This ensures type safety and consistency with the database schema.
 
-3. Raw SQL for Unsupported Types: The `vector` field is managed using raw SQL queries since Prisma does not support it.
+3. Raw SQL for Unsupported Types: The `vector` field is managed through VectorStoreService, an async pgvector
+   store with its own connection pool, since Prisma does not support it.
 
 4. Error Handling: Exceptions are allowed to propagate, to be handled by the caller.
 
+5. Keyset Pagination: Listing walks the table in (created_at, block_id) order with opaque
+   cursors, backed by an index on those columns, so pages cost the same at any depth and
+   callers can stream the catalog in chunks.
+
 This approach balances flexibility, type safety, and simplicity, leveraging Prisma's capabilities
 while providing a clean API for block operations.
 """
 import re
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 import asyncio
@@ -35,16 +40,12 @@ from prisma.models import BlockVector as PrismaBlockVector
 from prisma import Prisma
 from backend.app.logger import ConstellationLogger
 from backend.app.config import settings
+from backend.app.utils.pagination import keyset_order, keyset_where, next_cursor
 import traceback
 
-# haystack pgvector
-from haystack_integrations.document_stores.pgvector import PgvectorDocumentStore
-from haystack_integrations.components.retrievers.pgvector import (
-    PgvectorEmbeddingRetriever,
+from backend.app.features.core.services.vector_store_service import (
+    VectorStoreService,
 )
-from haystack.document_stores.types import DuplicatePolicy
-from haystack import Document
-from haystack.utils import Secret
 
 # for test
 from backend.app.features.core.services.vector_embedding_service import (
@@ -54,17 +55,14 @@ from backend.app.features.agent.crews.crew_process import CrewProcess
 
 
 class BlockService:
-    def __init__(self):
+    def __init__(
+        self,
+        vector_store: Optional[VectorStoreService] = None,
+        crew: Optional[CrewProcess] = None,
+    ):
         self.logger = ConstellationLogger()
-        self.document_store = PgvectorDocumentStore(
-            connection_string=Secret.from_env_var("DATABASE_URL"),
-            table_name="BlockVector",
-            embedding_dimension=1536,
-            vector_function="cosine_similarity",
-            search_strategy="hnsw",
-        )
-        self.retriever = PgvectorEmbeddingRetriever(document_store=self.document_store)
-        self.crew = CrewProcess()
+        self.vector_store = vector_store or VectorStoreService()
+        self.crew = crew or CrewProcess()
 
     async def create_block(
         self,
@@ -110,24 +108,10 @@ class BlockService:
             return None
 
         if vector:
-            try:
-                documents = [Document(id=created_block.block_id, embedding=vector)]
-                self.document_store.write_documents(
-                    documents, policy=DuplicatePolicy.OVERWRITE
-                )
-                self.logger.log(
-                    "BlockService",
-                    "info",
-                    f"Vector created for block {created_block.block_id}",
-                )
-            except Exception as e:
-                self.logger.log(
-                    "BlockService",
-                    "error",
-                    f"Failed to set vector",
-                    error=str(e),
-                    traceback=traceback.format_exc(),
-                )
+            vector_success = await self.set_block_vector(
+                tx, block_id=created_block.block_id, vector=vector
+            )
+            if not vector_success:
                 return None
 
             # # Associate vector using raw SQL
@@ -149,6 +133,52 @@ class BlockService:
 
         return created_block
 
+    async def create_blocks(
+        self, tx: Prisma, blocks_data: List[Dict[str, Any]]
+    ) -> Optional[List[str]]:
+        """
+        Creates several blocks with a single `create_many` query.
+
+        IDs and timestamps are assigned here, so the returned IDs line up with
+        `blocks_data` and can be used for papers, taxonomy links and vectors
+        without reading the blocks back.
+
+        Args:
+            tx (Prisma): Prisma transaction client
+            blocks_data (List[Dict[str, Any]]): Block data, as for `create_block`.
+
+        Returns:
+            Optional[List[str]]: The new block IDs in input order, or None if failed.
+        """
+        now = datetime.utcnow()
+        rows = []
+        for block_data in blocks_data:
+            row = {key: value for key, value in block_data.items() if key != "vector"}
+            row["block_id"] = str(uuid4())
+            row["created_at"] = now
+            row["updated_at"] = now
+            rows.append(row)
+
+        try:
+            if rows:
+                await tx.block.create_many(data=rows)
+            self.logger.log(
+                "BlockService",
+                "info",
+                "Blocks created successfully.",
+                count=len(rows),
+            )
+            return [row["block_id"] for row in rows]
+        except Exception as e:
+            self.logger.log(
+                "BlockService",
+                "error",
+                "Failed to create blocks",
+                error=str(e),
+                traceback=traceback.format_exc(),
+            )
+            return None
+
     async def get_block_by_id(
         self, tx: Prisma, block_id: UUID
     ) -> Optional[PrismaBlock]:
@@ -341,24 +371,16 @@ class BlockService:
         Returns:
             bool: True if operation was successful, False otherwise.
         """
-        try:
-            documents = [Document(id=block_id, embedding=vector)]
-            self.document_store.write_documents(
-                documents, policy=DuplicatePolicy.OVERWRITE
-            )
+        success = await self.vector_store.upsert_vector(block_id, vector)
+        if success:
             self.logger.log(
                 "BlockService", "info", f"Vector created for block {block_id}"
             )
-            return True
-        except Exception as e:
+        else:
             self.logger.log(
-                "BlockService",
-                "error",
-                f"Failed to set vector",
-                error=str(e),
-                traceback=traceback.format_exc(),
+                "BlockService", "error", f"Failed to set vector", block_id=block_id
             )
-            return False
+        return success
         # try:
         #     # Convert the vector list to a PostgreSQL array string
         #     vector_str = ','.join(map(str, vector))
@@ -378,6 +400,54 @@ class BlockService:
         #     self.logger.log("BlockService", "error", "Failed to set block vector", error=str(e), extra=traceback.format_exc())
         #     return False
 
+    async def set_block_vectors(
+        self, tx: Prisma, vectors: Dict[str, List[float]]
+    ) -> bool:
+        """
+        Associates or updates the vectors of several blocks in one write.
+
+        Args:
+            tx (Prisma): Prisma transaction client
+            vectors (Dict[str, List[float]]): Vectors keyed by block ID.
+
+        Returns:
+            bool: True if all vectors were written, False otherwise.
+        """
+        success = await self.vector_store.upsert_vectors(vectors)
+        if success:
+            self.logger.log(
+                "BlockService", "info", f"Vectors created for {len(vectors)} blocks"
+            )
+        else:
+            self.logger.log(
+                "BlockService",
+                "error",
+                "Failed to set vectors",
+                block_ids=list(vectors),
+            )
+        return success
+
+    async def delete_block_vectors(self, block_ids: List[str]) -> bool:
+        """
+        Deletes the vectors of several blocks in one write. The vector store commits on
+        its own connection, so this needs no Prisma transaction.
+
+        Args:
+            block_ids (List[str]): IDs of the blocks whose vectors are deleted.
+
+        Returns:
+            bool: True if the vectors were deleted, False otherwise.
+        """
+        success = await self.vector_store.delete_vectors(block_ids)
+        if not success:
+            self.logger.log(
+                "BlockService",
+                "error",
+                "Failed to delete vectors",
+                block_ids=block_ids,
+            )
+        return success
+
     async def get_block_vector(
         self, tx: Prisma, block_id: str
     ) -> Optional[List[float]]:
@@ -391,23 +461,23 @@ class BlockService:
         Returns:
             Optional[List[float]]: The vector representation, or None if not found.
         """
-        try:
-            filters = {"field": "id", "operator": "==", "value": block_id}
-            documents = self.document_store.filter_documents(filters=filters)
-            self.logger.log(
-                "BlockService",
-                "info",
-                f"Retrieved block vector - {documents[0].embedding[:5]}... truncated",
-            )
-            return documents[0].embedding
-        except Exception as e:
+        vector = await self.vector_store.get_vector(block_id)
+        if vector is None:
             self.logger.log(
                 "BlockService",
                 "error",
-                f"Failed to retrieve block vector - error={str(e)}",
+                f"Failed to retrieve block vector",
+                block_id=block_id,
             )
             return None
 
+        self.logger.log(
+            "BlockService",
+            "info",
+            f"Retrieved block vector - {vector[:5]}... truncated",
+        )
+        return vector
+
         # try:
         #     query = f"""
         #         SELECT vector::text AS vector_text
@@ -428,9 +498,49 @@ class BlockService:
         #     self.logger.log("BlockService", "error", f"Failed to retrieve block vector - error={str(e)}")
         #     return None
 
+    async def hydrate_blocks(
+        self, tx: Prisma, block_ids: List[str]
+    ) -> List[PrismaBlock]:
+        """
+        Loads blocks and their papers for the given IDs in a single query.
+
+        Args:
+            tx (Prisma): Prisma transaction client
+            block_ids (List[str]): Block IDs in the order they should be returned.
+
+        Returns:
+            List[PrismaBlock]: The blocks in the order of `block_ids`. IDs without a
+            matching block (e.g. a vector left behind by a deleted block) are skipped.
+        """
+        if not block_ids:
+            return []
+
+        blocks = await tx.block.find_many(
+            where={"block_id": {"in": [str(block_id) for block_id in block_ids]}},
+            include={"paper": True},
+        )
+        blocks_by_id = {block.block_id: block for block in blocks}
+
+        missing = [
+            str(block_id) for block_id in block_ids if str(block_id) not in blocks_by_id
+        ]
+        if missing:
+            self.logger.log(
+                "BlockService",
+                "warning",
+                "Some blocks could not be hydrated.",
+                missing_block_ids=missing,
+            )
+
+        return [
+            blocks_by_id[str(block_id)]
+            for block_id in block_ids
+            if str(block_id) in blocks_by_id
+        ]
+
     async def search_blocks_by_vector_similarity(
         self, tx: Prisma, query_vector: List[float], top_k: int = 5
-    ) -> List[PrismaBlock]:
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Performs a vector similarity search on blocks.
 
@@ -440,44 +550,21 @@ class BlockService:
             top_k (int): The number of top similar blocks to return.
 
         Returns:
-            List[PrismaBlock]: List of similar blocks.
+            Optional[List[Dict[str, Any]]]: Hits in ranking order, each a dict with
+            keys 'block' (PrismaBlock, with paper) and 'score' (float). None on failure.
         """
         try:
-            docs = self.retriever.run(
-                query_embedding=query_vector,
-                top_k=top_k,
-                vector_function="cosine_similarity",
-            )
-
-            blocks = []
-
-            for doc in docs["documents"]:
-                block = await self.get_block_by_id(tx, doc.id)
-                blocks.append(block)
-
-            return blocks
-
-            # vector_str = ','.join(map(str, query_vector))
-            # query = f"""
-            #     SELECT b.block_id, b.name, b.block_type, b.description,
-            #            1 - (b.vector <=> ARRAY[{vector_str}]::vector) as similarity
-            #     FROM "Block" b
-            #     WHERE b.vector IS NOT NULL
-            #     ORDER BY similarity DESC
-            #     LIMIT {top_k};
-            # """
-            # results = await tx.query_raw(query)
-
-            # return [
-            #     {
-            #         "block_id": str(row['block_id']),
-            #         "name": row['name'],
-            #         "block_type": row['block_type'],
-            #         "description": row['description'],
-            #         "similarity": float(row['similarity'])
-            #     }
-            #     for row in results
-            # ]
+            ranked = await self.vector_store.search(query_vector, top_k=top_k)
+            if ranked is None:
+                raise Exception("Vector store search failed")
+
+            # One round trip for all hits instead of one get_block_by_id per hit
+            blocks = await self.hydrate_blocks(tx, [block_id for block_id, _ in ranked])
+            scores = dict(ranked)
+
+            return [
+                {"block": block, "score": scores[block.block_id]} for block in blocks
+            ]
         except Exception as e:
             self.logger.log(
                 "BlockService",
@@ -494,6 +581,72 @@ class BlockService:
         """
         return await tx.block.find_many()
 
+    async def list_blocks_page(
+        self,
+        tx: Prisma,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        block_types: Optional[List[str]] = None,
+    ) -> Optional[Tuple[List[PrismaBlock], Optional[str]]]:
+        """
+        Retrieves one page of blocks in (created_at, block_id) order.
+
+        Args:
+            tx (Prisma): Prisma transaction client
+            limit (int): Maximum number of blocks in the page.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
+            block_types (Optional[List[str]]): Only return blocks of these types.
+
+        Returns:
+            Optional[Tuple[List[PrismaBlock], Optional[str]]]: The blocks and the cursor
+                of the next page (None on the last page), or None on error.
+        """
+        try:
+            where = keyset_where(cursor, "created_at", "block_id")
+            if block_types:
+                where = {"AND": [where, {"block_type": {"in": block_types}}]}
+
+            # One extra row tells whether another page follows
+            rows = await tx.block.find_many(
+                where=where,
+                order=keyset_order("created_at", "block_id"),
+                take=limit + 1,
+            )
+            return rows[:limit], next_cursor(rows, limit, "created_at", "block_id")
+        except Exception as e:
+            self.logger.log(
+                "BlockService",
+                "error",
+                "Failed to list blocks page",
+                error=str(e),
+                cursor=cursor,
+            )
+            return None
+
+    async def iter_blocks(
+        self,
+        tx: Prisma,
+        chunk_size: int = 500,
+        block_types: Optional[List[str]] = None,
+    ) -> AsyncIterator[List[PrismaBlock]]:
+        """
+        Yields every block in chunks of at most `chunk_size`, one keyset page at a time,
+        so only one chunk is held in memory.
+
+        Raises:
+            RuntimeError: If a page cannot be read.
+        """
+        cursor = None
+        while True:
+            page = await self.list_blocks_page(tx, chunk_size, cursor, block_types)
+            if page is None:
+                raise RuntimeError("Failed to read blocks page.")
+            blocks, cursor = page
+            if blocks:
+                yield blocks
+            if cursor is None:
+                return
+
     async def get_all_vectors(self, tx: Prisma) -> List[List[float]]:
         """
         Retrieves all vector representations for blocks using raw SQL.
@@ -656,12 +809,8 @@ async def main():
                     tx, query_vector, top_k=5
                 )
                 print(f"Similar blocks: \n")
-                print(
-                    f"1. id: {similar_blocks[0]["id"]}, score: {similar_blocks[0]["score"]}\n"
-                )
-                print(
-                    f"2. id: {similar_blocks[1]["id"]}, score: {similar_blocks[1]["score"]}"
-                )
+                for rank, hit in enumerate(similar_blocks, start=1):
+                    print(f"{rank}. id: {hit['block'].block_id}, score: {hit['score']}")
 
                 # Step 9: Delete block
                 print(f"\nDeleting block with ID: {block_id}")
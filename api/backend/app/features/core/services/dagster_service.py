@@ -0,0 +1,140 @@
+# constellation-backend/api/backend/app/features/core/services/dagster_service.py
+
+"""
+Dagster Service Module
+
+This module implements the client the API uses to launch pipeline runs through the dagster
+API service (`POST /execute`), which in turn launches the run on the Dagster webserver.
+
+Design Pattern:
+- Adapter Pattern: DagsterService turns the dagster API's JSON replies, HTTP errors and
+  timeouts into one result shape, {"status": "success", "run_id": ...} or
+  {"status": "failure", "message": ..., "retryable": ...}.
+- Shared Resource: One pooled httpx.AsyncClient per process (owned by the service registry),
+  opened at startup and closed on shutdown.
+
+Key Design Decisions:
+1. Non-Blocking I/O: A synchronous `requests.post` would hold the event loop, and with it
+   every other request, for as long as Dagster takes to answer. The async client does not.
+2. Connection Reuse: Keep-alive connections are pooled, up to `max_connections`.
+3. Bounded Waits: Every launch gives up after `timeout` seconds, so a stuck Dagster webserver
+   surfaces as a failed launch instead of a hung task.
+4. Idempotent Launches: A launch for a stored pipeline sends its `pipeline_id`, which the
+   dagster API uses as the run ID, so launching the same pipeline again (a retry after a
+   timeout, say) does not start a second run. Unreachable hosts, timeouts and 5xx/429 replies
+   are marked `retryable`; a failure the dagster API reports itself (an invalid config) is not.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from backend.app.config import settings
+from backend.app.logger import ConstellationLogger
+
+
+class DagsterService:
+    def __init__(
+        self,
+        execute_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            execute_url (Optional[str]): The dagster API's /execute URL. Defaults to
+                settings.DAGSTER_EXECUTE_URL.
+            timeout (Optional[float]): Seconds a launch may take. Defaults to
+                settings.DAGSTER_TIMEOUT_SECONDS.
+            max_connections (Optional[int]): Size of the connection pool. Defaults to
+                settings.DAGSTER_MAX_CONNECTIONS.
+            transport (Optional[httpx.AsyncBaseTransport]): Replaces the network transport
+                (used by tests).
+        """
+        self.logger = ConstellationLogger()
+        self.execute_url = execute_url or settings.DAGSTER_EXECUTE_URL
+        self.timeout = timeout or settings.DAGSTER_TIMEOUT_SECONDS
+        self.max_connections = max_connections or settings.DAGSTER_MAX_CONNECTIONS
+        self.transport = transport
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def open(self) -> None:
+        """
+        Creates the shared client. `launch` calls this itself if the startup hook did not.
+        """
+        if self.client is not None:
+            return
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            transport=self.transport,
+        )
+
+    async def close(self) -> None:
+        """
+        Closes the shared client and its connections.
+        """
+        if self.client is None:
+            return
+        await self.client.aclose()
+        self.client = None
+
+    async def launch(
+        self, config: List[Dict[str, Any]], pipeline_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Launches a pipeline run with the given Dagster instructions.
+
+        Args:
+            config (List[Dict[str, Any]]): The instructions for the dagster API.
+            pipeline_id (Optional[str]): The stored pipeline the run belongs to. Launches
+                with the same pipeline ID start at most one run.
+
+        Returns:
+            Dict[str, Any]: {"status": "success", "run_id": ...} if the run was launched,
+                {"status": "failure", "message": ..., "retryable": ...} otherwise.
+        """
+        payload = {"instructions": config}
+        if pipeline_id is not None:
+            payload["pipeline_id"] = str(pipeline_id)
+
+        await self.open()
+        try:
+            response = await self.client.post(self.execute_url, json=payload)
+        except httpx.HTTPError as e:
+            self.logger.log(
+                "DagsterService",
+                "error",
+                "Failed to reach the dagster API.",
+                error=repr(e),
+            )
+            return {
+                "status": "failure",
+                "message": f"Dagster API unreachable: {e!r}",
+                "retryable": True,
+            }
+
+        if response.status_code != 200:
+            self.logger.log(
+                "DagsterService",
+                "error",
+                "Dagster API rejected the launch.",
+                status_code=response.status_code,
+                response=response.text,
+            )
+            message = f"Dagster API returned {response.status_code}: {response.text}"
+            return {
+                "status": "failure",
+                "message": message,
+                "retryable": response.status_code >= 500
+                or response.status_code == 429,
+            }
+
+        result = response.json()
+        if result.get("status") != "success":
+            result.setdefault("retryable", False)
+        return result
@@ -15,12 +15,13 @@ Key Design Decisions:
 3. Main Function for Testing: Added a main function to demonstrate and test the EdgeService functionalities.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID, uuid4
 from prisma import Prisma
 from prisma.models import Edge as PrismaEdge, Block as PrismaBlock
 from prisma.errors import UniqueViolationError
 from backend.app.logger import ConstellationLogger
+from backend.app.utils.pagination import keyset_order, keyset_where, next_cursor
 import asyncio
 from datetime import datetime, timezone
 from collections import defaultdict
@@ -230,7 +231,7 @@ class EdgeService:
         tx: Prisma,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[PrismaEdge]:
         """
         Retrieves a list of edges, optionally filtered.
@@ -243,11 +244,34 @@ class EdgeService:
                     - 'target_block_id': UUID
                     - 'name_contains': string
             limit (int): The maximum number of edges to retrieve.
-            offset (int): The number of edges to skip before starting to collect the result set.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
 
         Returns:
             List[PrismaEdge]: A list of edges matching the filters.
         """
+        page = await self.list_edges_page(tx, filters, limit, cursor)
+        return page[0] if page else []
+
+    async def list_edges_page(
+        self,
+        tx: Prisma,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Optional[Tuple[List[PrismaEdge], Optional[str]]]:
+        """
+        Retrieves one page of edges in (created_at, edge_id) order.
+
+        Args:
+            tx (Prisma): The Prisma client instance.
+            filters (Optional[Dict[str, Any]]): Optional filters, as for `list_edges`.
+            limit (int): The maximum number of edges in the page.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
+
+        Returns:
+            Optional[Tuple[List[PrismaEdge], Optional[str]]]: The edges and the cursor of
+                the next page (None on the last page), or None on error.
+        """
         try:
             prisma_filters = {}
 
@@ -262,15 +286,22 @@ class EdgeService:
                         "mode": "insensitive",
                     }
 
-            edges_list = await tx.edge.find_many(
-                where=prisma_filters,
+            # One extra row tells whether another page follows
+            rows = await tx.edge.find_many(
+                where={
+                    "AND": [
+                        prisma_filters,
+                        keyset_where(cursor, "created_at", "edge_id"),
+                    ]
+                },
                 include={
                     "Block_Edge_source_block_idToBlock": True,
                     "Block_Edge_target_block_idToBlock": True,
                 },
-                take=limit,
-                skip=offset,
+                order=keyset_order("created_at", "edge_id"),
+                take=limit + 1,
             )
+            edges_list = rows[:limit]
 
             self.logger.log(
                 "EdgeService",
@@ -278,15 +309,15 @@ class EdgeService:
                 f"Retrieved {len(edges_list)} edges.",
                 filters=filters,
                 limit=limit,
-                offset=offset,
+                cursor=cursor,
             )
 
-            return edges_list
+            return edges_list, next_cursor(rows, limit, "created_at", "edge_id")
         except Exception as e:
             self.logger.log(
                 "EdgeService", "error", "Failed to list edges.", error=str(e)
             )
-            return []
+            return None
 
     async def associate_blocks_via_edge(
         self, tx: Prisma, source_block_id: UUID, target_block_id: UUID
@@ -0,0 +1,256 @@
+"""
+Embedding Cache Service Module
+
+This module implements a two-tier cache for text embeddings, sitting in front of the
+OpenAI embedders used by VectorEmbeddingService.
+
+Design Pattern:
+- Cache-Aside: VectorEmbeddingService asks the cache first and stores the embedding after a miss.
+- Shared Resource: One cache per process, owned by the service registry.
+
+Key Design Decisions:
+1. Content-Hash Keys: Entries are keyed by sha256(model + text), so the same text embedded by
+   another model never hits, and changing EMBEDDING_MODEL invalidates every entry.
+2. Two Tiers: An in-process LRU (OrderedDict) answers repeated search queries without I/O; a
+   local SQLite table survives restarts. Persistent hits are promoted into the LRU.
+3. Size-Based Eviction: The SQLite tier tracks the byte size of every row and evicts the least
+   recently used rows once EMBEDDING_CACHE_MAX_BYTES is exceeded.
+4. Non-Blocking: SQLite calls run in a worker thread (asyncio.to_thread) behind a lock.
+5. Observability: `stats()` exposes hit/miss counters and the OpenAI calls and latency saved.
+6. Best Effort: A failing persistent tier is logged and treated as a miss, never as an error.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.app.logger import ConstellationLogger
+
+
+class EmbeddingCacheService:
+    def __init__(
+        self,
+        model: str,
+        db_path: Optional[str] = None,
+        max_memory_entries: int = 1024,
+        max_persistent_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Args:
+            model (str): The embedding model name; part of every cache key.
+            db_path (Optional[str]): SQLite file for the persistent tier. None disables it.
+            max_memory_entries (int): Capacity of the in-process LRU tier.
+            max_persistent_bytes (int): Size cap of the persistent tier.
+        """
+        self.logger = ConstellationLogger()
+        self.model = model
+        self.max_memory_entries = max_memory_entries
+        self.max_persistent_bytes = max_persistent_bytes
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = self._open_db(db_path)
+
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._miss_seconds = 0.0
+
+    def make_key(self, text: str) -> str:
+        """
+        Returns the cache key for `text` under the current model.
+        """
+        return hashlib.sha256(f"{self.model}\0{text}".encode("utf-8")).hexdigest()
+
+    async def get(self, text: str) -> Optional[List[float]]:
+        """
+        Looks up the embedding of `text`, checking the LRU tier before the persistent tier.
+
+        Returns:
+            Optional[List[float]]: The cached embedding, or None on a miss.
+        """
+        key = self.make_key(text)
+
+        embedding = self._memory.get(key)
+        if embedding is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return embedding
+
+        if self._db is not None:
+            embedding = await asyncio.to_thread(self._db_get, key)
+            if embedding is not None:
+                self._remember(key, embedding)
+                self.persistent_hits += 1
+                return embedding
+
+        self.misses += 1
+        return None
+
+    async def put(
+        self, text: str, embedding: List[float], miss_seconds: float = 0.0
+    ) -> None:
+        """
+        Stores the embedding of `text` in both tiers.
+
+        Args:
+            text (str): The embedded text.
+            embedding (List[float]): Its embedding.
+            miss_seconds (float): How long generating the embedding took; used to estimate
+                the latency saved by later hits.
+        """
+        key = self.make_key(text)
+        self._miss_seconds += miss_seconds
+        self._remember(key, embedding)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_put, key, embedding)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns hit/miss counters and an estimate of the OpenAI calls and latency saved.
+        """
+        hits = self.memory_hits + self.persistent_hits
+        lookups = hits + self.misses
+        average_miss_seconds = self._miss_seconds / self.misses if self.misses else 0.0
+        return {
+            "model": self.model,
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "persistent_evictions": self.evictions,
+            "saved_openai_calls": hits,
+            "estimated_saved_seconds": hits * average_miss_seconds,
+        }
+
+    def close(self) -> None:
+        """
+        Closes the persistent tier.
+        """
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+
+    # -------------------
+    # In-process LRU tier
+    # -------------------
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    # -------------------
+    # Persistent SQLite tier
+    # -------------------
+
+    def _open_db(self, db_path: str) -> Optional[sqlite3.Connection]:
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(db_path, check_same_thread=False)
+            db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used "
+                "ON embedding_cache (last_used)"
+            )
+            # Entries of other models can never hit again; reclaim their space
+            db.execute("DELETE FROM embedding_cache WHERE model != ?", (self.model,))
+            db.commit()
+            return db
+        except Exception as e:
+            self.logger.log(
+                "EmbeddingCacheService",
+                "error",
+                "Failed to open persistent embedding cache; using memory only.",
+                error=str(e),
+                db_path=db_path,
+            )
+            return None
+
+    def _db_get(self, key: str) -> Optional[List[float]]:
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT embedding FROM embedding_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._db.execute(
+                    "UPDATE embedding_cache SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                self._db.commit()
+            return array("d", row[0]).tolist()
+        except Exception as e:
+            self.logger.log(
+                "EmbeddingCacheService",
+                "error",
+                "Failed to read persistent embedding cache.",
+                error=str(e),
+            )
+            return None
+
+    def _db_put(self, key: str, embedding: List[float]) -> None:
+        try:
+            blob = array("d", embedding).tobytes()
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO embedding_cache "
+                    "(key, model, embedding, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                    (key, self.model, blob, len(blob), time.time()),
+                )
+                self._evict()
+                self._db.commit()
+        except Exception as e:
+            self.logger.log(
+                "EmbeddingCacheService",
+                "error",
+                "Failed to write persistent embedding cache.",
+                error=str(e),
+            )
+
+    def _evict(self) -> None:
+        """
+        Deletes least recently used rows until the tier fits `max_persistent_bytes`.
+        Must be called with `_db_lock` held.
+        """
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM embedding_cache"
+        ).fetchone()[0]
+        if total <= self.max_persistent_bytes:
+            return
+
+        excess = total - self.max_persistent_bytes
+        victims = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM embedding_cache ORDER BY last_used ASC"
+        ):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+
+        self._db.executemany("DELETE FROM embedding_cache WHERE key = ?", victims)
+        self.evictions += len(victims)
@@ -25,7 +25,7 @@ This approach balances flexibility, type safety, and simplicity, leveraging Pris
 while providing a clean API for paper operations.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
 from prisma import Prisma
 from prisma.models import Paper as PrismaPaper, Block as PrismaBlock
@@ -85,6 +85,51 @@ class PaperService:
             )
             return None
 
+    async def create_papers(
+        self, tx: Prisma, papers_data: List[Dict[str, Any]]
+    ) -> Optional[int]:
+        """
+        Creates several Papers with a single `create_many` query.
+
+        Args:
+            tx (Prisma): Prisma transaction instance.
+            papers_data (List[Dict[str, Any]]): Paper data including pdf_url, title, abstract
+                and the block_id of the block each paper belongs to.
+
+        Returns:
+            Optional[int]: The number of papers created, or None if failed.
+        """
+        try:
+            if not papers_data:
+                return 0
+
+            data = [
+                {
+                    "pdf_url": paper_data.get("pdf_url", ""),
+                    "title": paper_data.get("title", ""),
+                    "abstract": paper_data.get("abstract", ""),
+                    "block_id": str(paper_data["block_id"]),
+                }
+                for paper_data in papers_data
+            ]
+            count = await tx.paper.create_many(data=data)
+
+            self.logger.log(
+                "PaperService",
+                "info",
+                "Papers created successfully.",
+                count=count,
+            )
+            return count
+        except Exception as e:
+            self.logger.log(
+                "PaperService",
+                "error",
+                "Failed to create papers.",
+                error=str(e),
+            )
+            return None
+
     async def get_paper(
         self, tx: Prisma, paper_id: UUID, include_block: bool = False
     ) -> Optional[PrismaPaper]:
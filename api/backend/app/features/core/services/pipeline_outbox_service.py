@@ -0,0 +1,317 @@
+# constellation-backend/api/backend/app/features/core/services/pipeline_outbox_service.py
+
+"""
+Pipeline Outbox Service Module
+
+This module implements the transactional outbox for pipeline runs: the `PipelineOutbox` row
+that asks for a run is written in the same transaction as the pipeline itself, and a
+background dispatcher launches the queued runs on Dagster through DagsterService.
+
+Design Pattern:
+- Transactional Outbox: `enqueue` takes the caller's transaction, so a pipeline is stored
+  together with its pending launch or not at all, and a queued launch survives a restart.
+- Worker Pool: The dispatcher claims due entries in batches and runs at most
+  `max_concurrency` launches at a time.
+
+Key Design Decisions:
+1. Claiming: Entries are claimed with `FOR UPDATE SKIP LOCKED`, so several API processes can
+   dispatch from the same table without launching an entry twice. An entry whose claim is
+   older than `lease_seconds` (its process died mid-launch) is claimed again.
+2. Retries: A launch that fails for a retryable reason (see DagsterService) is retried after
+   `retry_backoff` seconds, doubled after each attempt, up to `max_attempts` attempts. After
+   that, or on a non-retryable failure, the entry and its pipeline are marked "failed".
+3. Idempotency: There is one outbox entry per pipeline, and every launch sends the
+   `pipeline_id`, which the dagster API uses as the run ID. A retry of a launch that did reach
+   Dagster therefore finds the existing run instead of starting another.
+4. Prompt Dispatch: `notify` wakes the dispatcher as soon as a transaction commits; polling
+   every `poll_interval` seconds picks up retries and entries queued by other processes.
+"""
+
+import asyncio
+import json
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+
+from prisma import Json, Prisma
+from prisma.models import PipelineOutbox as PrismaPipelineOutbox
+
+from backend.app.config import settings
+from backend.app.features.core.services.dagster_service import DagsterService
+from backend.app.features.core.services.pipeline_service import PipelineService
+from backend.app.logger import ConstellationLogger
+
+CLAIM_QUERY = """
+UPDATE "PipelineOutbox"
+SET status = 'dispatching', attempts = attempts + 1, updated_at = now()
+WHERE outbox_id IN (
+    SELECT outbox_id FROM "PipelineOutbox"
+    WHERE (status = 'pending' AND next_attempt_at <= now())
+       OR (status = 'dispatching'
+           AND updated_at < now() - make_interval(secs => $2::double precision))
+    ORDER BY next_attempt_at
+    LIMIT $1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING outbox_id::text AS outbox_id, pipeline_id::text AS pipeline_id,
+    config::text AS config, attempts
+"""
+
+
+class PipelineOutboxService:
+    def __init__(
+        self,
+        dagster_service: Optional[DagsterService] = None,
+        pipeline_service: Optional[PipelineService] = None,
+        max_concurrency: int = settings.OUTBOX_MAX_CONCURRENCY,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL_SECONDS,
+        retry_backoff: float = settings.OUTBOX_RETRY_BACKOFF_SECONDS,
+        lease_seconds: float = settings.OUTBOX_LEASE_SECONDS,
+    ):
+        """
+        Args:
+            dagster_service (Optional[DagsterService]): Client used to launch the runs.
+            pipeline_service (Optional[PipelineService]): Records the outcome on the pipeline.
+            max_concurrency (int): Launches in flight at once.
+            max_attempts (int): Launch attempts before an entry is failed.
+            poll_interval (float): Longest wait between scans of the outbox.
+            retry_backoff (float): Delay before the first retry, doubled after each.
+            lease_seconds (float): Age after which a claimed entry is claimed again.
+        """
+        self.logger = ConstellationLogger()
+        self.dagster_service = dagster_service or DagsterService()
+        self.pipeline_service = pipeline_service or PipelineService()
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.retry_backoff = retry_backoff
+        self.lease_seconds = lease_seconds
+
+        self._prisma: Optional[Prisma] = None
+        self._wake = asyncio.Event()
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def enqueue(
+        self, tx: Prisma, pipeline_id: UUID, config: List[Dict[str, Any]]
+    ) -> Optional[PrismaPipelineOutbox]:
+        """
+        Queues a launch of the given pipeline. Call it inside the transaction that stores
+        the pipeline, then call `notify` once that transaction has committed.
+
+        Args:
+            tx (Prisma): The transaction storing the pipeline.
+            pipeline_id (UUID): The UUID of the pipeline to launch.
+            config (List[Dict[str, Any]]): The instructions for the dagster API.
+
+        Returns:
+            Optional[PrismaPipelineOutbox]: The outbox entry if queued, None otherwise.
+        """
+        try:
+            entry = await tx.pipelineoutbox.create(
+                data={"pipeline_id": str(pipeline_id), "config": Json(config)}
+            )
+            self.logger.log(
+                "PipelineOutboxService",
+                "info",
+                "Pipeline run queued.",
+                pipeline_id=str(pipeline_id),
+                outbox_id=entry.outbox_id,
+            )
+            return entry
+        except Exception as e:
+            self.logger.log(
+                "PipelineOutboxService",
+                "error",
+                "Error queueing pipeline run.",
+                pipeline_id=str(pipeline_id),
+                error=str(e),
+            )
+            return None
+
+    def notify(self) -> None:
+        """
+        Wakes the dispatcher to look for newly queued runs.
+        """
+        self._wake.set()
+
+    # -------------------
+    # Dispatcher
+    # -------------------
+
+    async def start(self, prisma: Prisma) -> None:
+        """
+        Starts the background dispatcher.
+
+        Args:
+            prisma (Prisma): The shared Prisma client the dispatcher claims entries and
+                records outcomes with.
+        """
+        if self._dispatch_task is not None:
+            return
+        self._prisma = prisma
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        self.logger.log(
+            "PipelineOutboxService",
+            "info",
+            "Pipeline outbox dispatcher started.",
+            max_concurrency=self.max_concurrency,
+            max_attempts=self.max_attempts,
+        )
+
+    async def stop(self) -> None:
+        """
+        Stops claiming entries and waits for the launches in flight to be recorded.
+        Unclaimed entries stay queued for the next start.
+        """
+        if self._dispatch_task is None:
+            return
+        self._dispatch_task.cancel()
+        try:
+            await self._dispatch_task
+        except asyncio.CancelledError:
+            pass
+        self._dispatch_task = None
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        self.logger.log(
+            "PipelineOutboxService", "info", "Pipeline outbox dispatcher stopped."
+        )
+
+    async def dispatch_due(self) -> int:
+        """
+        Claims as many due entries as there are free launch slots and starts launching
+        them in the background.
+
+        Returns:
+            int: The number of entries claimed.
+        """
+        free = self.max_concurrency - len(self._in_flight)
+        if free <= 0:
+            return 0
+        try:
+            rows = await self._prisma.query_raw(CLAIM_QUERY, free, self.lease_seconds)
+        except Exception as e:
+            self.logger.log(
+                "PipelineOutboxService",
+                "error",
+                f"Failed to claim outbox entries: {str(e)}",
+            )
+            return 0
+
+        for row in rows:
+            task = asyncio.create_task(self.dispatch(row))
+            self._in_flight.add(task)
+            task.add_done_callback(self._dispatched)
+        return len(rows)
+
+    async def dispatch(self, entry: Dict[str, Any]) -> bool:
+        """
+        Launches one claimed entry and records the outcome on it and on its pipeline.
+
+        Args:
+            entry (Dict[str, Any]): The claimed row ('outbox_id', 'pipeline_id', 'config'
+                as JSON text, 'attempts' including this one).
+
+        Returns:
+            bool: True if Dagster accepted the run, False otherwise.
+        """
+        outbox_id = entry["outbox_id"]
+        pipeline_id = entry["pipeline_id"]
+        try:
+            response = await self.dagster_service.launch(
+                json.loads(entry["config"]), pipeline_id=pipeline_id
+            )
+        except Exception as e:
+            self.logger.log(
+                "PipelineOutboxService",
+                "error",
+                f"Exception during pipeline launch: {str(e)}",
+                extra={"traceback": traceback.format_exc(), "pipeline_id": pipeline_id},
+            )
+            response = {"status": "failure", "message": str(e), "retryable": True}
+
+        try:
+            if response.get("status") == "success":
+                await self._record(
+                    outbox_id,
+                    pipeline_id,
+                    {"status": "dispatched", "last_error": None},
+                    {"run_id": response["run_id"], "status": "running"},
+                )
+                return True
+
+            message = response.get("message", "Unknown error")
+            if response.get("retryable") and entry["attempts"] < self.max_attempts:
+                delay = self.retry_backoff * 2 ** (entry["attempts"] - 1)
+                await self._record(
+                    outbox_id,
+                    pipeline_id,
+                    {
+                        "status": "pending",
+                        "last_error": message,
+                        "next_attempt_at": datetime.now(timezone.utc)
+                        + timedelta(seconds=delay),
+                    },
+                )
+                self.logger.log(
+                    "PipelineOutboxService",
+                    "warning",
+                    "Pipeline launch failed; retrying.",
+                    pipeline_id=pipeline_id,
+                    attempts=entry["attempts"],
+                    retry_in_seconds=delay,
+                    error=message,
+                )
+            else:
+                await self._record(
+                    outbox_id,
+                    pipeline_id,
+                    {"status": "failed", "last_error": message},
+                    {"status": "failed", "message": message},
+                )
+        except Exception as e:
+            # The entry stays claimed and is retried once its lease runs out
+            self.logger.log(
+                "PipelineOutboxService",
+                "error",
+                f"Failed to record pipeline launch outcome: {str(e)}",
+                extra={"traceback": traceback.format_exc(), "pipeline_id": pipeline_id},
+            )
+        return False
+
+    async def _record(
+        self,
+        outbox_id: str,
+        pipeline_id: str,
+        entry_data: Dict[str, Any],
+        pipeline_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        async with self._prisma.tx() as tx:
+            entry_data["updated_at"] = datetime.now(timezone.utc)
+            await tx.pipelineoutbox.update(
+                where={"outbox_id": outbox_id}, data=entry_data
+            )
+            if pipeline_data is not None:
+                pipeline = await self.pipeline_service.update_pipeline(
+                    tx, pipeline_id, pipeline_data
+                )
+                if not pipeline:
+                    raise ValueError(f"Failed to update pipeline {pipeline_id}.")
+
+    def _dispatched(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        # A launch slot is free again
+        self._wake.set()
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            # Cleared before claiming, so a notify that arrives meanwhile is not lost
+            self._wake.clear()
+            await self.dispatch_due()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID, uuid4
 from prisma import Prisma
 from prisma.models import (
@@ -8,6 +8,7 @@ from prisma.models import (
 )
 from prisma.errors import UniqueViolationError
 from backend.app.logger import ConstellationLogger
+from backend.app.utils.pagination import keyset_order, keyset_where, next_cursor
 import asyncio
 from datetime import datetime, timezone
 from backend.app.features.core.services.user_service import UserService
@@ -26,7 +27,7 @@ class PipelineService:
         Args:
             prisma (Prisma): The Prisma client instance.
             pipeline_data (Dict[str, Any]): Dictionary containing pipeline creation data.
-                Expected keys: 'name', 'description', 'user_id'.
+                Expected keys: 'name', 'description', 'user_id'; optional: 'config', 'status'.
 
         Returns:
             Optional[PrismaPipeline]: The created pipeline if successful, None otherwise.
@@ -48,6 +49,7 @@ class PipelineService:
                     "created_at": created_at,
                     "updated_at": updated_at,
                     "config": config,
+                    "status": pipeline_data.get("status"),
                 }
             )
 
@@ -130,7 +132,7 @@ class PipelineService:
             prisma (Prisma): The Prisma client instance.
             pipeline_id (UUID): The UUID of the pipeline to update.
             update_data (Dict[str, Any]): Dictionary containing updated pipeline data.
-                Allowed keys: 'name', 'description', 'run_id'.
+                Allowed keys: 'name', 'description', 'run_id', 'status', 'message'.
 
         Returns:
             Optional[PrismaPipeline]: The updated pipeline if successful, None otherwise.
@@ -311,30 +313,66 @@ class PipelineService:
         Returns:
             List[PrismaPipeline]: A list of pipelines.
         """
+        page = await self.list_pipelines_page(tx, filters, limit, offset=offset)
+        return page[0] if page else []
+
+    async def list_pipelines_page(
+        self,
+        tx: Prisma,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Optional[Tuple[List[PrismaPipeline], Optional[str]]]:
+        """
+        Retrieves one page of pipelines in (created_at, pipeline_id) order.
+
+        Args:
+            tx (Prisma): The Prisma client instance.
+            filters (Optional[Dict[str, Any]]): Key-value pairs to filter the pipelines.
+                Supported filters: 'name', 'user_id'.
+            limit (int): The maximum number of pipelines in the page.
+            cursor (Optional[str]): `next_cursor` of the previous page; None for the first.
+            offset (int): The number of pipelines to skip, for the legacy offset-paged
+                `/pipelines/` route. Ignored when `cursor` is given.
+
+        Returns:
+            Optional[Tuple[List[PrismaPipeline], Optional[str]]]: The pipelines and the
+                cursor of the next page (None on the last page), or None on error.
+        """
         try:
-            pipelines = await tx.pipeline.find_many(
-                where=filters,
-                skip=offset,
-                take=limit,
+            # One extra row tells whether another page follows
+            rows = await tx.pipeline.find_many(
+                where={
+                    "AND": [
+                        filters or {},
+                        keyset_where(cursor, "created_at", "pipeline_id"),
+                    ]
+                },
+                order=keyset_order("created_at", "pipeline_id"),
+                skip=0 if cursor else offset,
+                take=limit + 1,
                 include={
                     "PipelineBlock": {"include": {"Block": True}},
                     "PipelineEdge": {"include": {"Edge": True}},
                 },
             )
+            pipelines = rows[:limit]
             self.logger.log(
                 "PipelineService",
                 "info",
                 "Pipelines listed successfully.",
                 limit=limit,
+                cursor=cursor,
                 offset=offset,
                 pipelines_found=len(pipelines),
             )
-            return pipelines
+            return pipelines, next_cursor(rows, limit, "created_at", "pipeline_id")
         except Exception as e:
             self.logger.log(
                 "PipelineService", "error", "Error listing pipelines.", error=str(e)
             )
-            return []
+            return None
 
     async def assign_block_to_pipeline(
         self, tx: Prisma, block_id: UUID, pipeline_id: UUID
@@ -658,7 +696,7 @@ class PipelineService:
 
                 # Step 6: List all pipelines
                 print("\nListing all pipelines...")
-                all_pipelines = await self.list_pipelines(tx, limit=10, offset=0)
+                all_pipelines = await self.list_pipelines(tx, limit=10)
                 print(f"Total Pipelines: {len(all_pipelines)}")
                 for p in all_pipelines:
                     print(f"- {p.pipeline_id} - {p.name}")
@@ -26,7 +26,7 @@ This approach balances flexibility, type safety, and simplicity, leveraging Pris
 while providing a clean API for taxonomy operations.
 """
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 from uuid import UUID, uuid4
 from prisma import Prisma
 from prisma.models import (
@@ -404,6 +404,126 @@ class TaxonomyService:
             )
             return False
 
+    async def resolve_taxonomy_categories(
+        self,
+        tx: Prisma,
+        taxonomy_data: Dict[str, Any],
+        resolved: Optional[Dict[Tuple[str, Optional[str]], str]] = None,
+    ) -> Optional[List[UUID]]:
+        """
+        Finds or creates the categories of a taxonomy without associating them with a block.
+
+        Args:
+            tx (Prisma): Prisma transaction instance.
+            taxonomy_data (Dict[str, Any]): Nested taxonomy data, as for `create_taxonomy_for_block`.
+            resolved (Optional[Dict[Tuple[str, Optional[str]], str]]): Category IDs keyed by
+                (name, parent name), shared across calls so a bulk import looks up each
+                category once.
+
+        Returns:
+            Optional[List[UUID]]: The category IDs, or None if a category could not be resolved.
+        """
+        resolved = resolved if resolved is not None else {}
+        try:
+            category_ids = []
+
+            for category in taxonomy_data.get("general", {}).get("categories", []):
+                key = (category["name"], None)
+                if key not in resolved:
+                    existing_category = await tx.category.find_unique(
+                        where={"name": category["name"], "parent_id": None}
+                    )
+                    if not existing_category:
+                        existing_category = await self.create_category(
+                            tx, {"name": category["name"]}
+                        )
+                    if not existing_category:
+                        raise ValueError("Failed to create general taxonomy category.")
+                    resolved[key] = existing_category.category_id
+                category_ids.append(UUID(resolved[key]))
+
+            for category in taxonomy_data.get("specific", {}).get("categories", []):
+                parent_name = category.get("parent_name")
+                key = (category["name"], parent_name)
+                if key not in resolved:
+                    parent_key = (parent_name, None)
+                    if parent_key not in resolved:
+                        parent_category = await tx.category.find_unique(
+                            where={"name": parent_name, "parent_id": None}
+                        )
+                        if not parent_category:
+                            raise ValueError(
+                                f"Parent category '{parent_name}' does not exist."
+                            )
+                        resolved[parent_key] = parent_category.category_id
+
+                    existing_category = await tx.category.find_unique(
+                        where={
+                            "name": category["name"],
+                            "parent_id": resolved[parent_key],
+                        }
+                    )
+                    if not existing_category:
+                        existing_category = await self.create_category(
+                            tx,
+                            {
+                                "name": category["name"],
+                                "parent_id": UUID(resolved[parent_key]),
+                            },
+                        )
+                    if not existing_category:
+                        raise ValueError("Failed to create specific taxonomy category.")
+                    resolved[key] = existing_category.category_id
+                category_ids.append(UUID(resolved[key]))
+
+            return category_ids
+        except Exception as e:
+            self.logger.log(
+                "TaxonomyService",
+                "error",
+                "Failed to resolve taxonomy categories",
+                error=str(e),
+            )
+            return None
+
+    async def associate_blocks_with_categories(
+        self, tx: Prisma, block_categories: Dict[str, List[UUID]]
+    ) -> bool:
+        """
+        Associates several blocks with their categories in a single `create_many` query.
+
+        Args:
+            tx (Prisma): Prisma transaction instance.
+            block_categories (Dict[str, List[UUID]]): Category UUIDs keyed by block ID.
+
+        Returns:
+            bool: True if associations were successful, False otherwise.
+        """
+        try:
+            data = [
+                {"block_id": str(block_id), "category_id": str(category_id)}
+                for block_id, category_ids in block_categories.items()
+                for category_id in category_ids
+            ]
+            if data:
+                await tx.blockcategory.create_many(data=data, skip_duplicates=True)
+            self.logger.log(
+                "TaxonomyService",
+                "info",
+                "Blocks associated with categories successfully",
+                block_count=len(block_categories),
+                association_count=len(data),
+            )
+            return True
+        except Exception as e:
+            self.logger.log(
+                "TaxonomyService",
+                "error",
+                "Failed to associate blocks with categories",
+                error=str(e),
+            )
+            return False
+
     async def search_blocks(
         self, tx: Prisma, search_filters: Dict[str, Any]
     ) -> Optional[List[PrismaBlock]]:
@@ -15,12 +15,24 @@ Key Design Decisions:
 2. Separate Methods for Text and Document: This ensures clear input requirements and error handling.
 3. Type Safety and Consistency: Type hints are used to maintain consistency.
 4. Error Handling: Exceptions are allowed to propagate for handling by the caller.
+5. Embedding Cache: Text embeddings go through an optional EmbeddingCacheService keyed by
+   model and content hash, so repeated queries skip the OpenAI round trip.
+6. Batched Embedding: `generate_text_embeddings` embeds many texts with one OpenAI request per
+   `batch_size` texts; a failed batch only fails its own items.
+7. Non-Blocking Calls: The synchronous Haystack embedders run in worker threads, bounded by a
+   semaphore (EMBEDDING_MAX_CONCURRENCY), with a per-request timeout and exponential backoff
+   with jitter on rate limits, timeouts and connection errors. The timeout is set on the
+   OpenAI client, and a thread keeps its semaphore slot until it returns, even after its
+   caller stopped waiting, so abandoned calls never push concurrency over the limit.
+8. Request Coalescing: Concurrent requests for the same text share one in-flight OpenAI call.
 
 This design enables scalable and reusable embedding functionalities for different content types.
 """
 
 import asyncio
-from typing import List, Dict, Optional
+import random
+import time
+from typing import Any, Callable, List, Dict, Optional
 from haystack.components.embedders import OpenAITextEmbedder, OpenAIDocumentEmbedder
 from haystack import Document
 from haystack.utils import Secret
@@ -29,15 +41,38 @@ from backend.app.logger import (
     ConstellationLogger,
 )  # Assuming the logger is similar to BlockService
 import PyPDF2
+from openai import APIConnectionError, APITimeoutError, RateLimitError
+
+from backend.app.config import settings
+from backend.app.features.core.services.embedding_cache_service import (
+    EmbeddingCacheService,
+)
 
 
 class VectorEmbeddingService:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[EmbeddingCacheService] = None,
+        model: str = settings.EMBEDDING_MODEL,
+        batch_size: int = 32,
+        max_concurrency: int = settings.EMBEDDING_MAX_CONCURRENCY,
+        timeout: float = settings.EMBEDDING_TIMEOUT_SECONDS,
+        max_retries: int = settings.EMBEDDING_MAX_RETRIES,
+        backoff_base: float = 0.5,
+    ):
         """
         Initialize the VectorEmbeddingService.
 
         Args:
             api_key (Optional[str]): OpenAI API key. If not provided, will use the environment variable OPENAI_API_KEY.
+            cache (Optional[EmbeddingCacheService]): Cache consulted before embedding text. None disables caching.
+            model (str): The OpenAI embedding model.
+            batch_size (int): Texts sent per OpenAI request by `generate_text_embeddings`.
+            max_concurrency (int): OpenAI requests allowed in flight at once.
+            timeout (float): Seconds before a single OpenAI request is abandoned.
+            max_retries (int): Retries of a rate-limited, timed-out or disconnected request.
+            backoff_base (float): First retry delay in seconds; doubled on every retry.
         """
         self.logger = ConstellationLogger()
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -46,23 +81,76 @@ class VectorEmbeddingService:
                 "API key must be provided or set in the OPENAI_API_KEY environment variable."
             )
 
-        self.text_embedder = OpenAITextEmbedder(api_key=Secret.from_token(self.api_key))
+        self.model = model
+        self.cache = cache
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Retries are ours (with backoff), so the OpenAI client must not retry itself
+        self.text_embedder = OpenAITextEmbedder(
+            api_key=Secret.from_token(self.api_key),
+            model=self.model,
+            timeout=self.timeout,
+            max_retries=0,
+        )
         self.document_embedder = OpenAIDocumentEmbedder(
-            api_key=Secret.from_token(self.api_key)
+            api_key=Secret.from_token(self.api_key),
+            model=self.model,
+            batch_size=self.batch_size,
+            progress_bar=False,
+            timeout=self.timeout,
+            max_retries=0,
         )
 
     async def generate_text_embedding(self, text: str) -> Optional[List[float]]:
         """
         Generates a vector embedding for the provided text.
 
+        Concurrent calls for the same text wait for the first one instead of issuing
+        their own OpenAI request.
+
         Args:
             text (str): The text to generate an embedding for.
 
         Returns:
             Optional[List[float]]: The generated vector embedding. None on exception.
         """
+        if self.cache is not None:
+            cached = await self.cache.get(text)
+            if cached is not None:
+                return cached
+
+        inflight = self._inflight.get(text)
+        if inflight is not None:
+            try:
+                # Shielded so a cancelled follower does not cancel the shared call
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leading request was cancelled; issue our own
+                return await self.generate_text_embedding(text)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[text] = future
+        try:
+            embedding = await self._embed_text(text)
+            future.set_result(embedding)
+            return embedding
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(text, None)
+
+    async def _embed_text(self, text: str) -> Optional[List[float]]:
         try:
-            result = self.text_embedder.run(text)
+            started_at = time.perf_counter()
+            result = await self._run_embedder(self.text_embedder.run, text)
             embedding = result["embedding"]
             self.logger.log(
                 "VectorEmbeddingService",
@@ -70,6 +158,11 @@ class VectorEmbeddingService:
                 f"Text embedding generated successfully.",
                 text=text,
             )
+
+            if self.cache is not None:
+                await self.cache.put(
+                    text, embedding, miss_seconds=time.perf_counter() - started_at
+                )
             return embedding
         except Exception as e:
             self.logger.log(
@@ -80,6 +173,75 @@ class VectorEmbeddingService:
             )
             return None
 
+    async def generate_text_embeddings(
+        self, texts: List[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        Generates vector embeddings for many texts, batching the OpenAI requests.
+
+        Args:
+            texts (List[str]): The texts to generate embeddings for.
+
+        Returns:
+            List[Optional[List[float]]]: One embedding per input text, in input order.
+                None for texts whose batch failed.
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+        # Serve what we can from the cache; embed each distinct missing text once
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            cached = await self.cache.get(text) if self.cache is not None else None
+            if cached is not None:
+                embeddings[index] = cached
+            else:
+                pending.setdefault(text, []).append(index)
+
+        missing = list(pending)
+
+        async def embed_batch(start: int) -> None:
+            batch = missing[start : start + self.batch_size]
+            try:
+                started_at = time.perf_counter()
+                result = await self._run_embedder(
+                    self.document_embedder.run,
+                    [Document(content=text) for text in batch],
+                )
+                elapsed = time.perf_counter() - started_at
+            except Exception as e:
+                self.logger.log(
+                    "VectorEmbeddingService",
+                    "error",
+                    "Failed to generate text embeddings for batch",
+                    error=str(e),
+                    batch_start=start,
+                    batch_size=len(batch),
+                )
+                return
+
+            for text, document in zip(batch, result["documents"]):
+                for index in pending[text]:
+                    embeddings[index] = document.embedding
+                if self.cache is not None:
+                    await self.cache.put(
+                        text, document.embedding, miss_seconds=elapsed / len(batch)
+                    )
+
+        # Batches run concurrently, up to the semaphore limit
+        await asyncio.gather(
+            *(embed_batch(start) for start in range(0, len(missing), self.batch_size))
+        )
+
+        self.logger.log(
+            "VectorEmbeddingService",
+            "info",
+            "Text embeddings generated.",
+            requested=len(texts),
+            embedded=len(missing),
+            failed=sum(1 for embedding in embeddings if embedding is None),
+        )
+        return embeddings
+
     async def generate_document_embedding(
         self, pdf_file_path: str
     ) -> Optional[List[float]]:
@@ -93,9 +255,9 @@ class VectorEmbeddingService:
             Optional[List[float]]: The generated vector embedding. None on exception.
         """
         try:
-            content = self._pdf_to_text(pdf_file_path)
+            content = await asyncio.to_thread(self._pdf_to_text, pdf_file_path)
             document = Document(content=content, meta={"name": pdf_file_path})
-            result = self.document_embedder.run([document])
+            result = await self._run_embedder(self.document_embedder.run, [document])
             embedding = result["documents"][0].embedding
             self.logger.log(
                 "VectorEmbeddingService",
@@ -113,6 +275,60 @@ class VectorEmbeddingService:
             )
             return None
 
+    async def _run_embedder(self, run: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs a synchronous embedder call in a worker thread without blocking the event loop.
+
+        At most `max_concurrency` calls run at once, counting threads whose caller timed
+        out but which are still running. Rate limits, timeouts and connection errors are
+        retried up to `max_retries` times with exponential backoff and jitter; other errors
+        propagate immediately.
+
+        Args:
+            run (Callable[..., Any]): The embedder's `run` method.
+            *args (Any): Arguments for `run`.
+
+        Returns:
+            Any: The embedder result.
+        """
+        attempt = 0
+        while True:
+            await self._semaphore.acquire()
+            call = asyncio.ensure_future(asyncio.to_thread(run, *args))
+            call.add_done_callback(self._release_slot)
+            try:
+                # The OpenAI client enforces the timeout itself; this only stops waiting
+                # on a call that overruns it. The thread runs on, holding its slot.
+                return await asyncio.wait_for(asyncio.shield(call), timeout=self.timeout)
+            except (
+                RateLimitError,
+                APITimeoutError,
+                APIConnectionError,
+                asyncio.TimeoutError,
+            ) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_base * 2**attempt
+                delay += random.uniform(0, delay)
+                attempt += 1
+                self.logger.log(
+                    "VectorEmbeddingService",
+                    "warning",
+                    "Embedding request failed; retrying.",
+                    error=type(e).__name__,
+                    attempt=attempt,
+                    delay_seconds=round(delay, 3),
+                )
+                # Sleep outside the semaphore so waiting requests can proceed
+                await asyncio.sleep(delay)
+
+    def _release_slot(self, call: asyncio.Future) -> None:
+        """Frees the semaphore slot of a finished embedder thread."""
+        self._semaphore.release()
+        if not call.cancelled():
+            # Retrieved so an abandoned call's error is not reported as unhandled
+            call.exception()
+
     def _pdf_to_text(self, pdf_path: str) -> str:
         """
         Internal method to extract text from a PDF file.
@@ -0,0 +1,263 @@
+# constellation-backend/api/backend/app/features/core/services/vector_store_service.py
+
+"""
+Vector Store Service Module
+
+This module implements an asynchronous pgvector store for the `BlockVector` table, backed by
+a bounded psycopg connection pool.
+
+Design Pattern:
+- Adapter Pattern: VectorStoreService exposes upsert, fetch-by-id, top-k search and delete on
+  the table the haystack PgvectorDocumentStore created, using native async queries.
+- Shared Resource: One pool per process (owned by the service registry), opened at startup and
+  closed on shutdown.
+
+Key Design Decisions:
+1. Non-Blocking I/O: The haystack store and retriever issue synchronous psycopg calls, which
+   block the uvicorn event loop for the whole query. AsyncConnectionPool keeps the loop free,
+   and concurrent searches run on separate pooled connections.
+2. Bounded Pool: `max_size` caps the connections this service opens, so bursts queue for a
+   connection (up to `timeout` seconds) instead of exhausting Postgres.
+3. Text Vector Literals: Vectors are sent as '[x, y, ...]' and cast with ::vector, so no
+   pgvector type adapter has to be registered on the pooled connections.
+4. Index-Friendly Ordering: Searches order by the cosine distance operator (<=>) so the HNSW
+   index is used; the returned score is `1 - distance`, matching haystack's cosine_similarity.
+5. Error Handling: Failures are logged and reported as None/False/empty, like the other services.
+"""
+
+import asyncio
+import json
+import traceback
+from typing import Dict, List, Optional, Tuple
+
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool
+
+from backend.app.config import settings
+from backend.app.logger import ConstellationLogger
+
+
+def to_vector_literal(vector: List[float]) -> str:
+    """
+    Formats a vector as a pgvector text literal, e.g. '[0.1,0.2]'.
+    """
+    return "[" + ",".join(str(float(value)) for value in vector) + "]"
+
+
+def from_vector_literal(literal: str) -> List[float]:
+    """
+    Parses a pgvector text literal back into a list of floats.
+    """
+    return [float(value) for value in json.loads(literal)]
+
+
+class VectorStoreService:
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        table_name: str = "BlockVector",
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+    ):
+        """
+        Args:
+            connection_string (Optional[str]): Postgres DSN. Defaults to settings.DATABASE_URL.
+            table_name (str): The pgvector table holding block embeddings.
+            min_size (int): Connections kept open by the pool.
+            max_size (int): Upper bound on concurrent connections.
+            timeout (float): Seconds to wait for a free connection before failing.
+        """
+        self.logger = ConstellationLogger()
+        self.table = sql.Identifier(table_name)
+        self.pool = AsyncConnectionPool(
+            conninfo=connection_string or str(settings.DATABASE_URL),
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout,
+            open=False,
+        )
+        self._open_lock = asyncio.Lock()
+        self._opened = False
+
+    async def open(self) -> None:
+        """
+        Opens the pool and waits until `min_size` connections are ready.
+        """
+        async with self._open_lock:
+            if self._opened:
+                return
+            await self.pool.open(wait=True)
+            self._opened = True
+            self.logger.log(
+                "VectorStoreService",
+                "info",
+                "Connection pool opened.",
+                min_size=self.pool.min_size,
+                max_size=self.pool.max_size,
+            )
+
+    async def close(self) -> None:
+        """
+        Closes the pool and all its connections.
+        """
+        if not self._opened:
+            return
+        await self.pool.close()
+        self._opened = False
+        self.logger.log("VectorStoreService", "info", "Connection pool closed.")
+
+    async def upsert_vectors(self, vectors: Dict[str, List[float]]) -> bool:
+        """
+        Inserts or overwrites the embeddings for several blocks in one transaction.
+
+        Args:
+            vectors (Dict[str, List[float]]): Embeddings keyed by block ID.
+
+        Returns:
+            bool: True if all rows were written, False otherwise.
+        """
+        if not vectors:
+            return True
+        try:
+            await self.open()
+            query = sql.SQL(
+                "INSERT INTO {table} (id, embedding) VALUES (%s, %s::vector) "
+                "ON CONFLICT (id) DO UPDATE SET embedding = EXCLUDED.embedding"
+            ).format(table=self.table)
+            params = [
+                (str(block_id), to_vector_literal(vector))
+                for block_id, vector in vectors.items()
+            ]
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.executemany(query, params)
+
+            self.logger.log(
+                "VectorStoreService",
+                "info",
+                f"Upserted {len(params)} vectors.",
+            )
+            return True
+        except Exception as e:
+            self.logger.log(
+                "VectorStoreService",
+                "error",
+                "Failed to upsert vectors",
+                error=str(e),
+                traceback=traceback.format_exc(),
+            )
+            return False
+
+    async def upsert_vector(self, block_id: str, vector: List[float]) -> bool:
+        """
+        Inserts or overwrites the embedding of a single block.
+        """
+        return await self.upsert_vectors({str(block_id): vector})
+
+    async def get_vector(self, block_id: str) -> Optional[List[float]]:
+        """
+        Retrieves the embedding of a block.
+
+        Returns:
+            Optional[List[float]]: The embedding, or None if missing or on error.
+        """
+        try:
+            await self.open()
+            query = sql.SQL(
+                "SELECT embedding::text FROM {table} WHERE id = %s"
+            ).format(table=self.table)
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, (str(block_id),))
+                    row = await cur.fetchone()
+
+            if not row or row[0] is None:
+                self.logger.log(
+                    "VectorStoreService",
+                    "warning",
+                    "Vector not found.",
+                    block_id=str(block_id),
+                )
+                return None
+            return from_vector_literal(row[0])
+        except Exception as e:
+            self.logger.log(
+                "VectorStoreService",
+                "error",
+                "Failed to retrieve vector",
+                error=str(e),
+            )
+            return None
+
+    async def search(
+        self, query_vector: List[float], top_k: int = 5
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Finds the blocks whose embeddings are most similar to `query_vector`.
+
+        Args:
+            query_vector (List[float]): The query embedding.
+            top_k (int): The number of hits to return.
+
+        Returns:
+            Optional[List[Tuple[str, float]]]: (block_id, cosine similarity) pairs, best
+            first. None on error.
+        """
+        try:
+            await self.open()
+            query = sql.SQL(
+                "SELECT id, 1 - (embedding <=> %(q)s::vector) AS score "
+                "FROM {table} WHERE embedding IS NOT NULL "
+                "ORDER BY embedding <=> %(q)s::vector LIMIT %(k)s"
+            ).format(table=self.table)
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        query, {"q": to_vector_literal(query_vector), "k": top_k}
+                    )
+                    rows = await cur.fetchall()
+
+            return [(row[0], float(row[1])) for row in rows]
+        except Exception as e:
+            self.logger.log(
+                "VectorStoreService",
+                "error",
+                "Failed to perform vector similarity search",
+                error=str(e),
+                traceback=traceback.format_exc(),
+            )
+            return None
+
+    async def delete_vectors(self, block_ids: List[str]) -> bool:
+        """
+        Deletes the embeddings of the given blocks.
+
+        Returns:
+            bool: True if the delete succeeded, False otherwise.
+        """
+        if not block_ids:
+            return True
+        try:
+            await self.open()
+            query = sql.SQL("DELETE FROM {table} WHERE id = ANY(%s)").format(
+                table=self.table
+            )
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, ([str(i) for i in block_ids],))
+
+            self.logger.log(
+                "VectorStoreService",
+                "info",
+                f"Deleted vectors for {len(block_ids)} blocks.",
+            )
+            return True
+        except Exception as e:
+            self.logger.log(
+                "VectorStoreService",
+                "error",
+                "Failed to delete vectors",
+                error=str(e),
+            )
+            return False
@@ -0,0 +1,158 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from backend.app.features.core.services.audit_service import AuditService
+from backend.app.utils.pagination import decode_cursor
+
+
+def read_event():
+    return {
+        "user_id": str(uuid4()),
+        "action_type": "READ",
+        "entity_type": "block",
+        "entity_id": str(uuid4()),
+        "details": {"results_count": 1},
+    }
+
+
+@pytest.fixture
+def prisma():
+    prisma = Mock()
+    prisma.auditlog.create_many = AsyncMock(side_effect=lambda data: len(data))
+    return prisma
+
+
+@pytest.mark.asyncio
+async def test_unbuffered_read_writes_immediately(prisma):
+    audit_service = AuditService(buffer_reads=False)
+    tx = Mock()
+    tx.auditlog.create = AsyncMock(return_value=Mock())
+
+    assert await audit_service.log_read(tx, read_event())
+    tx.auditlog.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_buffered_reads_flush_in_batches_on_size(prisma):
+    audit_service = AuditService(buffer_reads=True, flush_size=3, flush_interval=60)
+    await audit_service.start(prisma)
+    tx = Mock()
+
+    for _ in range(3):
+        assert await audit_service.log_read(tx, read_event())
+    await asyncio.sleep(0.01)
+
+    # One create_many for the whole batch; the request transaction is untouched
+    prisma.auditlog.create_many.assert_awaited_once()
+    assert len(prisma.auditlog.create_many.call_args.kwargs["data"]) == 3
+    assert not tx.mock_calls
+
+    await audit_service.stop()
+
+
+@pytest.mark.asyncio
+async def test_buffered_reads_flush_on_interval(prisma):
+    audit_service = AuditService(buffer_reads=True, flush_size=100, flush_interval=0.01)
+    await audit_service.start(prisma)
+
+    await audit_service.log_read(Mock(), read_event())
+    await asyncio.sleep(0.05)
+
+    prisma.auditlog.create_many.assert_awaited_once()
+    await audit_service.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queue(prisma):
+    audit_service = AuditService(buffer_reads=True, flush_size=100, flush_interval=60)
+    await audit_service.start(prisma)
+    for _ in range(5):
+        await audit_service.log_read(Mock(), read_event())
+
+    await audit_service.stop()
+
+    assert len(prisma.auditlog.create_many.call_args.kwargs["data"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_events(prisma):
+    audit_service = AuditService(buffer_reads=True, flush_size=100, flush_interval=60)
+    await audit_service.start(prisma)
+    await audit_service.log_read(Mock(), read_event())
+    prisma.auditlog.create_many.side_effect = Exception("database unavailable")
+
+    assert await audit_service.flush() == 0
+
+    prisma.auditlog.create_many.side_effect = lambda data: len(data)
+    assert await audit_service.flush() == 1
+    await audit_service.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_during_flush_keeps_events(prisma):
+    audit_service = AuditService(buffer_reads=True, flush_size=2, flush_interval=60)
+    await audit_service.start(prisma)
+    writing = asyncio.Event()
+
+    async def slow_create_many(data):
+        writing.set()
+        await asyncio.sleep(60)
+
+    prisma.auditlog.create_many.side_effect = slow_create_many
+    for _ in range(2):
+        await audit_service.log_read(Mock(), read_event())
+    await writing.wait()
+
+    # stop cancels the loop mid-write; the batch must still reach the final flush
+    written = []
+    prisma.auditlog.create_many.side_effect = lambda data: written.extend(data)
+    await audit_service.stop()
+
+    assert len(written) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_read_event_is_rejected(prisma):
+    audit_service = AuditService(buffer_reads=True)
+    await audit_service.start(prisma)
+
+    assert not await audit_service.log_read(Mock(), {"action_type": "READ"})
+    await audit_service.stop()
+    prisma.auditlog.create_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_list_audit_logs_page_is_newest_first_with_cursor():
+    audit_service = AuditService()
+    timestamp = datetime(2024, 11, 5, tzinfo=timezone.utc)
+    tx = Mock()
+    tx.auditlog.find_many = AsyncMock(
+        return_value=[
+            SimpleNamespace(log_id=log_id, timestamp=timestamp)
+            for log_id in ["c", "b", "a"]
+        ]
+    )
+
+    logs, cursor = await audit_service.list_audit_logs_page(
+        tx, {"user_id": "u-1"}, limit=2
+    )
+
+    assert [log.log_id for log in logs] == ["c", "b"]
+    assert decode_cursor(cursor) == (timestamp, "b")
+    _, kwargs = tx.auditlog.find_many.call_args
+    assert kwargs["take"] == 3
+    assert kwargs["order"] == [{"timestamp": "desc"}, {"log_id": "desc"}]
+
+    await audit_service.list_audit_logs_page(tx, {"user_id": "u-1"}, 2, cursor)
+
+    _, kwargs = tx.auditlog.find_many.call_args
+    assert kwargs["where"]["AND"][0] == {"user_id": "u-1"}
+    assert kwargs["where"]["AND"][1]["OR"][1] == {
+        "timestamp": timestamp,
+        "log_id": {"lt": "b"},
+    }
@@ -0,0 +1,142 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+from backend.app.features.core.controllers.block_controller import BlockController
+
+
+@pytest.fixture
+def tx():
+    tx = Mock()
+    tx.block.find_many = AsyncMock(return_value=[])
+    return tx
+
+
+@pytest.fixture
+def controller(tx):
+    prisma = Mock()
+    prisma.tx.return_value = MagicMock()
+    prisma.tx.return_value.__aenter__ = AsyncMock(return_value=tx)
+    prisma.tx.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    block_service = Mock()
+    block_service.create_blocks = AsyncMock(
+        side_effect=lambda tx, rows: [f"id-{row['name']}" for row in rows]
+    )
+    block_service.set_block_vectors = AsyncMock(return_value=True)
+    block_service.delete_block_vectors = AsyncMock(return_value=True)
+    taxonomy_service = Mock()
+    taxonomy_service.resolve_taxonomy_categories = AsyncMock(return_value=[uuid4()])
+    taxonomy_service.associate_blocks_with_categories = AsyncMock(return_value=True)
+    paper_service = Mock()
+    paper_service.create_papers = AsyncMock(return_value=1)
+    audit_service = Mock()
+    audit_service.create_audit_logs = AsyncMock(return_value=2)
+    vector_embedding_service = Mock()
+    vector_embedding_service.generate_text_embeddings = AsyncMock()
+
+    return BlockController(
+        prisma,
+        block_service=block_service,
+        taxonomy_service=taxonomy_service,
+        audit_service=audit_service,
+        vector_embedding_service=vector_embedding_service,
+        paper_service=paper_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_blocks_bulk_batches_writes_and_reports_failures(controller, tx):
+    # "existing" is already in the database, "broken" fails to embed
+    tx.block.find_many.return_value = [SimpleNamespace(name="existing")]
+    controller.vector_embedding_service.generate_text_embeddings.return_value = [
+        [0.1],
+        None,
+        [0.3],
+        [0.4],
+    ]
+    blocks = [
+        {"name": "model", "block_type": "model", "content": "a model"},
+        {"name": "broken", "block_type": "model", "content": "bad"},
+        {"name": "existing", "block_type": "dataset", "content": "data"},
+        {
+            "name": "paper",
+            "block_type": "paper",
+            "abstract": "an abstract",
+            "title": "A Paper",
+            "taxonomy": {"general": {"categories": [{"name": "Climate"}]}},
+        },
+        {"name": "model", "block_type": "model"},
+    ]
+
+    result = await controller.create_blocks_bulk(blocks, uuid4())
+
+    assert [item["name"] for item in result["created"]] == ["model", "paper"]
+    assert [item["index"] for item in result["failed"]] == [1, 2, 4]
+
+    # One embedding call and one write per table for the whole batch
+    embed = controller.vector_embedding_service.generate_text_embeddings
+    embed.assert_awaited_once_with(["a model", "bad", "data", "an abstract"])
+    controller.block_service.create_blocks.assert_awaited_once()
+    controller.block_service.set_block_vectors.assert_awaited_once_with(
+        tx, {"id-model": [0.1], "id-paper": [0.4]}
+    )
+    controller.paper_service.create_papers.assert_awaited_once()
+    papers = controller.paper_service.create_papers.call_args.args[1]
+    assert papers == [
+        {
+            "pdf_url": "",
+            "title": "A Paper",
+            "abstract": "an abstract",
+            "block_id": "id-paper",
+        }
+    ]
+    audit_logs = controller.audit_service.create_audit_logs.call_args.args[1]
+    assert len(audit_logs) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_blocks_bulk_rollback_fails_pending_items(controller):
+    controller.vector_embedding_service.generate_text_embeddings.return_value = []
+    controller.audit_service.create_audit_logs.return_value = None
+
+    result = await controller.create_blocks_bulk(
+        [{"name": "a", "block_type": "model"}, {"name": "b", "block_type": "model"}],
+        uuid4(),
+    )
+
+    assert result["created"] == []
+    assert [item["index"] for item in result["failed"]] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_create_blocks_bulk_writes_vectors_after_prisma_writes(controller):
+    controller.vector_embedding_service.generate_text_embeddings.return_value = [[0.1]]
+    controller.audit_service.create_audit_logs.return_value = None
+
+    result = await controller.create_blocks_bulk(
+        [{"name": "a", "block_type": "model", "content": "a model"}], uuid4()
+    )
+
+    # The audit write failed, so no vector was committed outside the transaction
+    assert result["created"] == []
+    controller.block_service.set_block_vectors.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_blocks_bulk_failed_commit_deletes_vectors(controller):
+    controller.vector_embedding_service.generate_text_embeddings.return_value = [[0.1]]
+    controller.prisma.tx.return_value.__aexit__.side_effect = Exception("commit failed")
+
+    result = await controller.create_blocks_bulk(
+        [
+            {"name": "a", "block_type": "model", "content": "a model"},
+            {"name": "b", "block_type": "model"},
+        ],
+        uuid4(),
+    )
+
+    assert result["created"] == []
+    controller.block_service.set_block_vectors.assert_awaited_once()
+    controller.block_service.delete_block_vectors.assert_awaited_once_with(["id-a"])
@@ -0,0 +1,115 @@
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from backend.app.features.core.services.block_service import BlockService
+
+
+def make_block(block_id):
+    return SimpleNamespace(block_id=block_id, name=f"block-{block_id}", paper=None)
+
+
+@pytest.fixture
+def block_service():
+    vector_store = Mock()
+    vector_store.search = AsyncMock()
+    vector_store.upsert_vector = AsyncMock(return_value=True)
+    vector_store.get_vector = AsyncMock()
+    return BlockService(vector_store=vector_store, crew=Mock())
+
+
+@pytest.fixture
+def tx():
+    tx = Mock()
+    tx.block.find_many = AsyncMock()
+    tx.block.find_unique = AsyncMock()
+    return tx
+
+
+@pytest.mark.asyncio
+async def test_hydrate_blocks_keeps_order_and_skips_missing(block_service, tx):
+    # The database returns rows in arbitrary order, and "b" no longer exists
+    tx.block.find_many.return_value = [make_block("c"), make_block("a")]
+
+    blocks = await block_service.hydrate_blocks(tx, ["a", "b", "c"])
+
+    assert [block.block_id for block in blocks] == ["a", "c"]
+    tx.block.find_many.assert_awaited_once_with(
+        where={"block_id": {"in": ["a", "b", "c"]}}, include={"paper": True}
+    )
+
+
+@pytest.mark.asyncio
+async def test_hydrate_blocks_empty_skips_query(block_service, tx):
+    assert await block_service.hydrate_blocks(tx, []) == []
+    tx.block.find_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_vector_search_uses_one_query_and_returns_scores(block_service, tx):
+    block_service.vector_store.search.return_value = [("b", 0.9), ("a", 0.7)]
+    tx.block.find_many.return_value = [make_block("a"), make_block("b")]
+
+    hits = await block_service.search_blocks_by_vector_similarity(
+        tx, [0.1] * 1536, top_k=2
+    )
+
+    assert [(hit["block"].block_id, hit["score"]) for hit in hits] == [
+        ("b", 0.9),
+        ("a", 0.7),
+    ]
+    tx.block.find_many.assert_awaited_once()
+    tx.block.find_unique.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_vector_search_failure_returns_none(block_service, tx):
+    block_service.vector_store.search.return_value = None
+
+    hits = await block_service.search_blocks_by_vector_similarity(tx, [0.1] * 1536)
+
+    assert hits is None
+    tx.block.find_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_set_and_get_block_vector_use_async_store(block_service, tx):
+    block_service.vector_store.get_vector.return_value = [0.5] * 1536
+
+    assert await block_service.set_block_vector(tx, "a", [0.5] * 1536)
+    assert await block_service.get_block_vector(tx, "a") == [0.5] * 1536
+    block_service.vector_store.upsert_vector.assert_awaited_once_with("a", [0.5] * 1536)
+
+
+@pytest.mark.asyncio
+async def test_list_blocks_page_fetches_one_extra_row(block_service, tx):
+    created_at = datetime(2024, 11, 5, tzinfo=timezone.utc)
+    tx.block.find_many.return_value = [
+        SimpleNamespace(block_id=block_id, created_at=created_at)
+        for block_id in ["a", "b", "c"]
+    ]
+
+    blocks, cursor = await block_service.list_blocks_page(tx, limit=2)
+
+    assert [block.block_id for block in blocks] == ["a", "b"]
+    assert cursor is not None
+    _, kwargs = tx.block.find_many.call_args
+    assert kwargs["take"] == 3
+    assert kwargs["order"] == [{"created_at": "asc"}, {"block_id": "asc"}]
+
+
+@pytest.mark.asyncio
+async def test_iter_blocks_walks_every_page(block_service, tx):
+    created_at = datetime(2024, 11, 5, tzinfo=timezone.utc)
+    rows = [SimpleNamespace(block_id=str(i), created_at=created_at) for i in range(5)]
+    tx.block.find_many.side_effect = [rows[0:3], rows[2:5], rows[4:5]]
+
+    chunks = [chunk async for chunk in block_service.iter_blocks(tx, chunk_size=2)]
+
+    assert [[block.block_id for block in chunk] for chunk in chunks] == [
+        ["0", "1"],
+        ["2", "3"],
+        ["4"],
+    ]
+    assert tx.block.find_many.await_count == 3
@@ -0,0 +1,81 @@
+import json
+
+import httpx
+import pytest
+
+from backend.app.features.core.services.dagster_service import DagsterService
+
+EXECUTE_URL = "http://dagster_api:8001/execute"
+
+
+def service(handler):
+    return DagsterService(
+        execute_url=EXECUTE_URL,
+        timeout=1.0,
+        max_connections=2,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+@pytest.mark.asyncio
+async def test_launch_posts_instructions_over_one_client():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"status": "success", "run_id": "run-1"})
+
+    dagster = service(handler)
+    await dagster.open()
+    client = dagster.client
+
+    for _ in range(3):
+        result = await dagster.launch([{"operation": "math_block"}])
+        assert result == {"status": "success", "run_id": "run-1"}
+
+    assert dagster.client is client
+    assert [str(request.url) for request in requests] == [EXECUTE_URL] * 3
+    assert json.loads(requests[0].read()) == {
+        "instructions": [{"operation": "math_block"}]
+    }
+
+    await dagster.close()
+    assert dagster.client is None
+
+
+@pytest.mark.asyncio
+async def test_launch_reports_errors_and_timeouts_as_failures():
+    def unavailable(request):
+        return httpx.Response(503, text="webserver starting")
+
+    def timeout(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    result = await service(unavailable).launch([])
+    assert result == {
+        "status": "failure",
+        "message": "Dagster API returned 503: webserver starting",
+        "retryable": True,
+    }
+
+    result = await service(timeout).launch([])
+    assert result["status"] == "failure"
+    assert result["retryable"]
+    assert "ReadTimeout" in result["message"]
+
+
+@pytest.mark.asyncio
+async def test_launch_sends_pipeline_id_and_keeps_rejections_final():
+    requests = []
+
+    def rejected(request):
+        requests.append(request)
+        return httpx.Response(200, json={"status": "failure", "message": "Bad config"})
+
+    result = await service(rejected).launch([], pipeline_id="pipeline-1")
+
+    assert json.loads(requests[0].read()) == {
+        "instructions": [],
+        "pipeline_id": "pipeline-1",
+    }
+    assert result == {"status": "failure", "message": "Bad config", "retryable": False}
@@ -0,0 +1,77 @@
+import pytest
+
+from backend.app.features.core.services.embedding_cache_service import (
+    EmbeddingCacheService,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "embeddings.sqlite3")
+
+
+@pytest.mark.asyncio
+async def test_memory_hit_after_put(db_path):
+    cache = EmbeddingCacheService(model="m", db_path=db_path)
+
+    assert await cache.get("hello") is None
+    await cache.put("hello", [0.1, 0.2], miss_seconds=0.5)
+
+    assert await cache.get("hello") == [0.1, 0.2]
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["saved_openai_calls"] == 1
+    assert stats["estimated_saved_seconds"] == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_persistent_tier_survives_restart(db_path):
+    cache = EmbeddingCacheService(model="m", db_path=db_path)
+    await cache.put("hello", [0.25, 0.5])
+    cache.close()
+
+    restarted = EmbeddingCacheService(model="m", db_path=db_path)
+    assert await restarted.get("hello") == [0.25, 0.5]
+    assert restarted.stats()["persistent_hits"] == 1
+
+    # Promoted into the LRU tier on the first persistent hit
+    assert await restarted.get("hello") == [0.25, 0.5]
+    assert restarted.stats()["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_model_change_invalidates_entries(db_path):
+    cache = EmbeddingCacheService(model="old-model", db_path=db_path)
+    await cache.put("hello", [1.0])
+    cache.close()
+
+    other = EmbeddingCacheService(model="new-model", db_path=db_path)
+    assert await other.get("hello") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_is_lru_bounded():
+    cache = EmbeddingCacheService(model="m", max_memory_entries=2)
+    await cache.put("a", [1.0])
+    await cache.put("b", [2.0])
+    await cache.get("a")
+    await cache.put("c", [3.0])
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == [1.0]
+    assert await cache.get("c") == [3.0]
+
+
+@pytest.mark.asyncio
+async def test_persistent_tier_evicts_by_size(db_path):
+    # Each 4-float embedding is 32 bytes; only two fit
+    cache = EmbeddingCacheService(
+        model="m", db_path=db_path, max_memory_entries=1, max_persistent_bytes=64
+    )
+    for text in ["a", "b", "c"]:
+        await cache.put(text, [1.0, 2.0, 3.0, 4.0])
+
+    assert cache.stats()["persistent_evictions"] == 1
+    assert await cache.get("a") is None
+    assert await cache.get("b") == [1.0, 2.0, 3.0, 4.0]
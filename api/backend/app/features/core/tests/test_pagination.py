@@ -0,0 +1,55 @@
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from backend.app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_order,
+    keyset_where,
+    next_cursor,
+)
+
+
+CREATED_AT = datetime(2024, 11, 5, 12, 30, tzinfo=timezone.utc)
+
+
+def test_cursor_round_trip_is_opaque():
+    token = encode_cursor(CREATED_AT, "b-1")
+
+    assert "b-1" not in token
+    assert decode_cursor(token) == (CREATED_AT, "b-1")
+
+
+def test_invalid_cursor_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_where_breaks_ties_on_id():
+    token = encode_cursor(CREATED_AT, "b-1")
+
+    assert keyset_where(None, "created_at", "block_id") == {}
+    assert keyset_where(token, "created_at", "block_id") == {
+        "OR": [
+            {"created_at": {"gt": CREATED_AT}},
+            {"created_at": CREATED_AT, "block_id": {"gt": "b-1"}},
+        ]
+    }
+    assert keyset_where(token, "timestamp", "log_id", descending=True)["OR"][0] == {
+        "timestamp": {"lt": CREATED_AT}
+    }
+    assert keyset_order("created_at", "block_id", descending=True) == [
+        {"created_at": "desc"},
+        {"block_id": "desc"},
+    ]
+
+
+def test_next_cursor_only_when_extra_row_fetched():
+    rows = [SimpleNamespace(created_at=CREATED_AT, block_id=f"b-{i}") for i in range(3)]
+
+    assert next_cursor(rows, 3, "created_at", "block_id") is None
+    assert decode_cursor(next_cursor(rows, 2, "created_at", "block_id")) == (
+        CREATED_AT,
+        "b-1",
+    )
@@ -0,0 +1,94 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+from backend.app.features.core.controllers.pipeline_controller import (
+    PipelineController,
+)
+
+CONFIG = [{"operation": "deploy_model", "parameters": {"model": "a/model"}}]
+
+
+@pytest.fixture
+def tx():
+    return Mock()
+
+
+@pytest.fixture
+def controller(tx):
+    prisma = Mock()
+    prisma.tx.return_value = MagicMock()
+    prisma.tx.return_value.__aenter__ = AsyncMock(return_value=tx)
+    prisma.tx.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    pipeline_service = Mock()
+    pipeline_service.create_pipeline = AsyncMock(
+        return_value=SimpleNamespace(pipeline_id="pipeline-1")
+    )
+    outbox_service = Mock()
+    outbox_service.enqueue = AsyncMock(
+        return_value=SimpleNamespace(outbox_id="outbox-1")
+    )
+
+    return PipelineController(
+        prisma,
+        pipeline_service=pipeline_service,
+        block_service=Mock(),
+        edge_service=Mock(),
+        audit_service=Mock(),
+        outbox_service=outbox_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_queues_launch_with_the_pipeline(controller, tx):
+    handle = await controller.run_pipeline(CONFIG, uuid4())
+
+    assert handle == {"pipeline_id": "pipeline-1", "status": "pending"}
+    create_pipeline = controller.pipeline_service.create_pipeline
+    stored_in, pipeline_data = create_pipeline.call_args.args
+    assert stored_in is tx
+    assert pipeline_data["status"] == "pending"
+    controller.outbox_service.enqueue.assert_awaited_once_with(tx, "pipeline-1", CONFIG)
+    controller.prisma.tx.assert_called_once()
+    controller.outbox_service.notify.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_enqueue_rolls_back_the_pipeline(controller):
+    controller.outbox_service.enqueue.return_value = None
+
+    assert await controller.run_pipeline(CONFIG, uuid4()) is None
+
+    # The error leaves the transaction, so the pipeline is not stored either
+    exc_type, _, _ = controller.prisma.tx.return_value.__aexit__.call_args.args
+    assert exc_type is ValueError
+    controller.outbox_service.notify.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_without_stored_pipeline(controller):
+    controller.pipeline_service.create_pipeline.return_value = None
+
+    assert await controller.run_pipeline(CONFIG, uuid4()) is None
+    controller.outbox_service.enqueue.assert_not_awaited()
+    controller.outbox_service.notify.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_pipelines_pages_by_offset(controller):
+    pipeline = Mock(pipeline_id="pipeline-2", config={})
+    pipeline.model_dump.return_value = {"pipeline_id": "pipeline-2"}
+    controller.pipeline_service.list_pipelines_page = AsyncMock(
+        return_value=([pipeline], None)
+    )
+    controller.audit_service.log_read = AsyncMock()
+
+    pipelines = await controller.list_pipelines(uuid4(), None, limit=5, offset=20)
+
+    assert pipelines == [{"pipeline_id": "pipeline-2", "config": "{}"}]
+    _, _, limit, cursor, offset = (
+        controller.pipeline_service.list_pipelines_page.call_args.args
+    )
+    assert (limit, cursor, offset) == (5, None, 20)
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from backend.app.features.core.services.pipeline_outbox_service import (
+    PipelineOutboxService,
+)
+
+CONFIG = [{"operation": "deploy_model", "parameters": {"model": "a/model"}}]
+
+
+def entry(number, attempts=1):
+    return {
+        "outbox_id": f"outbox-{number}",
+        "pipeline_id": f"pipeline-{number}",
+        "config": json.dumps(CONFIG),
+        "attempts": attempts,
+    }
+
+
+@pytest.fixture
+def tx():
+    tx = Mock()
+    tx.pipelineoutbox.update = AsyncMock()
+    return tx
+
+
+@pytest.fixture
+def prisma(tx):
+    prisma = Mock()
+    prisma.tx.return_value = MagicMock()
+    prisma.tx.return_value.__aenter__ = AsyncMock(return_value=tx)
+    prisma.tx.return_value.__aexit__ = AsyncMock(return_value=False)
+    prisma.query_raw = AsyncMock(return_value=[])
+    return prisma
+
+
+@pytest.fixture
+def outbox(prisma):
+    dagster_service = Mock()
+    dagster_service.launch = AsyncMock(
+        return_value={"status": "success", "run_id": "run-1"}
+    )
+    pipeline_service = Mock()
+    pipeline_service.update_pipeline = AsyncMock(return_value=SimpleNamespace())
+    service = PipelineOutboxService(
+        dagster_service=dagster_service,
+        pipeline_service=pipeline_service,
+        max_concurrency=2,
+        max_attempts=3,
+        poll_interval=60,
+        retry_backoff=2.0,
+        lease_seconds=300,
+    )
+    service._prisma = prisma
+    return service
+
+
+@pytest.mark.asyncio
+async def test_enqueue_writes_entry_in_callers_transaction(outbox, tx):
+    tx.pipelineoutbox.create = AsyncMock(
+        return_value=SimpleNamespace(outbox_id="outbox-1")
+    )
+
+    assert await outbox.enqueue(tx, "pipeline-1", CONFIG)
+
+    data = tx.pipelineoutbox.create.call_args.kwargs["data"]
+    assert data["pipeline_id"] == "pipeline-1"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_records_run_on_entry_and_pipeline(outbox, tx):
+    assert await outbox.dispatch(entry(1))
+
+    outbox.dagster_service.launch.assert_awaited_once_with(
+        CONFIG, pipeline_id="pipeline-1"
+    )
+    entry_data = tx.pipelineoutbox.update.call_args.kwargs["data"]
+    assert entry_data["status"] == "dispatched"
+    outbox.pipeline_service.update_pipeline.assert_awaited_once_with(
+        tx, "pipeline-1", {"run_id": "run-1", "status": "running"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_retryable_failure_backs_off(outbox, tx):
+    outbox.dagster_service.launch.return_value = {
+        "status": "failure",
+        "message": "Dagster API returned 503: starting",
+        "retryable": True,
+    }
+
+    assert not await outbox.dispatch(entry(1, attempts=2))
+
+    entry_data = tx.pipelineoutbox.update.call_args.kwargs["data"]
+    assert entry_data["status"] == "pending"
+    assert entry_data["last_error"] == "Dagster API returned 503: starting"
+    delay = entry_data["next_attempt_at"] - entry_data["updated_at"]
+    assert 3.9 < delay.total_seconds() <= 4.0
+    outbox.pipeline_service.update_pipeline.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_last_attempt_or_rejection_fails_pipeline(outbox, tx):
+    outbox.dagster_service.launch.return_value = {
+        "status": "failure",
+        "message": "Dagster API unreachable",
+        "retryable": True,
+    }
+    assert not await outbox.dispatch(entry(1, attempts=3))
+
+    outbox.dagster_service.launch.return_value = {
+        "status": "failure",
+        "message": "Invalid config",
+        "retryable": False,
+    }
+    assert not await outbox.dispatch(entry(2, attempts=1))
+
+    assert [
+        call.kwargs["data"]["status"]
+        for call in tx.pipelineoutbox.update.call_args_list
+    ] == ["failed", "failed"]
+    assert outbox.pipeline_service.update_pipeline.await_args_list[1].args == (
+        tx,
+        "pipeline-2",
+        {"status": "failed", "message": "Invalid config"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_limits_launches_in_flight(outbox, prisma):
+    queued = [entry(number) for number in range(5)]
+
+    async def claim(query, limit, lease_seconds):
+        claimed, queued[:] = queued[:limit], queued[limit:]
+        return claimed
+
+    prisma.query_raw.side_effect = claim
+    running = 0
+    peak = 0
+
+    async def launch(config, pipeline_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"status": "success", "run_id": f"run-{pipeline_id}"}
+
+    outbox.dagster_service.launch.side_effect = launch
+
+    await outbox.start(prisma)
+    for _ in range(100):
+        if not queued and not outbox._in_flight:
+            break
+        await asyncio.sleep(0.01)
+    await outbox.stop()
+
+    assert outbox.dagster_service.launch.await_count == 5
+    assert peak == 2
+    assert all(call.args[1] <= 2 for call in prisma.query_raw.call_args_list)
@@ -0,0 +1,141 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from prisma import Prisma
+
+from backend.app import registry as registry_module
+from backend.app.registry import ServiceRegistry
+
+
+@pytest.fixture
+def stub_services(monkeypatch):
+    """
+    Replace every service and controller class with a cheap Mock factory so the
+    registry can be started without a database or an OpenAI key.
+    """
+    for name in [
+        "AuditService",
+        "TaxonomyService",
+        "PaperService",
+        "EdgeService",
+        "PipelineService",
+        "VectorStoreService",
+        "EmbeddingCacheService",
+        "BlockService",
+        "VectorEmbeddingService",
+        "DagsterService",
+        "PipelineOutboxService",
+        "BlockController",
+        "EdgeController",
+        "PipelineController",
+    ]:
+        monkeypatch.setattr(registry_module, name, Mock(name=name))
+    registry_module.VectorStoreService.return_value.open = AsyncMock()
+    registry_module.VectorStoreService.return_value.close = AsyncMock()
+    registry_module.AuditService.return_value.start = AsyncMock()
+    registry_module.AuditService.return_value.stop = AsyncMock()
+    registry_module.DagsterService.return_value.open = AsyncMock()
+    registry_module.DagsterService.return_value.close = AsyncMock()
+    registry_module.PipelineOutboxService.return_value.start = AsyncMock()
+    registry_module.PipelineOutboxService.return_value.stop = AsyncMock()
+    return registry_module
+
+
+def test_startup_builds_each_component_once(stub_services):
+    registry = ServiceRegistry()
+    prisma_mock = Mock(spec=Prisma)
+
+    timings = registry.startup(prisma_mock)
+
+    assert registry.started
+    assert "total" in timings
+    assert "block_service" in timings
+    stub_services.BlockService.assert_called_once()
+
+    # A second startup is a no-op and hands back the same instances
+    block_controller = registry.block_controller
+    registry.startup(prisma_mock)
+    stub_services.BlockService.assert_called_once()
+    assert registry.block_controller is block_controller
+
+
+def test_controllers_share_registry_services(stub_services):
+    registry = ServiceRegistry()
+    prisma_mock = Mock(spec=Prisma)
+
+    registry.startup(prisma_mock)
+
+    _, block_kwargs = stub_services.BlockController.call_args
+    _, pipeline_kwargs = stub_services.PipelineController.call_args
+    assert block_kwargs["block_service"] is registry.block_service
+    assert pipeline_kwargs["block_service"] is registry.block_service
+    assert pipeline_kwargs["audit_service"] is registry.audit_service
+    assert pipeline_kwargs["outbox_service"] is registry.outbox_service
+    _, outbox_kwargs = stub_services.PipelineOutboxService.call_args
+    assert outbox_kwargs["dagster_service"] is registry.dagster_service
+    assert outbox_kwargs["pipeline_service"] is registry.pipeline_service
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_vector_store_pool(stub_services):
+    registry = ServiceRegistry()
+    registry.startup(Mock(spec=Prisma))
+
+    timings = await registry.warm_up()
+
+    registry.vector_store_service.open.assert_awaited_once()
+    registry.audit_service.start.assert_awaited_once_with(registry.prisma)
+    registry.dagster_service.open.assert_awaited_once()
+    registry.outbox_service.start.assert_awaited_once_with(registry.prisma)
+    assert "vector_store_pool" in timings
+    _, block_kwargs = stub_services.BlockService.call_args
+    assert block_kwargs["vector_store"] is registry.vector_store_service
+
+
+@pytest.mark.asyncio
+async def test_ensure_started_warms_up_once(stub_services):
+    registry = ServiceRegistry()
+    prisma_mock = Mock(spec=Prisma)
+
+    await registry.ensure_started(prisma_mock)
+    await registry.ensure_started(prisma_mock)
+
+    assert registry.started
+    assert registry.warmed_up
+    stub_services.BlockService.assert_called_once()
+    registry.audit_service.start.assert_awaited_once_with(prisma_mock)
+    registry.outbox_service.start.assert_awaited_once_with(prisma_mock)
+
+
+@pytest.mark.asyncio
+async def test_get_registry_starts_audit_writer_and_outbox(stub_services, monkeypatch):
+    from backend.app import dependencies
+
+    registry = ServiceRegistry()
+    monkeypatch.setattr(dependencies, "service_registry", registry)
+
+    resolved = await dependencies.get_registry(Mock(spec=Prisma))
+
+    assert resolved is registry
+    registry.audit_service.start.assert_awaited_once()
+    registry.outbox_service.start.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_releases_instances(stub_services):
+    registry = ServiceRegistry()
+    registry.startup(Mock(spec=Prisma))
+    vector_store = registry.vector_store_service
+    audit_service = registry.audit_service
+    dagster_service = registry.dagster_service
+    outbox_service = registry.outbox_service
+
+    await registry.shutdown()
+
+    vector_store.close.assert_awaited_once()
+    audit_service.stop.assert_awaited_once()
+    outbox_service.stop.assert_awaited_once()
+    dagster_service.close.assert_awaited_once()
+    assert not registry.started
+    assert not registry.warmed_up
+    assert registry.block_controller is None
+    assert registry.block_service is None
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from backend.app.features.core.services.vector_embedding_service import (
+    VectorEmbeddingService,
+)
+
+
+def make_service(**kwargs):
+    service = VectorEmbeddingService(api_key="test-key", backoff_base=0, **kwargs)
+    service.text_embedder = Mock()
+    service.document_embedder = Mock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_identical_inflight_texts_share_one_call():
+    service = make_service()
+
+    def slow_run(text):
+        time.sleep(0.05)
+        return {"embedding": [0.1, 0.2]}
+
+    service.text_embedder.run.side_effect = slow_run
+
+    results = await asyncio.gather(
+        *(service.generate_text_embedding("same text") for _ in range(5))
+    )
+
+    assert results == [[0.1, 0.2]] * 5
+    assert service.text_embedder.run.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_call_does_not_block_event_loop():
+    service = make_service()
+    service.text_embedder.run.side_effect = lambda text: (
+        time.sleep(0.2) or {"embedding": [1.0]}
+    )
+
+    embedding_task = asyncio.create_task(service.generate_text_embedding("slow"))
+    started_at = time.perf_counter()
+    await asyncio.sleep(0.01)
+
+    # The loop kept running while the embedding call was in its worker thread
+    assert time.perf_counter() - started_at < 0.1
+    assert await embedding_task == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    service = make_service(max_concurrency=2)
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def run(text):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+        return {"embedding": [0.0]}
+
+    service.text_embedder.run.side_effect = run
+
+    await asyncio.gather(*(service.generate_text_embedding(str(i)) for i in range(6)))
+
+    assert running["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_retried_then_gives_up():
+    service = make_service(timeout=0.01, max_retries=2)
+    service.text_embedder.run.side_effect = lambda text: time.sleep(0.05)
+
+    assert await service.generate_text_embedding("never") is None
+    assert service.text_embedder.run.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_timed_out_call_keeps_its_slot_until_it_finishes():
+    service = make_service(max_concurrency=1, timeout=0.01, max_retries=1)
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def run(text):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.05)
+        with lock:
+            running["now"] -= 1
+
+    service.text_embedder.run.side_effect = run
+
+    await asyncio.gather(*(service.generate_text_embedding(str(i)) for i in range(3)))
+
+    # Abandoned threads still count against the limit
+    assert running["peak"] == 1
+    assert service.text_embedder.run.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_fails_fast():
+    service = make_service(max_retries=3)
+    service.text_embedder.run.side_effect = ValueError("bad input")
+
+    assert await service.generate_text_embedding("bad") is None
+    assert service.text_embedder.run.call_count == 1
@@ -31,6 +31,10 @@ The Constellation API is a FastAPI-based application designed to manage pipeline
   `GET /health`  
   Checks the health status of the API.
 
+- **Embedding Cache Stats:**  
+  `GET /health/embedding-cache`  
+  Reports embedding cache hits, misses and OpenAI calls saved.
+
 - **Pipelines:**  
   CRUD operations for managing pipelines.  
   - `POST /pipelines/`  
@@ -38,18 +42,24 @@ The Constellation API is a FastAPI-based application designed to manage pipeline
   - `PUT /pipelines/{pipeline_id}`  
   - `DELETE /pipelines/{pipeline_id}`  
   - `GET /pipelines/`
+  - `GET /pipelines/paginated/` (keyset pages with `next_cursor`)
   - `POST /pipelines/with-dependencies/`
   - `DELETE /pipelines/with-dependencies/{pipeline_id}`
   - `POST /pipelines/verify/{pipeline_id}`
+  - `POST /pipelines/run` (202 with a pending run handle; launched on Dagster in the background)
 
 - **Blocks:**  
   CRUD operations for managing blocks.  
   - `POST /blocks/`  
+  - `POST /blocks/bulk`  
   - `GET /blocks/{block_id}`  
   - `PUT /blocks/{block_id}`  
   - `DELETE /blocks/{block_id}`  
   - `POST /blocks/search-by-filters/`  
   - `POST /blocks/search-by-vector/`
+  - `GET /blocks/get-all-blocks/` (streamed JSON array)
+  - `GET /blocks/paginated/` (keyset pages with `next_cursor`)
+  - `GET /blocks/stream/` (NDJSON)
 
 - **Edges:**  
   CRUD operations for managing edges.  
@@ -58,6 +68,7 @@ The Constellation API is a FastAPI-based application designed to manage pipeline
   - `PUT /edges/{edge_id}`  
   - `DELETE /edges/{edge_id}`  
   - `GET /edges/`  
+  - `GET /edges/paginated/` (keyset pages with `next_cursor`)
   - `POST /edges/search-by-filters/`  
   - `POST /edges/search-by-vector/`   
 
@@ -70,6 +81,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from backend.app.features.core.routes import blocks, edges, pipelines
 from backend.app.database import connect_db, disconnect_db, prisma_client
+from backend.app.registry import service_registry
 from backend.app.logger import ConstellationLogger
 
 # from backend.app.utils.helpers import SupabaseClientManager
@@ -95,10 +107,14 @@ app.add_middleware(
 @app.on_event("startup")
 async def on_startup():
     await connect_db()
+    # Build long-lived services and controllers once, before the first request
+    service_registry.startup(prisma_client)
+    await service_registry.warm_up()
 
 
 @app.on_event("shutdown")
 async def on_shutdown():
+    await service_registry.shutdown()
     await disconnect_db()
 
 
@@ -128,6 +144,17 @@ async def health_check():
         raise HTTPException(status_code=500, detail="Internal Server Error.")
 
 
+@app.get("/health/embedding-cache", tags=["Health Check"])
+async def embedding_cache_stats():
+    """
+    Reports embedding cache hits, misses and the OpenAI calls saved since startup.
+    """
+    cache = service_registry.embedding_cache_service
+    if cache is None:
+        raise HTTPException(status_code=503, detail="Embedding cache not started.")
+    return cache.stats()
+
+
 def main():
     """
     Main function to launch the FastAPI application using Uvicorn.
@@ -0,0 +1,301 @@
+# app/registry.py
+
+"""
+Service Registry Module
+
+This module implements the application-scoped ServiceRegistry, which owns the long-lived
+instances of every service and controller used by the API routes.
+
+Design Pattern:
+- Singleton Pattern: A single registry (`service_registry`) is shared by the whole process,
+  mirroring the `prisma_client` singleton in database.py.
+- Dependency Injection: Controllers receive the shared service instances instead of
+  constructing their own, and FastAPI dependencies hand out the shared controllers.
+
+Key Design Decisions:
+1. Build Once: BlockService owns a pgvector store with a connection pool and a CrewProcess
+   (a ChatOpenAI-backed agent). These are built at startup rather than per request.
+2. Measured Warm-Up: The construction time of every component is recorded in `startup_timings`
+   and logged, so slow components are visible at boot.
+3. Stateless Sharing: Services keep no per-request state; the Prisma transaction client is
+   passed into every method, so one instance can safely serve concurrent requests.
+4. Async Warm-Up: Connection pools (the pgvector store) are opened in `warm_up`, which the
+   startup hook awaits after `startup`, and closed again in `shutdown`.
+5. Shared Embedding Cache: One EmbeddingCacheService backs VectorEmbeddingService, so its
+   hit/miss counters describe the whole process.
+6. Buffered Audit Writer: The shared AuditService queues READ audit events; its flush task is
+   started in `warm_up` and drained in `shutdown`, before the database disconnects.
+7. Pipeline Outbox: PipelineController queues pipeline runs in the outbox table, and the shared
+   PipelineOutboxService dispatcher launches them through the shared DagsterService client.
+   The dispatcher is started in `warm_up`; `shutdown` waits for its launches in flight before
+   closing the client.
+8. Lazy Start: `ensure_started` runs both `startup` and `warm_up` for callers that reach the
+   registry without the startup hook, so the audit writer and outbox dispatcher always run.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from prisma import Prisma
+
+from backend.app.config import settings
+from backend.app.logger import ConstellationLogger
+from backend.app.features.core.services.audit_service import AuditService
+from backend.app.features.core.services.block_service import BlockService
+from backend.app.features.core.services.dagster_service import DagsterService
+from backend.app.features.core.services.edge_service import EdgeService
+from backend.app.features.core.services.embedding_cache_service import (
+    EmbeddingCacheService,
+)
+from backend.app.features.core.services.paper_service import PaperService
+from backend.app.features.core.services.pipeline_outbox_service import (
+    PipelineOutboxService,
+)
+from backend.app.features.core.services.pipeline_service import PipelineService
+from backend.app.features.core.services.taxonomy_service import TaxonomyService
+from backend.app.features.core.services.vector_embedding_service import (
+    VectorEmbeddingService,
+)
+from backend.app.features.core.services.vector_store_service import (
+    VectorStoreService,
+)
+from backend.app.features.core.controllers.block_controller import BlockController
+from backend.app.features.core.controllers.edge_controller import EdgeController
+from backend.app.features.core.controllers.pipeline_controller import PipelineController
+
+
+class ServiceRegistry:
+    """
+    Owns the process-wide singletons for services and controllers.
+
+    Call `startup` once from the FastAPI startup hook and `shutdown` from the shutdown hook.
+    """
+
+    def __init__(self):
+        self.logger = ConstellationLogger()
+        self.started = False
+        self.warmed_up = False
+        self.startup_timings: Dict[str, float] = {}
+        self._start_lock = asyncio.Lock()
+
+        self.prisma: Optional[Prisma] = None
+
+        self.audit_service: Optional[AuditService] = None
+        self.taxonomy_service: Optional[TaxonomyService] = None
+        self.paper_service: Optional[PaperService] = None
+        self.edge_service: Optional[EdgeService] = None
+        self.pipeline_service: Optional[PipelineService] = None
+        self.vector_store_service: Optional[VectorStoreService] = None
+        self.block_service: Optional[BlockService] = None
+        self.embedding_cache_service: Optional[EmbeddingCacheService] = None
+        self.vector_embedding_service: Optional[VectorEmbeddingService] = None
+        self.dagster_service: Optional[DagsterService] = None
+        self.outbox_service: Optional[PipelineOutboxService] = None
+
+        self.block_controller: Optional[BlockController] = None
+        self.edge_controller: Optional[EdgeController] = None
+        self.pipeline_controller: Optional[PipelineController] = None
+
+    def startup(self, prisma: Prisma) -> Dict[str, float]:
+        """
+        Builds every service and controller once and records how long each one took.
+
+        Args:
+            prisma (Prisma): The shared Prisma client.
+
+        Returns:
+            Dict[str, float]: Construction time in seconds, keyed by component name.
+        """
+        if self.started:
+            return self.startup_timings
+
+        self.prisma = prisma
+        self.startup_timings = {}
+        started_at = time.perf_counter()
+
+        # Services
+        self.audit_service = self._build(
+            "audit_service",
+            lambda: AuditService(buffer_reads=settings.AUDIT_BUFFER_READS),
+        )
+        self.taxonomy_service = self._build("taxonomy_service", TaxonomyService)
+        self.paper_service = self._build("paper_service", PaperService)
+        self.edge_service = self._build("edge_service", EdgeService)
+        self.pipeline_service = self._build("pipeline_service", PipelineService)
+        self.vector_store_service = self._build(
+            "vector_store_service", VectorStoreService
+        )
+        self.block_service = self._build(
+            "block_service",
+            lambda: BlockService(vector_store=self.vector_store_service),
+        )
+        self.embedding_cache_service = self._build(
+            "embedding_cache_service",
+            lambda: EmbeddingCacheService(
+                model=settings.EMBEDDING_MODEL,
+                db_path=settings.EMBEDDING_CACHE_PATH,
+                max_memory_entries=settings.EMBEDDING_CACHE_MEMORY_ENTRIES,
+                max_persistent_bytes=settings.EMBEDDING_CACHE_MAX_BYTES,
+            ),
+        )
+        self.vector_embedding_service = self._build(
+            "vector_embedding_service",
+            lambda: VectorEmbeddingService(
+                cache=self.embedding_cache_service, model=settings.EMBEDDING_MODEL
+            ),
+        )
+        self.dagster_service = self._build("dagster_service", DagsterService)
+        self.outbox_service = self._build(
+            "outbox_service",
+            lambda: PipelineOutboxService(
+                dagster_service=self.dagster_service,
+                pipeline_service=self.pipeline_service,
+            ),
+        )
+
+        # Controllers share the services above
+        self.block_controller = self._build(
+            "block_controller",
+            lambda: BlockController(
+                prisma,
+                block_service=self.block_service,
+                taxonomy_service=self.taxonomy_service,
+                audit_service=self.audit_service,
+                vector_embedding_service=self.vector_embedding_service,
+                paper_service=self.paper_service,
+            ),
+        )
+        self.edge_controller = self._build(
+            "edge_controller",
+            lambda: EdgeController(
+                prisma,
+                edge_service=self.edge_service,
+                audit_service=self.audit_service,
+            ),
+        )
+        self.pipeline_controller = self._build(
+            "pipeline_controller",
+            lambda: PipelineController(
+                prisma,
+                pipeline_service=self.pipeline_service,
+                block_service=self.block_service,
+                edge_service=self.edge_service,
+                audit_service=self.audit_service,
+                outbox_service=self.outbox_service,
+            ),
+        )
+
+        self.started = True
+        self.startup_timings["total"] = time.perf_counter() - started_at
+
+        self.logger.log(
+            "ServiceRegistry",
+            "info",
+            f"Service registry started in {self.startup_timings['total'] * 1000:.1f} ms.",
+            timings_ms={
+                name: round(seconds * 1000, 2)
+                for name, seconds in self.startup_timings.items()
+            },
+        )
+        return self.startup_timings
+
+    async def warm_up(self) -> Dict[str, float]:
+        """
+        Opens the connection pools owned by the registry, recording the time taken, starts
+        the buffered audit writer, opens the dagster API client and starts the pipeline
+        outbox dispatcher.
+
+        Returns:
+            Dict[str, float]: The updated `startup_timings`.
+        """
+        if self.warmed_up:
+            return self.startup_timings
+
+        started_at = time.perf_counter()
+        await self.vector_store_service.open()
+        self.startup_timings["vector_store_pool"] = time.perf_counter() - started_at
+
+        await self.audit_service.start(self.prisma)
+        await self.dagster_service.open()
+        await self.outbox_service.start(self.prisma)
+        self.warmed_up = True
+
+        self.logger.log(
+            "ServiceRegistry",
+            "info",
+            "Service registry warmed up.",
+            vector_store_pool_ms=round(
+                self.startup_timings["vector_store_pool"] * 1000, 2
+            ),
+        )
+        return self.startup_timings
+
+    async def ensure_started(self, prisma: Prisma) -> "ServiceRegistry":
+        """
+        Starts and warms up the registry if the startup hook has not already done so.
+
+        Args:
+            prisma (Prisma): The shared Prisma client.
+
+        Returns:
+            ServiceRegistry: The started registry.
+        """
+        if self.warmed_up:
+            return self
+        # Concurrent first requests must not warm up twice
+        async with self._start_lock:
+            self.startup(prisma)
+            await self.warm_up()
+        return self
+
+    async def shutdown(self) -> None:
+        """
+        Closes the connection pools and releases the shared instances so a later
+        `startup` rebuilds them.
+        """
+        if self.outbox_service is not None:
+            # Let pipeline launches in flight record their run IDs
+            await self.outbox_service.stop()
+        if self.dagster_service is not None:
+            await self.dagster_service.close()
+        if self.audit_service is not None:
+            # Write the queued READ audit events while the database is still connected
+            await self.audit_service.stop()
+        if self.vector_store_service is not None:
+            await self.vector_store_service.close()
+        if self.embedding_cache_service is not None:
+            self.embedding_cache_service.close()
+
+        self.block_controller = None
+        self.edge_controller = None
+        self.pipeline_controller = None
+
+        self.audit_service = None
+        self.taxonomy_service = None
+        self.paper_service = None
+        self.edge_service = None
+        self.pipeline_service = None
+        self.vector_store_service = None
+        self.block_service = None
+        self.embedding_cache_service = None
+        self.vector_embedding_service = None
+        self.dagster_service = None
+        self.outbox_service = None
+
+        self.prisma = None
+        self.started = False
+        self.warmed_up = False
+        self.logger.log("ServiceRegistry", "info", "Service registry shut down.")
+
+    def _build(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Calls `factory` and records its construction time under `name`.
+        """
+        started_at = time.perf_counter()
+        instance = factory()
+        self.startup_timings[name] = time.perf_counter() - started_at
+        return instance
+
+
+service_registry = ServiceRegistry()
@@ -11,6 +11,7 @@ from prisma.enums import (
     AuditEntityTypeEnum,
     VerificationStatusEnum,
 )
+from prisma.partials import PipelineBasicInfoWithID
 
 
 # -------------------
@@ -77,6 +78,65 @@ class BlockResponseSchema(BaseModel):
         orm_mode = True
 
 
+class BlockSummarySchema(BaseModel):
+    block_id: UUID
+    name: str
+    block_type: BlockTypeEnum
+    description: Optional[str] = None
+    filepath: Optional[str] = None
+
+    class Config:
+        orm_mode = True
+
+
+class BlockSearchResultSchema(BlockSummarySchema):
+    score: Optional[float] = Field(
+        None, description="Similarity score of the block for the search query."
+    )
+
+
+class BlockPageSchema(BaseModel):
+    items: List[BlockSummarySchema] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page; null on the last page."
+    )
+
+
+class BlockBulkCreateItemSchema(BaseModel):
+    name: str = Field(..., description="Unique name of the block.")
+    block_type: BlockTypeEnum = Field(
+        ..., description="Type of the block (dataset, model or paper)."
+    )
+    description: Optional[str] = Field(None, description="Description of the block.")
+    filepath: Optional[str] = Field(None, description="Path of the block's code.")
+    content: Optional[str] = Field(
+        None, description="Text to embed. Paper blocks embed their abstract instead."
+    )
+    taxonomy: Optional[Dict[str, Any]] = Field(
+        None, description="Nested taxonomy with 'general' and 'specific' categories."
+    )
+    pdf_url: Optional[str] = Field(None, description="URL of the paper's PDF.")
+    title: Optional[str] = Field(None, description="Title of the paper.")
+    abstract: Optional[str] = Field(None, description="Abstract of the paper.")
+
+
+class BlockBulkCreatedSchema(BaseModel):
+    index: int = Field(..., description="Position of the item in the request.")
+    block_id: UUID
+    name: str
+
+
+class BlockBulkCreateFailureSchema(BaseModel):
+    index: int = Field(..., description="Position of the item in the request.")
+    name: Optional[str] = None
+    error: str
+
+
+class BlockBulkCreateResponseSchema(BaseModel):
+    created: List[BlockBulkCreatedSchema] = Field(default_factory=list)
+    failed: List[BlockBulkCreateFailureSchema] = Field(default_factory=list)
+
+
 # -------------------
 # Edge Schemas
 # -------------------
@@ -115,6 +175,25 @@ class EdgeResponseSchema(BaseModel):
         orm_mode = True
 
 
+class EdgePageSchema(BaseModel):
+    items: List[EdgeResponseSchema] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page; null on the last page."
+    )
+
+
+# -------------------
+# Pipeline Schemas
+# -------------------
+
+
+class PipelinePageSchema(BaseModel):
+    items: List[PipelineBasicInfoWithID] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page; null on the last page."
+    )
+
+
 # -------------------
 # Edge Verification Schemas
 # -------------------
@@ -0,0 +1,141 @@
+"""
+Benchmark: deep-page latency of OFFSET vs keyset pagination on AuditLog.
+
+Seeds a local Postgres with `--rows` audit rows (1M by default) for a dedicated
+benchmark user, then times one page at increasing depths with the old `skip/take`
+query and with `AuditService.list_audit_logs_page`. OFFSET latency grows with the
+depth; keyset latency should stay flat thanks to the (user_id, timestamp, log_id)
+index.
+
+Requires DATABASE_URL pointing at a database with the current schema applied
+(`prisma db push`).
+
+Usage:
+    python -m backend.app.scripts.benchmark_audit_pagination --rows 1000000
+    python -m backend.app.scripts.benchmark_audit_pagination --skip-seed --cleanup
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from prisma import Prisma
+
+from backend.app.features.core.services.audit_service import AuditService
+from backend.app.utils.pagination import encode_cursor
+
+BENCHMARK_USER_ID = "00000000-0000-4000-8000-00000000a0d1"
+
+SEED_QUERY = """
+INSERT INTO "AuditLog" (log_id, user_id, action_type, entity_type, entity_id, timestamp, details)
+SELECT uuid_generate_v4(), $1::uuid, 'READ'::"ActionTypeEnum", 'block'::"AuditEntityTypeEnum",
+       uuid_generate_v4(), now() - (n * interval '1 millisecond'), '{}'::jsonb
+FROM generate_series($2::int, $3::int) AS n
+"""
+
+
+async def seed(prisma: Prisma, rows: int, batch_size: int) -> None:
+    existing = await prisma.auditlog.count(where={"user_id": BENCHMARK_USER_ID})
+    start = time.perf_counter()
+    for first in range(existing + 1, rows + 1, batch_size):
+        last = min(first + batch_size - 1, rows)
+        await prisma.execute_raw(SEED_QUERY, BENCHMARK_USER_ID, first, last)
+        print(f"\rseeded {last:,}/{rows:,} rows", end="", flush=True)
+    if existing < rows:
+        print(f"\nseeding took {time.perf_counter() - start:.1f} s")
+    await prisma.execute_raw('ANALYZE "AuditLog"')
+
+
+async def measure(fn: Callable[[], Awaitable[List]], iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples: List[float]) -> str:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50={statistics.median(samples):9.2f} ms  p99={p99:9.2f} ms"
+
+
+async def run(args: argparse.Namespace) -> None:
+    prisma = Prisma()
+    await prisma.connect()
+    audit_service = AuditService()
+    filters = {"user_id": BENCHMARK_USER_ID}
+    order = [{"timestamp": "desc"}, {"log_id": "desc"}]
+
+    try:
+        if not args.skip_seed:
+            await seed(prisma, args.rows, args.batch_size)
+
+        print(f"\npage size {args.page_size}, {args.iterations} iterations per depth")
+        print(f"{'depth':>10}  {'offset (skip/take)':<36}{'keyset (cursor)':<36}")
+        for depth in args.depths:
+            if depth >= args.rows:
+                continue
+
+            async def offset_page():
+                # The pre-keyset query, kept here as the baseline
+                return await prisma.auditlog.find_many(
+                    where=filters, order=order, skip=depth, take=args.page_size
+                )
+
+            cursor = None
+            if depth:
+                previous = await prisma.auditlog.find_many(
+                    where=filters, order=order, skip=depth - 1, take=1
+                )
+                cursor = encode_cursor(previous[0].timestamp, previous[0].log_id)
+
+            async def keyset_page():
+                page = await audit_service.list_audit_logs_page(
+                    prisma, filters, args.page_size, cursor
+                )
+                return page[0]
+
+            # Both strategies must return the same rows
+            expected = [log.log_id for log in await offset_page()]
+            assert [log.log_id for log in await keyset_page()] == expected
+
+            offset_samples = await measure(offset_page, args.iterations)
+            keyset_samples = await measure(keyset_page, args.iterations)
+            print(
+                f"{depth:>10,}  {summarize(offset_samples):<36}"
+                f"{summarize(keyset_samples):<36}"
+            )
+    finally:
+        if args.cleanup:
+            deleted = await prisma.auditlog.delete_many(where=filters)
+            print(f"\nremoved {deleted:,} benchmark rows")
+        await prisma.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--depths",
+        type=int,
+        nargs="+",
+        default=[0, 1_000, 10_000, 100_000, 500_000, 900_000],
+    )
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="Reuse rows from a previous run."
+    )
+    parser.add_argument(
+        "--cleanup", action="store_true", help="Delete the benchmark rows afterwards."
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: database round trips for vector search hydration.
+
+Compares the old per-hit hydration (one `get_block_by_id` per retriever hit) with
+`BlockService.hydrate_blocks` (one `find_many` for all hits). The database is a stub
+that counts round trips and sleeps a fixed latency per call, so no Postgres is needed.
+
+Usage:
+    python -m backend.app.scripts.benchmark_block_hydration --top-k 50 --latency-ms 2
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import Mock
+from uuid import uuid4
+
+from backend.app.features.core.services.block_service import BlockService
+
+
+class StubBlockTable:
+    """Stands in for `tx.block`, counting every query as one round trip."""
+
+    def __init__(self, blocks: Dict[str, Any], latency: float):
+        self.blocks = blocks
+        self.latency = latency
+        self.round_trips = 0
+
+    async def find_unique(self, where: Dict[str, Any], include=None):
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        return self.blocks.get(where["block_id"])
+
+    async def find_many(self, where: Dict[str, Any], include=None):
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        return [self.blocks[i] for i in where["block_id"]["in"] if i in self.blocks]
+
+
+class StubVectorStore:
+    def __init__(self, block_ids: List[str]):
+        self.block_ids = block_ids
+
+    async def search(self, query_vector, top_k):
+        return [
+            (block_id, 1.0 - rank / 100)
+            for rank, block_id in enumerate(self.block_ids[:top_k])
+        ]
+
+
+async def per_hit_hydration(service: BlockService, tx, query_vector, top_k):
+    # The pre-batching implementation, kept here as the baseline
+    ranked = await service.vector_store.search(query_vector, top_k)
+    return [await service.get_block_by_id(tx, block_id) for block_id, _ in ranked]
+
+
+async def run(top_k: int, latency_ms: float) -> None:
+    block_ids = [str(uuid4()) for _ in range(top_k)]
+    blocks = {
+        block_id: SimpleNamespace(block_id=block_id, name=f"block-{i}", paper=None)
+        for i, block_id in enumerate(block_ids)
+    }
+    service = BlockService(vector_store=StubVectorStore(block_ids), crew=Mock())
+    query_vector = [0.0] * 1536
+
+    for label, search in [
+        ("before (per-hit find_unique)", per_hit_hydration),
+        ("after (batched find_many)", BlockService.search_blocks_by_vector_similarity),
+    ]:
+        table = StubBlockTable(blocks, latency_ms / 1000)
+        tx = SimpleNamespace(block=table)
+        start = time.perf_counter()
+        results = await search(service, tx, query_vector, top_k)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(
+            f"{label:<30} results={len(results):4d}  "
+            f"round_trips={table.round_trips:4d}  elapsed={elapsed:8.2f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.top_k, args.latency_ms))
+
+
+if __name__ == "__main__":
+    main()
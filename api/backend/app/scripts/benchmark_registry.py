@@ -0,0 +1,75 @@
+"""
+Benchmark: per-request controller overhead, before and after the ServiceRegistry.
+
+"Before" builds a BlockController and a PipelineController per request, as the old
+`get_block_controller` / `get_pipeline_controller` dependencies did. "After" resolves the
+shared instances from the registry. The registry's one-off warm-up cost is reported too.
+
+Requires DATABASE_URL and OPENAI_API_KEY in the environment (no queries are issued).
+
+Usage:
+    python -m backend.app.scripts.benchmark_registry --iterations 50
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from backend.app.database import prisma_client
+from backend.app.dependencies import get_block_controller, get_pipeline_controller
+from backend.app.features.core.controllers.block_controller import BlockController
+from backend.app.features.core.controllers.pipeline_controller import PipelineController
+from backend.app.registry import ServiceRegistry, service_registry
+
+
+def measure(fn: Callable[[], None], iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<28} mean={statistics.mean(samples):9.3f} ms  "
+        f"p50={statistics.median(samples):9.3f} ms  p99={p99:9.3f} ms"
+    )
+
+
+def per_request_construction() -> None:
+    BlockController(prisma_client)
+    PipelineController(prisma_client)
+
+
+def per_request_registry() -> None:
+    get_block_controller(service_registry)
+    get_pipeline_controller(service_registry)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    warmup = ServiceRegistry().startup(prisma_client)
+    print("Registry warm-up (one-off):")
+    for name, seconds in warmup.items():
+        print(f"  {name:<28} {seconds * 1000:9.3f} ms")
+
+    service_registry.startup(prisma_client)
+
+    print(f"\nPer-request overhead over {args.iterations} requests:")
+    report(
+        "before (construct per call)",
+        measure(per_request_construction, args.iterations),
+    )
+    report("after (registry lookup)", measure(per_request_registry, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
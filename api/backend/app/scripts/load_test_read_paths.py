@@ -0,0 +1,199 @@
+"""
+Load test: read endpoints with and without interactive transactions.
+
+Drives the read endpoints of a running API (backed by a local Postgres) at increasing
+concurrency levels and reports throughput, p50/p99 latency and errors per level. The
+highest level that stays under the error and p99 budgets is reported as the maximum
+sustained concurrency.
+
+Run the API twice, once per mode, and compare:
+
+    READ_QUERIES_IN_TRANSACTION=true  uvicorn backend.app.main:app --port 8081
+    python -m backend.app.scripts.load_test_read_paths --user-id <uuid> \
+        --output before.json
+
+    READ_QUERIES_IN_TRANSACTION=false uvicorn backend.app.main:app --port 8081
+    python -m backend.app.scripts.load_test_read_paths --user-id <uuid> \
+        --output after.json
+
+    python -m backend.app.scripts.load_test_read_paths --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def build_requests(user_id: str, block_id: Optional[str]) -> List[Dict[str, Any]]:
+    """The read paths exercised, issued round-robin by every worker."""
+    params = {"user_id": user_id}
+    requests = [
+        {"method": "GET", "url": "/blocks/get-all-blocks/", "params": params},
+        {"method": "GET", "url": "/pipelines/", "params": params},
+        {
+            "method": "POST",
+            "url": "/blocks/search-by-filters/",
+            "params": params,
+            "json": {},
+        },
+    ]
+    if block_id:
+        requests.append(
+            {"method": "GET", "url": f"/blocks/{block_id}", "params": params}
+        )
+    return requests
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    requests: List[Dict[str, Any]],
+    concurrency: int,
+    duration: float,
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(offset: int) -> None:
+        nonlocal errors
+        i = offset
+        while time.perf_counter() < deadline:
+            request = requests[i % len(requests)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                response = await client.request(**request)
+                if response.status_code >= 500:
+                    errors += 1
+                    continue
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    ordered = sorted(latencies)
+    total = len(latencies) + errors
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "throughput_rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(ordered) if ordered else 0.0,
+        "p99_ms": percentile(ordered, 0.99),
+        "error_rate": errors / total if total else 1.0,
+    }
+
+
+def max_sustained(levels: List[Dict[str, Any]], p99_budget: float, error_budget: float):
+    sustained = [
+        level["concurrency"]
+        for level in levels
+        if level["p99_ms"] <= p99_budget and level["error_rate"] <= error_budget
+    ]
+    return max(sustained) if sustained else 0
+
+
+def format_level(level: Dict[str, Any]) -> str:
+    return (
+        f"c={level['concurrency']:4d}  rps={level['throughput_rps']:8.1f}  "
+        f"p50={level['p50_ms']:8.2f} ms  p99={level['p99_ms']:8.2f} ms  "
+        f"errors={level['error_rate'] * 100:5.1f}%"
+    )
+
+
+def print_levels(label: str, result: Dict[str, Any]) -> None:
+    sustained = result["max_sustained_concurrency"]
+    print(f"{label}  (max sustained concurrency: {sustained})")
+    for level in result["levels"]:
+        print(f"  {format_level(level)}")
+
+
+def compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    print_levels(f"before ({before_path})", before)
+    print_levels(f"after  ({after_path})", after)
+
+    after_levels = {level["concurrency"]: level for level in after["levels"]}
+    print("\nconcurrency   p50 before/after (ms)     p99 before/after (ms)")
+    for level in before["levels"]:
+        other = after_levels.get(level["concurrency"])
+        if other is None:
+            continue
+        print(
+            f"  {level['concurrency']:6d}"
+            f"   {level['p50_ms']:9.2f} / {other['p50_ms']:<9.2f}"
+            f"   {level['p99_ms']:9.2f} / {other['p99_ms']:<9.2f}"
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    requests = build_requests(args.user_id, args.block_id)
+    limits = httpx.Limits(max_connections=max(args.levels))
+    async with httpx.AsyncClient(
+        base_url=args.base_url, timeout=args.timeout, limits=limits
+    ) as client:
+        levels = []
+        for concurrency in args.levels:
+            level = await run_level(client, requests, concurrency, args.duration)
+            levels.append(level)
+            print(format_level(level))
+
+    result = {
+        "base_url": args.base_url,
+        "levels": levels,
+        "max_sustained_concurrency": max_sustained(
+            levels, args.p99_budget_ms, args.error_budget
+        ),
+    }
+    print(f"max sustained concurrency: {result['max_sustained_concurrency']}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8081")
+    parser.add_argument("--user-id", help="UUID passed to the read endpoints.")
+    parser.add_argument("--block-id", help="Existing block for GET /blocks/{id}.")
+    parser.add_argument(
+        "--levels", type=int, nargs="+", default=[1, 4, 16, 32, 64, 128]
+    )
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--p99-budget-ms", type=float, default=500.0)
+    parser.add_argument("--error-budget", type=float, default=0.01)
+    parser.add_argument("--output", help="Write the results as JSON to this path.")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two runs."
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if not args.user_id:
+        parser.error("--user-id is required unless --compare is given")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """
+    Encodes the keyset position of a row as an opaque, URL-safe token.
+
+    Args:
+        sort_value (datetime): The row's value of the sort column (e.g. created_at).
+        row_id (str): The row's primary key, which breaks ties between equal sort values.
+
+    Returns:
+        str: The cursor token.
+    """
+    payload = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[datetime, str]:
+    """
+    Decodes a token produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), str(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+def keyset_where(
+    cursor: Optional[str],
+    sort_field: str,
+    id_field: str,
+    descending: bool = False,
+) -> Dict[str, Any]:
+    """
+    Builds the Prisma `where` clause selecting the rows after `cursor` in
+    (sort_field, id_field) order.
+
+    Args:
+        cursor (Optional[str]): Token of the last row of the previous page, or None.
+        sort_field (str): The sort column, e.g. "created_at".
+        id_field (str): The primary key column, e.g. "block_id".
+        descending (bool): Whether the page is ordered newest first.
+
+    Returns:
+        Dict[str, Any]: The where clause; empty for the first page.
+    """
+    if not cursor:
+        return {}
+    sort_value, row_id = decode_cursor(cursor)
+    op = "lt" if descending else "gt"
+    return {
+        "OR": [
+            {sort_field: {op: sort_value}},
+            {sort_field: sort_value, id_field: {op: row_id}},
+        ]
+    }
+
+
+def keyset_order(
+    sort_field: str, id_field: str, descending: bool = False
+) -> List[Dict[str, str]]:
+    """
+    Returns the Prisma `order` matching `keyset_where`.
+    """
+    direction = "desc" if descending else "asc"
+    return [{sort_field: direction}, {id_field: direction}]
+
+
+def next_cursor(
+    rows: List[Any], limit: int, sort_field: str, id_field: str
+) -> Optional[str]:
+    """
+    Returns the cursor of the next page, given `limit + 1` fetched rows.
+
+    The extra row only signals that another page exists; callers drop it from the
+    page they return.
+    """
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(getattr(last, sort_field), getattr(last, id_field))
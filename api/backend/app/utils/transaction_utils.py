@@ -0,0 +1,23 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from prisma import Prisma
+
+from backend.app.config import settings
+
+
+@asynccontextmanager
+async def read_session(prisma: Prisma) -> AsyncIterator[Prisma]:
+    """
+    Yields the client that read-only controller paths should query with.
+
+    By default this is the shared client itself. Reads are independent statements, so
+    an interactive transaction only adds BEGIN/COMMIT round trips through the query
+    engine and pins a connection for the whole request. Set
+    READ_QUERIES_IN_TRANSACTION=true to wrap reads in `prisma.tx()` again.
+    """
+    if settings.READ_QUERIES_IN_TRANSACTION:
+        async with prisma.tx() as tx:
+            yield tx
+    else:
+        yield prisma
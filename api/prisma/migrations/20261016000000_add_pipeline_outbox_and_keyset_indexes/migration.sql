@@ -0,0 +1,41 @@
+-- CreateTable
+CREATE TABLE "PipelineOutbox" (
+    "outbox_id" UUID NOT NULL DEFAULT uuid_generate_v4(),
+    "pipeline_id" UUID NOT NULL,
+    "config" JSONB NOT NULL,
+    "status" VARCHAR(20) NOT NULL DEFAULT 'pending',
+    "attempts" INTEGER NOT NULL DEFAULT 0,
+    "next_attempt_at" TIMESTAMPTZ(6) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "last_error" TEXT,
+    "created_at" TIMESTAMPTZ(6) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMPTZ(6) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "PipelineOutbox_pkey" PRIMARY KEY ("outbox_id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "PipelineOutbox_pipeline_id_key" ON "PipelineOutbox"("pipeline_id");
+
+-- CreateIndex
+CREATE INDEX "idx_pipeline_outbox_status_next_attempt_at" ON "PipelineOutbox"("status", "next_attempt_at");
+
+-- CreateIndex
+CREATE INDEX "idx_audit_log_timestamp_log_id" ON "AuditLog"("timestamp", "log_id");
+
+-- CreateIndex
+CREATE INDEX "idx_audit_log_user_id_timestamp_log_id" ON "AuditLog"("user_id", "timestamp", "log_id");
+
+-- CreateIndex
+CREATE INDEX "idx_block_created_at_block_id" ON "Block"("created_at", "block_id");
+
+-- CreateIndex
+CREATE INDEX "idx_edge_created_at_edge_id" ON "Edge"("created_at", "edge_id");
+
+-- CreateIndex
+CREATE INDEX "idx_pipeline_created_at_pipeline_id" ON "Pipeline"("created_at", "pipeline_id");
+
+-- CreateIndex
+CREATE INDEX "idx_pipeline_user_id_created_at_pipeline_id" ON "Pipeline"("user_id", "created_at", "pipeline_id");
+
+-- AddForeignKey
+ALTER TABLE "PipelineOutbox" ADD CONSTRAINT "fk_pipelineoutbox_pipeline" FOREIGN KEY ("pipeline_id") REFERENCES "Pipeline"("pipeline_id") ON DELETE CASCADE ON UPDATE NO ACTION;
@@ -1,10 +1,46 @@
 from fastapi import FastAPI, HTTPException, Request
-import requests
+import httpx
+import os
 import uuid
 
+from orchestrator.assets.repository import plan_launch
+
 app = FastAPI()
 
-DAGSTER_GRAPHQL_URL = "http://dagster_webserver:3000/graphql"
+DAGSTER_GRAPHQL_URL = os.getenv(
+    "DAGSTER_GRAPHQL_URL", "http://dagster_webserver:3000/graphql"
+)
+# Launches go through one pooled async client, so a slow webserver never blocks the
+# event loop, and give up after DAGSTER_GRAPHQL_TIMEOUT seconds
+DAGSTER_GRAPHQL_TIMEOUT = float(os.getenv("DAGSTER_GRAPHQL_TIMEOUT", "30"))
+DAGSTER_GRAPHQL_MAX_CONNECTIONS = int(
+    os.getenv("DAGSTER_GRAPHQL_MAX_CONNECTIONS", "20")
+)
+
+# Runs launched for a stored pipeline carry its ID in this tag, so a repeated launch of
+# the same pipeline (a retry after a timeout) finds the earlier run instead of starting
+# another
+PIPELINE_ID_TAG = "constellation/pipeline_id"
+
+graphql_client = None
+
+
+@app.on_event("startup")
+async def on_startup():
+    global graphql_client
+
+    graphql_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(DAGSTER_GRAPHQL_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=DAGSTER_GRAPHQL_MAX_CONNECTIONS,
+            max_keepalive_connections=DAGSTER_GRAPHQL_MAX_CONNECTIONS,
+        ),
+    )
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await graphql_client.aclose()
 
 
 @app.post("/execute")
@@ -13,36 +49,48 @@ async def run_dagster_job_with_config(request: Request):
     Run a Dagster job with a specific config for ops.
     """
     # Parse the request body
-    instructions = await request.json()
-    instructions = instructions.get("instructions")
+    body = await request.json()
+    instructions = body.get("instructions")
+    pipeline_id = body.get("pipeline_id")
 
     if not instructions or not isinstance(instructions, list):
         raise HTTPException(status_code=400, detail="No instructions provided")
 
-    # Generate a unique ID for the job
-    unique_id = str(uuid.uuid4())
-
-    # Define the custom configuration for the ops
-    job_config = {
-        "ops": {
-            "generate_dynamic_job_configs": {
-                "config": {"raw_input": instructions, "unique_id": unique_id}
-            }
-        }
-    }
+    if pipeline_id:
+        # The pipeline ID doubles as the job's unique ID
+        unique_id = str(pipeline_id)
+        try:
+            if await find_pipeline_run(unique_id):
+                return {"status": "success", "run_id": unique_id}
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    else:
+        # Generate a unique ID for the job
+        unique_id = str(uuid.uuid4())
+
+    # Instructions shaped like a template launch its precompiled job by name
+    try:
+        job_name, job_config = plan_launch(instructions, unique_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Define the GraphQL mutation for launching the job with config
     graphql_query = {
         "query": """
-        mutation($runConfig: RunConfigData) {
+        mutation(
+            $jobName: String!,
+            $runConfig: RunConfigData,
+            $executionMetadata: ExecutionMetadata
+        ) {
             launchPipelineExecution(
                 executionParams: {
                     selector: {
-                        pipelineName: "build_execute_job",
+                        pipelineName: $jobName,
                         repositoryLocationName: "constellation",
                         repositoryName: "main"
                     },
                     runConfigData: $runConfig,
+                    executionMetadata: $executionMetadata,
                     mode: "default"
                 }
             ) {
@@ -61,13 +109,19 @@ async def run_dagster_job_with_config(request: Request):
         }
         """,
         "variables": {
-            "runConfig": job_config  # Pass the custom job config to the GraphQL query
+            "jobName": job_name,
+            "runConfig": job_config,  # Pass the custom job config to the GraphQL query
+            "executionMetadata": {
+                "tags": [{"key": PIPELINE_ID_TAG, "value": unique_id}]
+                if pipeline_id
+                else []
+            },
         },
     }
 
     # Send a POST request to the Dagster GraphQL API
     try:
-        response = requests.post(DAGSTER_GRAPHQL_URL, json=graphql_query)
+        response = await graphql_client.post(DAGSTER_GRAPHQL_URL, json=graphql_query)
         response_data = response.json()
 
         # Check if the job was successfully launched
@@ -92,6 +146,37 @@ async def run_dagster_job_with_config(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def find_pipeline_run(pipeline_id):
+    """
+    Returns the ID of a run already launched for the pipeline, or None.
+    """
+    graphql_query = {
+        "query": """
+        query($filter: RunsFilter) {
+            runsOrError(filter: $filter, limit: 1) {
+                __typename
+                ... on Runs {
+                    results {
+                        runId
+                    }
+                }
+                ... on PythonError {
+                    message
+                }
+            }
+        }
+        """,
+        "variables": {
+            "filter": {"tags": [{"key": PIPELINE_ID_TAG, "value": pipeline_id}]}
+        },
+    }
+    response = await graphql_client.post(DAGSTER_GRAPHQL_URL, json=graphql_query)
+    runs = response.json()["data"]["runsOrError"]
+    if runs["__typename"] != "Runs":
+        raise RuntimeError(runs.get("message", "Failed to look up pipeline runs"))
+    return runs["results"][0]["runId"] if runs["results"] else None
+
+
 import uvicorn
 
 
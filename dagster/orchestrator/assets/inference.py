@@ -0,0 +1,231 @@
+import base64
+import mmap
+import os
+import struct
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# model_inference sends files to model_api in batches whose size adapts to the observed
+# latency, with up to INFERENCE_MAX_IN_FLIGHT batches outstanding over one pooled
+# session. Batch outputs are returned in input order whatever order they complete in,
+# and run_per_item flattens them to one output per file.
+
+# Files go over the wire as a length-prefixed frame stream (each file's raw bytes
+# preceded by its length as a 4-byte big-endian integer) rather than base64 in JSON.
+# A server that answers 415/422 to frames gets base64 JSON for the rest of the run.
+FRAMES_CONTENT_TYPE = "application/x-constellation-frames"
+
+INFERENCE_BATCH_SIZE = int(os.getenv("INFERENCE_BATCH_SIZE", "8"))
+INFERENCE_MAX_BATCH_SIZE = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "64"))
+INFERENCE_MAX_BATCH_BYTES = int(
+    os.getenv("INFERENCE_MAX_BATCH_BYTES", str(8 * 1024 * 1024))
+)
+INFERENCE_TARGET_LATENCY = float(os.getenv("INFERENCE_TARGET_LATENCY", "2.0"))
+INFERENCE_MAX_IN_FLIGHT = int(os.getenv("INFERENCE_MAX_IN_FLIGHT", "4"))
+INFERENCE_RETRIES = int(os.getenv("INFERENCE_RETRIES", "3"))
+INFERENCE_TIMEOUT = float(os.getenv("INFERENCE_TIMEOUT", "300"))
+INFERENCE_ENCODING = os.getenv("INFERENCE_ENCODING", "frames")
+
+
+def encoded_size(path: str) -> int:
+    """Size of the file in the larger (base64 JSON) encoding."""
+    return (os.path.getsize(path) + 2) // 3 * 4
+
+
+def encode_frames(items: List[Union[bytes, mmap.mmap]]) -> bytes:
+    return b"".join(struct.pack(">I", len(item)) + item for item in items)
+
+
+def decode_frames(body: bytes) -> List[bytes]:
+    items = []
+    offset = 0
+    while offset < len(body):
+        if offset + 4 > len(body):
+            raise ValueError("Truncated frame header")
+        (length,) = struct.unpack_from(">I", body, offset)
+        offset += 4
+        if offset + length > len(body):
+            raise ValueError("Truncated frame")
+        items.append(body[offset : offset + length])
+        offset += length
+    return items
+
+
+def pooled_session(max_in_flight: int = INFERENCE_MAX_IN_FLIGHT) -> requests.Session:
+    """A session whose connection pool holds one keep-alive connection per batch."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_in_flight)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class AdaptiveBatchSizer:
+    """
+    Picks how many files go into the next batch.
+
+    A batch never exceeds `max_bytes` of encoded payload (but always holds at least one
+    file). Its item count grows by half while full batches come back well under
+    `target_latency`, and halves when one comes back over it.
+    """
+
+    def __init__(
+        self,
+        initial: int = INFERENCE_BATCH_SIZE,
+        max_size: int = INFERENCE_MAX_BATCH_SIZE,
+        max_bytes: int = INFERENCE_MAX_BATCH_BYTES,
+        target_latency: float = INFERENCE_TARGET_LATENCY,
+    ):
+        self.size = max(1, min(initial, max_size))
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.target_latency = target_latency
+        self.lock = threading.Lock()
+
+    def take(self, paths: List[str], start: int) -> int:
+        """Returns the end index of the batch that starts at `start`."""
+        end = start
+        total = 0
+        while end < len(paths) and end - start < self.size:
+            total += encoded_size(paths[end])
+            if total > self.max_bytes and end > start:
+                break
+            end += 1
+        return end
+
+    def record(self, batch_size: int, latency: float) -> None:
+        with self.lock:
+            if latency > self.target_latency:
+                self.size = max(1, self.size // 2)
+            elif latency < self.target_latency / 2 and batch_size >= self.size:
+                self.size = min(self.max_size, self.size + max(1, self.size // 2))
+
+
+class BatchInferenceClient:
+    """
+    Posts files to an inference endpoint in adaptive batches.
+
+    At most `max_in_flight` batches are outstanding at once; each is retried up to
+    `retries` times with exponential backoff on connection errors, timeouts, 429s and
+    5xx responses. `load` reads a path's raw bytes, which are sent with `encoding`
+    ("frames" or "json").
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        load: Callable[[str], Union[bytes, mmap.mmap]],
+        session: Optional[requests.Session] = None,
+        sizer: Optional[AdaptiveBatchSizer] = None,
+        max_in_flight: int = INFERENCE_MAX_IN_FLIGHT,
+        retries: int = INFERENCE_RETRIES,
+        backoff: float = 0.5,
+        timeout: float = INFERENCE_TIMEOUT,
+        encoding: str = INFERENCE_ENCODING,
+        log: Optional[Any] = None,
+    ):
+        self.endpoint = endpoint
+        self.load = load
+        self.session = session or pooled_session(max_in_flight)
+        self.sizer = sizer or AdaptiveBatchSizer()
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.encoding = encoding
+        self.log = log
+
+    def run(self, paths: List[str]) -> List[Any]:
+        """Returns the output of every batch, in input order."""
+        outputs: Dict[int, Any] = {}
+        in_flight = {}
+        start = 0
+        submitted = 0
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            while start < len(paths) or in_flight:
+                # Batches are cut only when there is room to send them, so each one
+                # uses the latest size
+                while start < len(paths) and len(in_flight) < self.max_in_flight:
+                    end = self.sizer.take(paths, start)
+                    future = pool.submit(self.post_batch, paths[start:end])
+                    in_flight[future] = submitted
+                    submitted += 1
+                    start = end
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outputs[in_flight.pop(future)] = future.result()
+        return [outputs[index] for index in range(submitted)]
+
+    def run_per_item(self, paths: List[str]) -> List[Any]:
+        """
+        Returns one output per path, in input order, so the result does not depend on
+        how the paths were split into batches.
+        """
+        outputs = []
+        for batch_output in self.run(paths):
+            if not isinstance(batch_output, list):
+                raise ValueError(f"Expected a list of outputs, got: {batch_output}")
+            outputs.extend(batch_output)
+        if len(outputs) != len(paths):
+            raise ValueError(
+                f"Expected {len(paths)} outputs, got {len(outputs)}: {outputs}"
+            )
+        return outputs
+
+    def encode(
+        self, contents: List[Union[bytes, mmap.mmap]], encoding: str
+    ) -> Dict[str, Any]:
+        """The body arguments of the request for `encoding`."""
+        if encoding == "frames":
+            return {
+                "data": encode_frames(contents),
+                "headers": {"Content-Type": FRAMES_CONTENT_TYPE},
+            }
+        return {"json": {"data": [base64.b64encode(c).decode() for c in contents]}}
+
+    def post_batch(self, batch: List[str]) -> Any:
+        contents = [self.load(path) for path in batch]
+        encoding = self.encoding
+        body = self.encode(contents, encoding)
+        error = None
+        attempt = 0
+        while attempt <= self.retries:
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            start = time.perf_counter()
+            try:
+                response = self.session.post(
+                    self.endpoint, timeout=self.timeout, **body
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = str(e)
+                attempt += 1
+                continue
+
+            if response.status_code == 200:
+                self.sizer.record(len(batch), time.perf_counter() - start)
+                return response.json().get("output")
+
+            if encoding == "frames" and response.status_code in (415, 422):
+                # The server predates frames; fall back without spending a retry
+                if self.log and self.encoding == "frames":
+                    self.log.info(
+                        "Inference endpoint does not accept frames; using JSON"
+                    )
+                self.encoding = encoding = "json"
+                body = self.encode(contents, encoding)
+                continue
+
+            error = f"Status code: {response.status_code}, Response: {response.text}"
+            if response.status_code != 429 and response.status_code < 500:
+                break
+            if self.log:
+                self.log.warning(f"Retrying batch of {len(batch)} files: {error}")
+            attempt += 1
+        raise Exception(f"Failed to run model inference. {error}")
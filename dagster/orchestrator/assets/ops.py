@@ -4,7 +4,16 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
 import base64
-from dagster import Any, In, OpExecutionContext, Out, op, HookContext, failure_hook
+from dagster import (
+    Any,
+    In,
+    Nothing,
+    OpExecutionContext,
+    Out,
+    op,
+    HookContext,
+    failure_hook,
+)
 import requests
 import pandas as pd
 import operator
@@ -13,11 +22,84 @@ import os
 import sys
 import gdown
 import json
+import mmap
+import shutil
+import tempfile
+from typing import Union
+
+from orchestrator.assets.inference import BatchInferenceClient, pooled_session
+from orchestrator.assets.sources import (
+    LocalDirSink,
+    LocalDirSource,
+    S3PrefixSource,
+    S3Sink,
+)
+
+# Every op in OP_DEFS takes an `after` Nothing input, so the composed job can order ops
+# that share a model or local files without passing data between them.
+
+# Imported datasets live on disk in a scratch directory per run; ops pass a manifest of
+# file paths rather than file contents.
+SCRATCH_ROOT = os.getenv(
+    "SCRATCH_ROOT", os.path.join(tempfile.gettempdir(), "constellation_runs")
+)
+CHUNK_SIZE = 1024 * 1024
+
+
+def run_scratch_dir(context: OpExecutionContext) -> str:
+    """Creates a fresh directory for this op under the run's scratch directory."""
+    run_dir = os.path.join(SCRATCH_ROOT, context.run_id)
+    os.makedirs(run_dir, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f"{context.op_def.name}-", dir=run_dir)
+
+
+def cleanup_run_scratch(run_id: str) -> None:
+    """Removes the scratch directory of a finished run, whether it succeeded or not."""
+    shutil.rmtree(os.path.join(SCRATCH_ROOT, run_id), ignore_errors=True)
+
+
+def extract_zip(archive_path: str, target_dir: str) -> list[str]:
+    """
+    Extracts `archive_path` into `target_dir` one member at a time, copying each in
+    CHUNK_SIZE pieces so no member is ever fully held in memory.
+
+    Returns:
+        list[str]: The extracted file paths, relative to `target_dir`.
+    """
+    target_root = os.path.realpath(target_dir)
+    files = []
+    with zipfile.ZipFile(archive_path, "r") as archive:
+        for member in archive.infolist():
+            if member.is_dir():
+                continue
+            destination = os.path.realpath(os.path.join(target_root, member.filename))
+            if os.path.commonpath([target_root, destination]) != target_root:
+                raise ValueError(f"Unsafe path in archive: {member.filename}")
+
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            with archive.open(member) as source, open(destination, "wb") as target:
+                shutil.copyfileobj(source, target, CHUNK_SIZE)
+            files.append(os.path.relpath(destination, target_root))
+    return sorted(files)
+
+
+def read_file(path: str) -> Union[bytes, mmap.mmap]:
+    """
+    Maps a file's raw bytes into memory; the inference client encodes them for the wire.
+
+    The mapping is read-only and backed by the page cache, so a tile is copied once,
+    into the request body, instead of also being held on the heap.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
 
 @op(
     name="import_from_google_drive",
-    ins={"file_id": In(str), "unique_id": In(str)},
+    ins={"file_id": In(str), "unique_id": In(str), "after": In(Nothing)},
     out=Out(dict[str, Any]),
 )
 def import_from_google_drive(
@@ -27,28 +109,66 @@ def import_from_google_drive(
         # Import the data from Google Drive using gdown
         context.log.info("Starting import_from_google_drive...")
         download_url = f"https://drive.google.com/uc?id={file_id}"
+        scratch_dir = run_scratch_dir(context)
         # Download the file using gdown
-        output = "download.zip"
+        output = os.path.join(scratch_dir, "download.zip")
         gdown.download(download_url, output, quiet=False)
         context.log.info("Downloaded file successfully using gdown.")
 
-        # Unzip the file
-        with zipfile.ZipFile(output, "r") as zip_ref:
-            zip_ref.extractall("data")
+        # Unzip the file, then drop the archive
+        data_dir = os.path.join(scratch_dir, "data")
+        files = extract_zip(output, data_dir)
+        os.remove(output)
 
-        # Save files to a dictionary structure
-        data_dict = {}
-        for root, dirs, files in os.walk("data"):
-            for file in files:
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, "data")
+        context.log.info(f"Extracted {len(files)} files to {data_dir}.")
+        return {"root": data_dir, "files": files}
+    except Exception as e:
+        context.log.error(f"An error occurred: {e}")
+        publish_failure(context, unique_id)
+        raise e
+
+
+@op(
+    name="import_from_local_dir",
+    ins={"path": In(str), "unique_id": In(str), "after": In(Nothing)},
+    out=Out(dict[str, Any]),
+)
+def import_from_local_dir(
+    context: OpExecutionContext, path: str, unique_id: str
+) -> dict[str, Any]:
+    try:
+        # The files stay where they are; the manifest points at them
+        manifest = LocalDirSource(path).fetch()
+        context.log.info(f"Found {len(manifest['files'])} files in {manifest['root']}.")
+        return manifest
+    except Exception as e:
+        context.log.error(f"An error occurred: {e}")
+        publish_failure(context, unique_id)
+        raise e
 
-                # Read the file in binary mode and store it in the dictionary
-                with open(file_path, "rb") as f:
-                    data_dict[relative_path] = f.read()
 
-        context.log.info(f"Loaded {len(data_dict.values())} files into dictionary.")
-        return data_dict
+@op(
+    name="import_from_s3",
+    ins={
+        "bucket": In(str),
+        "prefix": In(str),
+        "unique_id": In(str),
+        "after": In(Nothing),
+    },
+    out=Out(dict[str, Any]),
+    required_resource_keys={"s3_resource"},
+)
+def import_from_s3(
+    context: OpExecutionContext, bucket: str, prefix: str, unique_id: str
+) -> dict[str, Any]:
+    try:
+        context.log.info(f"Starting import_from_s3 from s3://{bucket}/{prefix}...")
+        data_dir = os.path.join(run_scratch_dir(context), "data")
+        source = S3PrefixSource(context.resources.s3_resource, bucket, prefix)
+        manifest = source.fetch(data_dir)
+
+        context.log.info(f"Downloaded {len(manifest['files'])} files to {data_dir}.")
+        return manifest
     except Exception as e:
         context.log.error(f"An error occurred: {e}")
         publish_failure(context, unique_id)
@@ -57,21 +177,25 @@ def import_from_google_drive(
 
 @op(
     name="dict_to_list",
-    ins={"data": In(dict[str, Any]), "unique_id": In(str)},
-    out=Out(list[bytes]),
+    ins={"data": In(dict[str, Any]), "unique_id": In(str), "after": In(Nothing)},
+    out=Out(list[str]),
 )
 def dict_to_list(
     context: OpExecutionContext, data: dict[str, Any], unique_id: str
-) -> list[bytes]:
+) -> list[str]:
     try:
-        return list(data.values())
+        # Absolute paths of the manifest's files; contents are read lazily downstream
+        return [os.path.join(data["root"], path) for path in data["files"]]
     except Exception as e:
         context.log.error(f"An error occurred: {e}")
         publish_failure(context, unique_id)
         raise e
 
 
-@op(name="deploy_model", ins={"model": In(str), "unique_id": In(str)})
+@op(
+    name="deploy_model",
+    ins={"model": In(str), "unique_id": In(str), "after": In(Nothing)},
+)
 def deploy_model(context: OpExecutionContext, model: str, unique_id: str) -> None:
     try:
         context.log.info(f"Deploying model: {model}")
@@ -96,7 +220,10 @@ def deploy_model(context: OpExecutionContext, model: str, unique_id: str) -> Non
         raise e
 
 
-@op(name="delete_model", ins={"model": In(str), "unique_id": In(str)})
+@op(
+    name="delete_model",
+    ins={"model": In(str), "unique_id": In(str), "after": In(Nothing)},
+)
 def delete_model(context: OpExecutionContext, model: str, unique_id: str) -> None:
     try:
         context.log.info(f"Deleting model service: {model}")
@@ -124,12 +251,17 @@ def delete_model(context: OpExecutionContext, model: str, unique_id: str) -> Non
 # Model infrence
 @op(
     name="model_inference",
-    ins={"data": In(list[bytes]), "model": In(str), "unique_id": In(str)},
+    ins={
+        "data": In(list[str]),
+        "model": In(str),
+        "unique_id": In(str),
+        "after": In(Nothing),
+    },
     out=Out(dict[str, Any]),
 )
 def model_inference(
     context: OpExecutionContext,
-    data: list[bytes],
+    data: list[str],
     model: str,
     unique_id: str,
 ) -> dict[str, Any]:
@@ -137,36 +269,29 @@ def model_inference(
         context.log.info(f"Running inference on {len(data)} images")
         MODEL_ENDPOINT = f"http://model_api:8000"
         endpoint = f"{MODEL_ENDPOINT}/infer?model_name={model}"
-        batch_size = 2
-        batches = [
-            data[i : min(len(data), i + batch_size)]
-            for i in range(0, len(data), batch_size)
-        ]
-
-        results = []
-        for batch in batches:
-            payload = {
-                "data": [base64.b64encode(image).decode("utf-8") for image in batch]
-            }
-            response = requests.post(endpoint, json=payload)
-            context.log.info(f"Response: {response.text}")
-            results.append(response.json().get("output"))
-
-        if len(results) == len(batches):
-            context.log.info(f"Model inference successful: {results}")
-            return {"results": results}
-        else:
-            context.log.error(
-                f"Failed to run model inference. Status code: {response.status_code}, Response: {response.text}"
+
+        # Files are read only when their batch is sent
+        with pooled_session() as session:
+            client = BatchInferenceClient(
+                endpoint,
+                load=read_file,
+                session=session,
+                log=context.log,
             )
-            return {}
+            # One output per image, in input order, however the client batched them
+            results = client.run_per_item(data)
+
+        context.log.info(
+            f"Model inference successful over {len(results)} images: {results}"
+        )
+        return {"results": results}
     except Exception as e:
         context.log.error(f"An error occurred: {e}")
         publish_failure(context, unique_id)
         raise e
 
 
-@op(name="mock_csv_data", out=Out())
+@op(name="mock_csv_data", ins={"after": In(Nothing)}, out=Out())
 def mock_csv_data(context: OpExecutionContext) -> pd.DataFrame:
     data = [["column1", "column2", "column3"], [1, 2, 3], [4, 5, 6], [7, 8, 9]]
     context.log.info(f"Mock data: {data}")
@@ -179,7 +304,7 @@ def mock_csv_data(context: OpExecutionContext) -> pd.DataFrame:
 
 @op(
     name="write_csv",
-    ins={"result": In(pd.DataFrame), "unique_id": In(str)},
+    ins={"result": In(pd.DataFrame), "unique_id": In(str), "after": In(Nothing)},
     out=Out(str),
 )
 def write_csv(context: OpExecutionContext, result: pd.DataFrame, unique_id: str) -> str:
@@ -198,7 +323,11 @@ def write_csv(context: OpExecutionContext, result: pd.DataFrame, unique_id: str)
 
 @op(
     name="export_to_s3",
-    ins={"inference_results": In(dict), "unique_id": In(str)},
+    ins={
+        "inference_results": In(dict),
+        "unique_id": In(str),
+        "after": In(Nothing),
+    },
     out=Out(str),
     description="Exports inference results to S3 as a JSON file.",
     required_resource_keys={"s3_resource"},
@@ -209,11 +338,37 @@ def export_to_s3(context, inference_results, unique_id):
         key = "inference_results.json"
 
         data = json.dumps(inference_results, indent=2)
-        s3 = context.resources.s3_resource
-        s3.put_object(Bucket=bucket_name, Key=key, Body=data.encode("utf-8"))
+        sink = S3Sink(context.resources.s3_resource, bucket_name)
+        uri = sink.write(key, data.encode("utf-8"))
+
+        context.log.info(f"Uploaded inference results to {uri}")
+        return uri
+    except Exception as e:
+        context.log.error(f"An error occurred: {e}")
+        publish_failure(context, unique_id)
+        raise e
+
+
+@op(
+    name="export_to_local_dir",
+    ins={
+        "inference_results": In(dict),
+        "path": In(str),
+        "unique_id": In(str),
+        "after": In(Nothing),
+    },
+    out=Out(str),
+    description="Exports inference results to a local directory as a JSON file.",
+)
+def export_to_local_dir(context, inference_results, path, unique_id):
+    try:
+        data = json.dumps(inference_results, indent=2)
+        destination = LocalDirSink(path).write(
+            "inference_results.json", data.encode("utf-8")
+        )
 
-        context.log.info(f"Uploaded inference results to s3://{bucket_name}/{key}")
-        return f"s3://{bucket_name}/{key}"
+        context.log.info(f"Wrote inference results to {destination}")
+        return destination
     except Exception as e:
         context.log.error(f"An error occurred: {e}")
         publish_failure(context, unique_id)
@@ -251,15 +406,20 @@ def math_block(
         raise e
 
 
-@op(name="publish_success", ins={"unique_id": In(str)})
+@op(name="publish_success", ins={"unique_id": In(str), "after": In(Nothing)})
 def publish_success(context: OpExecutionContext, unique_id: str):
     run_id = unique_id
     message = "Run has been completed successfully"
     context.log.info(f"Publishing success for run {run_id} with message: {message}")
     publish_status(run_id, "completed", message)
 
+    # Every op of the run has finished with its scratch files
+    cleanup_run_scratch(context.run_id)
+
 
 def publish_failure(context: OpExecutionContext, unique_id: str):
+    # Scratch files stay: sibling branches of the run may still be reading them. The
+    # cleanup_failed_run_scratch sensor removes them once the run has failed.
     context.log.error(f"An error occurred: {context.op_exception}")
     error_message = str(context.op_exception)
     context.log.info(
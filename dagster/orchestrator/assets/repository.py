@@ -18,19 +18,35 @@ from dagster import (
     job,
     repository,
     op,
+    DagsterError,
     DagsterInvariantViolationError,
+    MultiDependencyDefinition,
+    build_reconstructable_job,
+    execute_job,
+    multiprocess_executor,
+    run_failure_sensor,
+    DefaultSensorStatus,
+    RunFailureSensorContext,
 )
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any as TypingAny, Dict, Tuple, Optional, List
+from typing import Any as TypingAny, Callable, Dict, Tuple, Optional, List, Set
+import hashlib
+import json
+import threading
 import uuid
 
 from dagster_aws.s3 import s3_resource
 
 from orchestrator.assets.ops import *
+from orchestrator.assets.templates import TEMPLATES
 
 OP_DEFS = [
     import_from_google_drive,
+    import_from_local_dir,
+    import_from_s3,
     export_to_s3,
+    export_to_local_dir,
     deploy_model,
     delete_model,
     dict_to_list,
@@ -39,6 +55,13 @@ OP_DEFS = [
     write_csv,
     publish_success,
 ]
+OP_DEFS_BY_NAME = {op_def.name: op_def for op_def in OP_DEFS}
+
+# Ops that write to fixed paths in the working directory; two nodes using the same one
+# cannot run at the same time. Imports use a scratch directory per op instead.
+LOCAL_FILE_OPS = {"write_csv"}
+
+MAX_PARALLEL_JOBS = int(os.getenv("MAX_PARALLEL_JOBS", "4"))
 
 
 @dataclass
@@ -52,7 +75,7 @@ def parse_instructions(input: dict) -> CallableOperation:
         raise ValueError("Operation not found in instruction")
 
     operation = input["operation"]
-    if operation not in [op.name for op in OP_DEFS]:
+    if operation not in OP_DEFS_BY_NAME:
         raise ValueError(f"Operation '{operation}' is not defined in OP_DEFS.")
 
     parameters = {}
@@ -66,79 +89,305 @@ def parse_instructions(input: dict) -> CallableOperation:
     return CallableOperation(operation=operation, parameters=parameters)
 
 
-def generate_dependencies_and_run_config(
-    instruction: CallableOperation, unique_id: str
-) -> Tuple[Dict, Dict]:
-    result = {}
-    run_config = {"ops": {}}
-    alias_counter = [1]
-
-    def traverse(node: CallableOperation) -> str:
-        alias = f"{node.operation} ({alias_counter[0]})"
-        alias_counter[0] += 1
+@dataclass
+class PlannedNode:
+    operation: str
+    alias: str
+    inputs: Dict[str, int]
+    values: Dict[str, TypingAny]
+    after: List[int]
 
-        current_node = NodeInvocation(name=node.operation, alias=alias)
 
-        dependencies = {}
-        input_values = {}
+@dataclass
+class CompiledPipeline:
+    shape_key: str
+    job: JobDefinition
+    run_config: Dict
+    root_aliases: List[str]
+
+
+class JobDefinitionCache:
+    """
+    LRU cache of compiled job definitions keyed by shape, for the life of one process.
+    Runs do not share it: every run starts in a fresh container and every step in a
+    fresh subprocess. Runs skip compiling by launching a template job instead (see
+    TEMPLATE_JOBS).
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._jobs: "OrderedDict[str, JobDefinition]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self, key: str, build: Callable[[], JobDefinition]
+    ) -> JobDefinition:
+        with self._lock:
+            if key in self._jobs:
+                self.hits += 1
+                self._jobs.move_to_end(key)
+                return self._jobs[key]
+            self.misses += 1
+
+        job = build()
+        with self._lock:
+            self._jobs[key] = job
+            self._jobs.move_to_end(key)
+            while len(self._jobs) > self.max_size:
+                self._jobs.popitem(last=False)
+        return job
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jobs.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._jobs)}
+
+
+JOB_CACHE = JobDefinitionCache(int(os.getenv("JOB_CACHE_SIZE", "64")))
+
+
+def node_resources(node: CallableOperation) -> Set[Tuple[str, str]]:
+    """
+    The shared resources an op touches by itself: the model it names, the local
+    directory it reads or writes, and the working directory if it is in LOCAL_FILE_OPS.
+    """
+    resources = set()
+    if node.operation in LOCAL_FILE_OPS:
+        resources.add(("file", node.operation))
+    for kind in ("model", "path"):
+        if kind in node.parameters and not isinstance(
+            node.parameters[kind], CallableOperation
+        ):
+            resources.add((kind, str(node.parameters[kind])))
+    return resources
+
+
+def plan_instructions(instructions: List[dict]) -> Tuple[List[PlannedNode], List[int]]:
+    """
+    Flattens every instruction tree into one list of nodes in dependency order.
+
+    Identical nested subtrees (same operation and parameter values) become a single
+    shared node, so e.g. one `import_from_google_drive` feeds several models. Top-level
+    instructions are never merged, since they run for their side effects. Nodes that
+    touch the same resource are chained through their `after` input in list order.
+
+    Returns:
+        Tuple[List[PlannedNode], List[int]]: The nodes, and the index of each
+            instruction's root node.
+    """
+    nodes: List[PlannedNode] = []
+    shared: Dict[str, int] = {}
+    last_user: Dict[Tuple[str, str], int] = {}
+
+    def visit(node: CallableOperation, is_root: bool) -> int:
+        inputs = {}
+        values = {}
         for key, param in node.parameters.items():
             if isinstance(param, CallableOperation):
-                dep_alias = traverse(param)
-                dependencies[key] = DependencyDefinition(dep_alias)
+                inputs[key] = visit(param, is_root=False)
             else:
-                input_values[key] = param
+                values[key] = param
 
-        if (
-            input_values
-        ):  # This addressed a config input format error that was causing the pipeline to fail
-            run_config["ops"][alias] = {  # Retained copy of error if needed
-                "inputs": {k: {"value": v} for k, v in input_values.items()}
-            }
-        else:
-            run_config["ops"][alias] = {}
-            run_config["ops"][alias]["inputs"] = {}
+        signature = json.dumps(
+            [node.operation, sorted(inputs.items()), values],
+            sort_keys=True,
+            default=str,
+        )
+        if not is_root and signature in shared:
+            return shared[signature]
+
+        index = len(nodes)
+        after = set()
+        for resource in node_resources(node):
+            if resource in last_user:
+                after.add(last_user[resource])
+            last_user[resource] = index
+
+        nodes.append(
+            PlannedNode(
+                operation=node.operation,
+                alias=f"{node.operation} ({index + 1})",
+                inputs=inputs,
+                values=values,
+                after=sorted(after),
+            )
+        )
+        if not is_root:
+            shared[signature] = index
+        return index
 
-        # Add unique_id to the run_config
-        run_config["ops"][alias]["inputs"]["unique_id"] = {"value": unique_id}
+    roots = [
+        visit(parse_instructions(input=instruction), is_root=True)
+        for instruction in instructions
+    ]
 
-        result[current_node] = dependencies if dependencies else {}
+    # Publish success once every instruction has finished
+    nodes.append(
+        PlannedNode(
+            operation="publish_success",
+            alias=f"publish_success ({len(nodes) + 1})",
+            inputs={},
+            values={},
+            after=roots,
+        )
+    )
+    return nodes, roots
 
-        return alias
 
-    traverse(instruction)
-    return result, run_config
+def shape_key(nodes: List[PlannedNode]) -> str:
+    """
+    Hashes the structure of a plan: operations, edges and parameter names, but not the
+    parameter values, which only end up in the run config.
+    """
+    shape = [
+        [node.operation, sorted(node.inputs.items()), sorted(node.values), node.after]
+        for node in nodes
+    ]
+    return hashlib.sha256(json.dumps(shape).encode("utf-8")).hexdigest()[:16]
 
 
-def define_composite_job(
-    name: str, raw_input: dict, unique_id: str
-) -> Tuple[JobDefinition, Dict]:
-    instruction: CallableOperation = parse_instructions(input=raw_input)
-    deps = {}
-    run_config = {}
-    deps, run_config = generate_dependencies_and_run_config(
-        instruction, unique_id=unique_id
-    )
+def composed_job_name(key: str) -> str:
+    return f"composed_job_{key}"
 
-    filtered_op_defs = [
-        op
-        for op in OP_DEFS
-        if op.name in [key.name.split(" ")[0] for key in deps.keys()]
-    ]
+
+def build_composed_job(name: str, nodes: List[PlannedNode]) -> JobDefinition:
+    dependencies = {}
+    for node in nodes:
+        node_deps = {
+            key: DependencyDefinition(nodes[index].alias)
+            for key, index in node.inputs.items()
+        }
+        if node.after:
+            node_deps["after"] = MultiDependencyDefinition(
+                [DependencyDefinition(nodes[index].alias) for index in node.after]
+            )
+        dependencies[NodeInvocation(name=node.operation, alias=node.alias)] = node_deps
 
     graph = GraphDefinition(
         name=name,
-        node_defs=filtered_op_defs,
-        dependencies=deps,
+        node_defs=[
+            OP_DEFS_BY_NAME[name] for name in sorted({node.operation for node in nodes})
+        ],
+        dependencies=dependencies,
     )
-
-    return (
-        graph.to_job(
-            resource_defs={"s3_resource": s3_resource},
+    return graph.to_job(
+        resource_defs={"s3_resource": s3_resource},
+        executor_def=multiprocess_executor.configured(
+            {"max_concurrent": MAX_PARALLEL_JOBS}
         ),
-        run_config,
     )
 
 
+def build_run_config(nodes: List[PlannedNode], unique_id: str) -> Dict:
+    run_config = {"ops": {}}
+    for node in nodes:
+        inputs = {key: {"value": value} for key, value in node.values.items()}
+        if "unique_id" in OP_DEFS_BY_NAME[node.operation].ins:
+            inputs["unique_id"] = {"value": unique_id}
+        run_config["ops"][node.alias] = {"inputs": inputs}
+    return run_config
+
+
+def compile_instructions(
+    instructions: List[dict], unique_id: str = ""
+) -> CompiledPipeline:
+    """
+    Compiles a whole `raw_input` list into a single job. The job definition is cached
+    by shape, so only the run config is rebuilt when a template is reused.
+    """
+    nodes, roots = plan_instructions(instructions)
+    key = shape_key(nodes)
+    job = JOB_CACHE.get_or_build(
+        key, lambda: build_composed_job(composed_job_name(key), nodes)
+    )
+
+    return CompiledPipeline(
+        shape_key=key,
+        job=job,
+        run_config=build_run_config(nodes, unique_id),
+        root_aliases=[nodes[index].alias for index in roots],
+    )
+
+
+def reconstruct_composed_job(instructions: List[dict]) -> JobDefinition:
+    """Rebuilds the composed job in executor subprocesses."""
+    return compile_instructions(instructions).job
+
+
+def template_job_builders() -> Dict[str, Callable[[], JobDefinition]]:
+    """
+    One composed job per template in TEMPLATES, keyed by job name. The repository
+    builds each on first access, so a run worker or step subprocess only builds the job
+    it runs.
+    """
+
+    def builder(instructions: List[dict]) -> Callable[[], JobDefinition]:
+        # The repository only accepts plain functions as lazy definitions
+        def build() -> JobDefinition:
+            return reconstruct_composed_job(instructions)
+
+        return build
+
+    builders = {}
+    for instructions in TEMPLATES.values():
+        nodes, _ = plan_instructions(instructions)
+        builders[composed_job_name(shape_key(nodes))] = builder(instructions)
+    return builders
+
+
+TEMPLATE_JOBS = template_job_builders()
+
+
+def execute_composed_job(
+    context: OpExecutionContext, instructions: List[dict], unique_id: str
+) -> List[TypingAny]:
+    """
+    Runs the composed job and returns the output of each instruction, in order.
+
+    On a persistent instance the job runs as its own run with the multiprocess executor,
+    so independent branches execute concurrently. Ephemeral instances (local tests)
+    fall back to `execute_in_process`.
+    """
+    compiled = compile_instructions(instructions, unique_id)
+    context.log.info(
+        f"Executing composed job {compiled.job.name} with run_config: "
+        f"{compiled.run_config}"
+    )
+
+    def collect(result) -> List[TypingAny]:
+        outputs = []
+        for alias in compiled.root_aliases:
+            try:
+                outputs.append(result.output_for_node(alias))
+            except DagsterError:
+                outputs.append(None)
+        context.log.info(f"Composed job results: {outputs}")
+        return outputs
+
+    if context.instance.is_ephemeral:
+        return collect(compiled.job.execute_in_process(run_config=compiled.run_config))
+
+    recon_job = build_reconstructable_job(
+        "orchestrator.assets.repository",
+        "reconstruct_composed_job",
+        reconstructable_args=(instructions,),
+    )
+    with execute_job(
+        recon_job,
+        instance=context.instance,
+        run_config=compiled.run_config,
+        tags={"constellation/parent_run_id": context.run_id},
+        raise_on_error=True,
+    ) as result:
+        return collect(result)
+
+
 @op(config_schema={"raw_input": Field(Any), "unique_id": Field(str)}, out=DynamicOut())
 def generate_dynamic_job_configs(context: OpExecutionContext):
     raw_input = context.op_config["raw_input"]
@@ -151,46 +400,7 @@ def parse_and_execute_job(
     context: OpExecutionContext, data: tuple[list, str]
 ) -> List[TypingAny]:
     instructions, unique_id = data
-    job_list = []
-    run_configs = []
-    for instruction in instructions:
-        job, run_config = define_composite_job(
-            name="dynamic_job", raw_input=instruction, unique_id=unique_id
-        )
-        context.log.info(f"Created dynamic job: {job.name}")
-        job_list.append(job)
-        run_configs.append(run_config)
-
-    # Add final op to publish success
-    success_raw_input = {
-        "operation": "publish_success",
-        "parameters": {},
-    }
-    success_job, success_run_config = define_composite_job(
-        name="publish_success", raw_input=success_raw_input, unique_id=unique_id
-    )
-    job_list.append(success_job)
-    run_configs.append(success_run_config)
-
-    all_results = []
-    for job, run_config in zip(job_list, run_configs):
-        context.log.info(f"Executing dynamic job with run_config: {run_config}")
-
-        if run_config:
-            result = job.execute_in_process(run_config=run_config)
-        else:
-            result = job.execute_in_process()
-
-        for event in result.all_events:
-            context.log.info(f"Event: {event.message}")
-        try:
-            dynamic_result = result.output_value()
-            context.log.info(f"Dynamic job result: {dynamic_result}")
-            all_results.append(dynamic_result)
-        except DagsterInvariantViolationError:
-            context.log.info("Dynamic job executed without outputs.")
-            all_results.append(None)
-    return all_results
+    return execute_composed_job(context, instructions, unique_id)
 
 
 @job(
@@ -239,6 +449,49 @@ def test_import_from_google_drive_job():
     import_from_google_drive()
 
 
+@run_failure_sensor(
+    name="cleanup_failed_run_scratch",
+    monitor_all_code_locations=True,
+    default_status=DefaultSensorStatus.RUNNING,
+)
+def cleanup_failed_run_scratch(context: RunFailureSensorContext):
+    """
+    Removes the scratch directory of any failed run. Ops do not clean up on failure
+    themselves, since other branches of the run may still be reading its files.
+    """
+    cleanup_run_scratch(context.dagster_run.run_id)
+
+
+def plan_launch(instructions: List[dict], unique_id: str) -> Tuple[str, Dict]:
+    """
+    The job to launch for `instructions`, and its run config. Instructions shaped like a
+    template start its composed job directly; any other shape goes through
+    build_execute_job, which compiles the job inside the run.
+
+    Raises:
+        ValueError: If an instruction names an unknown operation.
+    """
+    nodes, _ = plan_instructions(instructions)
+    job_name = composed_job_name(shape_key(nodes))
+    if job_name in TEMPLATE_JOBS:
+        return job_name, build_run_config(nodes, unique_id)
+
+    return build_execute_job.name, {
+        "ops": {
+            "generate_dynamic_job_configs": {
+                "config": {"raw_input": instructions, "unique_id": unique_id}
+            }
+        }
+    }
+
+
 @repository(name="main")
 def deploy_docker_repository():
-    return [build_execute_job, test_import_from_google_drive_job]
+    return {
+        "jobs": {
+            build_execute_job.name: build_execute_job,
+            test_import_from_google_drive_job.name: test_import_from_google_drive_job,
+            **TEMPLATE_JOBS,
+        },
+        "sensors": {cleanup_failed_run_scratch.name: cleanup_failed_run_scratch},
+    }
@@ -0,0 +1,150 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# Sources fetch a dataset into a manifest ({"root": dir, "files": [relative paths]})
+# that downstream ops read lazily; sinks write a named blob and return its URI. Ops in
+# ops.py are thin wrappers around them.
+
+S3_PART_SIZE = int(os.getenv("S3_PART_SIZE", str(8 * 1024 * 1024)))
+S3_MAX_WORKERS = int(os.getenv("S3_MAX_WORKERS", "16"))
+
+
+def build_manifest(root: str, files: List[str]) -> Dict[str, Any]:
+    return {"root": root, "files": sorted(files)}
+
+
+class LocalDirSource:
+    """
+    Reads a dataset already on a local or mounted filesystem. Nothing is copied: the
+    manifest points straight at the directory.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def fetch(self, target_dir: Optional[str] = None) -> Dict[str, Any]:
+        root = os.path.realpath(self.path)
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"Source directory not found: {self.path}")
+
+        files = []
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                files.append(os.path.relpath(os.path.join(dirpath, filename), root))
+        return build_manifest(root, files)
+
+
+class S3PrefixSource:
+    """
+    Downloads every object under an S3 prefix into `target_dir`.
+
+    Objects are fetched concurrently on a bounded thread pool; objects larger than
+    `part_size` are split into byte ranges that are fetched in parallel and written in
+    place, so a single large tile does not serialize the download. Works against any
+    S3-compatible endpoint (AWS, MinIO, moto) through the injected boto3 client.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        prefix: str = "",
+        part_size: int = S3_PART_SIZE,
+        max_workers: int = S3_MAX_WORKERS,
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.part_size = part_size
+        self.max_workers = max_workers
+
+    def list_objects(self) -> List[Tuple[str, int]]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        objects = []
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for item in page.get("Contents", []):
+                if not item["Key"].endswith("/"):
+                    objects.append((item["Key"], item["Size"]))
+        return objects
+
+    def fetch(self, target_dir: str) -> Dict[str, Any]:
+        root = os.path.realpath(target_dir)
+        objects = self.list_objects()
+        # Keys keep their path below the prefix's last "/"
+        base = self.prefix.rsplit("/", 1)[0] if "/" in self.prefix else ""
+
+        files = []
+        parts = []
+        for key, size in objects:
+            relative_path = key[len(base) :].lstrip("/")
+            destination = os.path.realpath(os.path.join(root, relative_path))
+            if os.path.commonpath([root, destination]) != root:
+                raise ValueError(f"Unsafe object key: {key}")
+
+            # Preallocate so every range can be written at its own offset
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            with open(destination, "wb") as f:
+                f.truncate(size)
+            files.append(os.path.relpath(destination, root))
+            for start in range(0, size, self.part_size):
+                end = min(start + self.part_size, size) - 1
+                parts.append((key, destination, start, end, size))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # list() surfaces the first download error
+            list(pool.map(lambda part: self._download_range(*part), parts))
+        return build_manifest(root, files)
+
+    def _download_range(
+        self, key: str, destination: str, start: int, end: int, size: int
+    ) -> None:
+        if start == 0 and end == size - 1:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+        else:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end}"
+            )
+
+        body = response["Body"]
+        fd = os.open(destination, os.O_WRONLY)
+        try:
+            offset = start
+            for chunk in iter(lambda: body.read(1024 * 1024), b""):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+        finally:
+            os.close(fd)
+            body.close()
+
+
+class LocalDirSink:
+    """Writes blobs into a local directory."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def write(self, name: str, data: bytes) -> str:
+        destination = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+        # Write then rename, so readers never see a partial file
+        partial = f"{destination}.partial"
+        with open(partial, "wb") as f:
+            f.write(data)
+        os.replace(partial, destination)
+        return os.path.abspath(destination)
+
+
+class S3Sink:
+    """Writes blobs under a bucket through the injected boto3 client."""
+
+    def __init__(self, client: Any, bucket: str, prefix: str = ""):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def write(self, name: str, data: bytes) -> str:
+        key = f"{self.prefix}{name}"
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=data)
+        return f"s3://{self.bucket}/{key}"
@@ -0,0 +1,52 @@
+from typing import Dict, List
+
+# Instruction lists for the pipelines most runs follow. Only their shape matters: the
+# repository defines one composed job per template, and a launch whose instructions
+# have the same shape, whatever their parameter values, starts that job by name
+# instead of going through build_execute_job.
+
+
+def inference(model: str, file_id: str) -> dict:
+    return {
+        "operation": "model_inference",
+        "parameters": {
+            "model": model,
+            "data": {
+                "operation": "dict_to_list",
+                "parameters": {
+                    "data": {
+                        "operation": "import_from_google_drive",
+                        "parameters": {"file_id": file_id},
+                    }
+                },
+            },
+        },
+    }
+
+
+TEMPLATES: Dict[str, List[dict]] = {
+    # sample_dags.txt
+    "fire_detection": [
+        {"operation": "deploy_model", "parameters": {"model": "model"}},
+        inference("model", "file_id"),
+        {"operation": "delete_model", "parameters": {"model": "model"}},
+    ],
+    # Two models on the same dataset
+    "model_comparison": [
+        {"operation": "deploy_model", "parameters": {"model": "model-a"}},
+        {"operation": "deploy_model", "parameters": {"model": "model-b"}},
+        inference("model-a", "file_id"),
+        inference("model-b", "file_id"),
+        {"operation": "delete_model", "parameters": {"model": "model-a"}},
+        {"operation": "delete_model", "parameters": {"model": "model-b"}},
+    ],
+    # The pipeline the agent crew generates
+    "inference_to_s3": [
+        {"operation": "deploy_model", "parameters": {"model": "model"}},
+        {
+            "operation": "export_to_s3",
+            "parameters": {"inference_results": inference("model", "file_id")},
+        },
+        {"operation": "delete_model", "parameters": {"model": "model"}},
+    ],
+}
@@ -0,0 +1,153 @@
+"""
+Benchmark: model_inference throughput, serial fixed batches vs adaptive concurrent ones.
+
+Starts a local stub inference server that answers `/infer` after a fixed per-request
+overhead plus a per-image cost (optionally failing a fraction of requests with 503),
+writes `--images` random files, and sends them through:
+
+- "serial": the previous behaviour, batches of 2 posted one `requests.post` at a time;
+- "adaptive": `BatchInferenceClient`, with adaptive batch sizes and a bounded window of
+  concurrent batches over a pooled session.
+
+Both must return the same outputs in the same order.
+
+Usage (from the dagster/ directory):
+    python -m orchestrator.scripts.benchmark_inference --images 10000
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+import requests
+
+from orchestrator.assets.inference import (
+    FRAMES_CONTENT_TYPE,
+    AdaptiveBatchSizer,
+    BatchInferenceClient,
+    decode_frames,
+    pooled_session,
+)
+from orchestrator.assets.ops import read_file
+
+
+def stub_server(overhead: float, per_image: float, failure_rate: float):
+    class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps pooled connections alive between requests
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if self.headers["Content-Type"] == FRAMES_CONTENT_TYPE:
+                frames = decode_frames(body)
+                images = [base64.b64encode(frame).decode() for frame in frames]
+            else:
+                images = json.loads(body)["data"]
+            time.sleep(overhead + per_image * len(images))
+            if random.random() < failure_rate:
+                self.reply(503, {"detail": "Model inference failed"})
+            else:
+                # Echo a digest of each image so the order can be checked
+                self.reply(200, {"output": [image[-12:] for image in images]})
+
+        def reply(self, status: int, payload: dict):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def serial(endpoint: str, paths: List[str]) -> List:
+    results = []
+    for i in range(0, len(paths), 2):
+        batch = paths[i : i + 2]
+        payload = {"data": [base64.b64encode(read_file(p)).decode() for p in batch]}
+        while True:
+            response = requests.post(endpoint, json=payload)
+            if response.status_code == 200:
+                results.extend(response.json()["output"])
+                break
+    return results
+
+
+def adaptive(endpoint: str, paths: List[str], args: argparse.Namespace) -> List:
+    with pooled_session(args.max_in_flight) as session:
+        client = BatchInferenceClient(
+            endpoint,
+            load=read_file,
+            session=session,
+            sizer=AdaptiveBatchSizer(target_latency=args.target_latency),
+            max_in_flight=args.max_in_flight,
+            backoff=0.05,
+        )
+        batches = client.run(paths)
+    print(f"  final batch size: {client.sizer.size}, batches: {len(batches)}")
+    return [output for batch in batches for output in batch]
+
+
+def report(label: str, fn: Callable[[], List], images: int) -> List:
+    start = time.perf_counter()
+    results = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {elapsed:8.2f} s  {images / elapsed:9.1f} images/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=10_000)
+    parser.add_argument("--image-kb", type=int, default=16)
+    parser.add_argument("--overhead-ms", type=float, default=20)
+    parser.add_argument("--per-image-ms", type=float, default=1)
+    parser.add_argument("--failure-rate", type=float, default=0.01)
+    parser.add_argument("--max-in-flight", type=int, default=4)
+    parser.add_argument("--target-latency", type=float, default=0.5)
+    parser.add_argument(
+        "--skip-serial", action="store_true", help="Only run the adaptive client."
+    )
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="benchmark-inference-")
+    server = stub_server(
+        args.overhead_ms / 1000, args.per_image_ms / 1000, args.failure_rate
+    )
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/infer"
+    try:
+        paths = []
+        for i in range(args.images):
+            path = os.path.join(workdir, f"image_{i:06d}.png")
+            with open(path, "wb") as f:
+                f.write(os.urandom(args.image_kb * 1024))
+            paths.append(path)
+        print(f"{args.images} images of {args.image_kb} KiB against {endpoint}")
+
+        results = report(
+            "adaptive", lambda: adaptive(endpoint, paths, args), args.images
+        )
+        if not args.skip_serial:
+            expected = report("serial", lambda: serial(endpoint, paths), args.images)
+            assert results == expected, "adaptive outputs differ from serial ones"
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: dataset ingest throughput of the local-directory and S3 sources.
+
+Generates `--tiles` random tiles of `--tile-kb` KiB (plus one `--large-mb` MiB tile
+that exercises ranged downloads), then reports MB/s for `LocalDirSource` and for
+`S3PrefixSource` at a few worker counts. The S3 side runs against `--endpoint-url`
+(e.g. a local MinIO) when given, otherwise against an in-process moto server.
+
+Usage (from the dagster/ directory):
+    python -m orchestrator.scripts.benchmark_ingest --tiles 2000
+    python -m orchestrator.scripts.benchmark_ingest --endpoint-url http://localhost:9000
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+import boto3
+
+from orchestrator.assets.sources import LocalDirSource, S3PrefixSource
+
+BUCKET = "constellation-ingest-benchmark"
+PREFIX = "tiles/"
+
+
+def generate_tiles(root: str, tiles: int, tile_kb: int, large_mb: int) -> int:
+    total = 0
+    for i in range(tiles):
+        path = os.path.join(root, f"{i % 16:02d}", f"tile_{i:06d}.tif")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            total += f.write(os.urandom(tile_kb * 1024))
+    with open(os.path.join(root, "mosaic.tif"), "wb") as f:
+        total += f.write(os.urandom(large_mb * 1024 * 1024))
+    return total
+
+
+def upload_tiles(client, root: str) -> None:
+    client.create_bucket(Bucket=BUCKET)
+    manifest = LocalDirSource(root).fetch()
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(
+            pool.map(
+                lambda path: client.upload_file(
+                    os.path.join(manifest["root"], path), BUCKET, f"{PREFIX}{path}"
+                ),
+                manifest["files"],
+            )
+        )
+
+
+def read_all(manifest: Dict) -> None:
+    # Local ingest is only as fast as reading the tiles back
+    for path in manifest["files"]:
+        with open(os.path.join(manifest["root"], path), "rb") as f:
+            while f.read(1024 * 1024):
+                pass
+
+
+def report(label: str, fetch: Callable[[], Dict], total: int) -> None:
+    start = time.perf_counter()
+    manifest = fetch()
+    read_all(manifest)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<28} {len(manifest['files']):>6} files  {elapsed:7.2f} s  "
+        f"{total / elapsed / 1e6:8.1f} MB/s"
+    )
+
+
+def s3_client(endpoint_url: str):
+    if endpoint_url:
+        return boto3.client("s3", endpoint_url=endpoint_url), None
+
+    from moto.server import ThreadedMotoServer
+
+    # Keep the server's per-request access log out of the report
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = ThreadedMotoServer(port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    client = boto3.client(
+        "s3",
+        endpoint_url=f"http://{host}:{port}",
+        region_name="us-east-1",
+        aws_access_key_id="benchmark",
+        aws_secret_access_key="benchmark",
+    )
+    return client, server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tiles", type=int, default=2000)
+    parser.add_argument("--tile-kb", type=int, default=256)
+    parser.add_argument("--large-mb", type=int, default=64)
+    parser.add_argument("--part-mb", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16, 32])
+    parser.add_argument(
+        "--endpoint-url", help="S3-compatible endpoint; defaults to a moto server."
+    )
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="benchmark-ingest-")
+    source_dir = os.path.join(workdir, "source")
+    client, server = s3_client(args.endpoint_url)
+    try:
+        total = generate_tiles(source_dir, args.tiles, args.tile_kb, args.large_mb)
+        print(f"dataset: {args.tiles + 1} files, {total / 1e6:.1f} MB")
+        report("local dir", lambda: LocalDirSource(source_dir).fetch(), total)
+
+        upload_tiles(client, source_dir)
+        for workers in args.workers:
+            target_dir = os.path.join(workdir, f"s3-{workers}")
+            source = S3PrefixSource(
+                client,
+                BUCKET,
+                PREFIX,
+                part_size=args.part_mb * 1024 * 1024,
+                max_workers=workers,
+            )
+            report(f"s3 ({workers} workers)", lambda: source.fetch(target_dir), total)
+            shutil.rmtree(target_dir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        if server:
+            server.stop()
+        else:
+            # Leave the user's endpoint as it was
+            objects = S3PrefixSource(client, BUCKET, PREFIX).list_objects()
+            for key, _ in objects:
+                client.delete_object(Bucket=BUCKET, Key=key)
+            client.delete_bucket(Bucket=BUCKET)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: what a run pays to load its composed job, as deployed.
+
+The DockerRunLauncher starts every run in a fresh container and the multiprocess
+executor runs every step in a fresh subprocess, so no process reuses a job built by
+another: each one imports the code location and loads its job from scratch. This
+script times those loads in fresh interpreters, the way they happen in a run:
+
+  - "by name": a template job is loaded from the repository by name, as the run worker
+    and every step subprocess of a template run do;
+  - "compile": the instructions are compiled from scratch, as parse_and_execute_job and
+    every step subprocess of the nested run do when a run goes through
+    build_execute_job;
+  - "import": only the code location is imported, as the build_execute_job run worker
+    and generate_dynamic_job_configs do.
+
+It then adds the loads up per run. A template run loads its job in the run worker and
+in each of its N steps; a build_execute_job run also spends two processes on the
+wrapper ops before compiling in the parse step and in each of the N steps. Container
+start-up is not included.
+
+Usage (from the dagster/ directory):
+    python -m orchestrator.scripts.benchmark_job_build --repeats 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from orchestrator.assets.repository import (
+    composed_job_name,
+    plan_instructions,
+    shape_key,
+)
+from orchestrator.assets.templates import TEMPLATES
+
+CHILD_CODE = {
+    "import": "import orchestrator.assets.repository",
+    "by name": (
+        "import sys\n"
+        "from orchestrator.assets.repository import deploy_docker_repository\n"
+        "deploy_docker_repository.get_job(sys.argv[1])"
+    ),
+    "compile": (
+        "import json, sys\n"
+        "from orchestrator.assets.repository import reconstruct_composed_job\n"
+        "reconstruct_composed_job(json.loads(sys.argv[1]))"
+    ),
+}
+
+
+def cold_load(kind: str, arg: str, repeats: int) -> float:
+    """Median wall-clock milliseconds of a fresh interpreter running CHILD_CODE[kind]."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", CHILD_CODE[kind], arg], check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def report(label: str, steps: int, load_ms: float, run_ms: float) -> None:
+    print(f"{label:<40}{steps:>6}{load_ms:>14.0f}{run_ms:>14.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    import_ms = cold_load("import", "", args.repeats)
+    print(f"import only: {import_ms:.0f} ms per process")
+    print(f"{'':<40}{'steps':>6}{'ms/process':>14}{'ms/run':>14}")
+
+    for name, instructions in TEMPLATES.items():
+        nodes, _ = plan_instructions(instructions)
+        steps = len(nodes)
+        by_name_ms = cold_load(
+            "by name", composed_job_name(shape_key(nodes)), args.repeats
+        )
+        compile_ms = cold_load("compile", json.dumps(instructions), args.repeats)
+
+        report(f"{name} by name", steps, by_name_ms, (1 + steps) * by_name_ms)
+        report(
+            f"{name} via build_execute_job",
+            steps,
+            compile_ms,
+            2 * import_ms + (1 + steps) * compile_ms,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark: bytes on the wire and CPU time of the frames and JSON inference encodings.
+
+Sends `--images` random files through `BatchInferenceClient` with a fixed batch size,
+once per encoding, to a stub `/infer` server running in its own process. The server
+decodes every request back to raw image bytes, as model_api does, and counts the bytes
+it received (request line, headers and body) and the CPU time it spent decoding. The
+client side reports its own process CPU time, so neither includes the other's work.
+
+Usage (from the dagster/ directory):
+    python -m orchestrator.scripts.benchmark_transport --images 2000 --image-kb 64
+"""
+
+import argparse
+import base64
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from orchestrator.assets.inference import (
+    FRAMES_CONTENT_TYPE,
+    AdaptiveBatchSizer,
+    BatchInferenceClient,
+    decode_frames,
+    pooled_session,
+)
+from orchestrator.assets.ops import read_file
+
+
+def serve(port_queue: multiprocessing.Queue) -> None:
+    stats = {"bytes": 0, "cpu": 0.0, "requests": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            # /stats returns the counters and resets them
+            self.reply(dict(stats))
+            stats.update(bytes=0, cpu=0.0, requests=0)
+
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            body = self.rfile.read(length)
+            start = time.thread_time()
+            if self.headers["Content-Type"] == FRAMES_CONTENT_TYPE:
+                images = decode_frames(body)
+            else:
+                images = [base64.b64decode(i) for i in json.loads(body)["data"]]
+            stats["cpu"] += time.thread_time() - start
+            stats["bytes"] += len(self.requestline) + len(str(self.headers)) + length
+            stats["requests"] += 1
+            self.reply({"output": [len(image) for image in images]})
+
+        def reply(self, payload: dict):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def run(endpoint: str, paths: list, encoding: str, args: argparse.Namespace) -> list:
+    with pooled_session(args.max_in_flight) as session:
+        client = BatchInferenceClient(
+            endpoint,
+            load=read_file,
+            session=session,
+            sizer=AdaptiveBatchSizer(
+                initial=args.batch_size,
+                max_size=args.batch_size,
+                max_bytes=2**62,
+            ),
+            max_in_flight=args.max_in_flight,
+            encoding=encoding,
+        )
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        outputs = client.run(paths)
+        client_cpu = time.process_time() - start_cpu
+        wall = time.perf_counter() - start_wall
+
+    stats = requests.get(endpoint.replace("/infer", "/stats")).json()
+    print(
+        f"{encoding:<8} {stats['bytes'] / 1e6:10.1f} MB  "
+        f"{stats['bytes'] / len(paths) / 1024:8.1f} KiB/image  "
+        f"client cpu {client_cpu:6.2f} s  server decode cpu {stats['cpu']:6.2f} s  "
+        f"wall {wall:6.2f} s"
+    )
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=2000)
+    parser.add_argument("--image-kb", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--max-in-flight", type=int, default=4)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="benchmark-transport-")
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(port_queue,), daemon=True)
+    server.start()
+    endpoint = f"http://127.0.0.1:{port_queue.get(timeout=10)}/infer"
+    try:
+        paths = []
+        for i in range(args.images):
+            path = os.path.join(workdir, f"image_{i:06d}.png")
+            with open(path, "wb") as f:
+                f.write(os.urandom(args.image_kb * 1024))
+            paths.append(path)
+        raw = args.images * args.image_kb * 1024
+        print(f"{args.images} images, {raw / 1e6:.1f} MB of raw image bytes")
+
+        frames = run(endpoint, paths, "frames", args)
+        assert run(endpoint, paths, "json", args) == frames
+    finally:
+        server.terminate()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,34 @@ import pytest
 from unittest import mock
 import os
 import sys
+import shutil
+import zipfile
 import pandas as pd
 import operator
 import base64
+import time
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import boto3
+from moto import mock_aws
 
 # Dynamically add the parent directory to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
-from dagster import build_op_context, OpExecutionContext, DagsterInvariantViolationError
+from dagster import (
+    build_op_context,
+    DagsterInstance,
+    OpExecutionContext,
+    DagsterInvariantViolationError,
+)
 
 from orchestrator.assets.ops import (
+    extract_zip,
+    export_to_local_dir,
     import_from_google_drive,
+    import_from_local_dir,
+    import_from_s3,
     dict_to_list,
     deploy_model,
     delete_model,
@@ -20,30 +37,47 @@ from orchestrator.assets.ops import (
     mock_csv_data,
     write_csv,
     math_block,
+    read_file,
+)
+
+from orchestrator.assets.inference import (
+    FRAMES_CONTENT_TYPE,
+    INFERENCE_TIMEOUT,
+    AdaptiveBatchSizer,
+    BatchInferenceClient,
+    decode_frames,
+    encode_frames,
 )
+from orchestrator.assets.sources import S3PrefixSource
 
 from orchestrator.assets.repository import (
-    define_composite_job,
+    JobDefinitionCache,
+    cleanup_failed_run_scratch,
+    compile_instructions,
+    deploy_docker_repository,
+    execute_composed_job,
+    plan_instructions,
+    plan_launch,
 )
 
 # Dummy data for testing
 DUMMY_FILE_ID = "dummy_file_id"
 DUMMY_MODEL_NAME = "dummy_model"
-DUMMY_DATA_DICT = {"file1": b"data1", "file2": b"data2"}
-DUMMY_DATA_LIST = [b"data1", b"data2"]
+DUMMY_UNIQUE_ID = "123-123-123"
+DUMMY_FILES = {"file1.txt": b"data1", "file2.txt": b"data2", "subdir/file3.txt": b""}
 DUMMY_DF = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
 
 
-def test_dict_to_list_op():
-    test_data = DUMMY_DATA_DICT
+def test_dict_to_list_op(tmp_path):
+    manifest = {"root": str(tmp_path), "files": ["file1.txt", "subdir/file3.txt"]}
     context = build_op_context()
 
-    output = dict_to_list(context, test_data)
+    output = dict_to_list(context, manifest, DUMMY_UNIQUE_ID)
 
-    expected_output = list(test_data.values())
-    assert (
-        output == expected_output
-    ), "dict_to_list did not return the expected list of values"
+    assert output == [
+        os.path.join(str(tmp_path), "file1.txt"),
+        os.path.join(str(tmp_path), "subdir/file3.txt"),
+    ], "dict_to_list did not return the manifest's file paths"
 
 
 def test_math_block_op():
@@ -94,27 +128,204 @@ def test_delete_model_op():
         )
 
 
-def test_model_inference_op():
+def test_model_inference_op(tmp_path):
     context = build_op_context()
-    data = DUMMY_DATA_LIST
+    data = []
+    for name in ["image1.png", "image2.png"]:
+        (tmp_path / name).write_bytes(name.encode())
+        data.append(str(tmp_path / name))
     model_name = DUMMY_MODEL_NAME
 
-    with mock.patch("requests.post") as mock_post:
+    with mock.patch("requests.Session.post") as mock_post:
         mock_response = mock.Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"output": ["result1", "result2"]}
         mock_post.return_value = mock_response
 
-        output = model_inference(context, data, model_name)
+        output = model_inference(context, data, model_name, DUMMY_UNIQUE_ID)
 
+        # Raw file bytes go out as one frame each
         expected_url = f"http://model_api:8000/infer?model_name={model_name}"
-        payload = {"data": [base64.b64encode(image).decode("utf-8") for image in data]}
-        mock_post.assert_called_with(expected_url, json=payload)
+        mock_post.assert_called_with(
+            expected_url,
+            timeout=INFERENCE_TIMEOUT,
+            data=encode_frames([b"image1.png", b"image2.png"]),
+            headers={"Content-Type": FRAMES_CONTENT_TYPE},
+        )
 
-        expected_output = {"results": [["result1", "result2"]]}
+        expected_output = {"results": ["result1", "result2"]}
         assert output == expected_output
 
 
+def test_model_inference_output_does_not_depend_on_batching(tmp_path):
+    context = build_op_context()
+    data = []
+    for i in range(5):
+        (tmp_path / f"image{i}.png").write_bytes(f"image{i}".encode())
+        data.append(str(tmp_path / f"image{i}.png"))
+
+    def post(endpoint, timeout, data, headers):
+        return inference_response(
+            200, [f"label-{frame.decode()}" for frame in decode_frames(data)]
+        )
+
+    outputs = []
+    for batch_size in (1, 2, 5):
+        with mock.patch("requests.Session.post", side_effect=post), mock.patch.object(
+            AdaptiveBatchSizer,
+            "take",
+            lambda self, paths, start: min(len(paths), start + batch_size),
+        ):
+            outputs.append(
+                model_inference(context, data, DUMMY_MODEL_NAME, DUMMY_UNIQUE_ID)
+            )
+
+    # One output per input image, in input order, for every batch size
+    expected_output = {"results": [f"label-image{i}" for i in range(5)]}
+    assert outputs == [expected_output] * 3
+
+
+def test_batch_inference_client_rejects_missing_outputs(tmp_path):
+    paths = []
+    for i in range(2):
+        (tmp_path / f"image{i}.png").write_bytes(b"x")
+        paths.append(str(tmp_path / f"image{i}.png"))
+    session = mock.Mock()
+    session.post.return_value = inference_response(200, ["only one"])
+    client = BatchInferenceClient(
+        "http://model_api:8000/infer",
+        load=lambda path: path.encode(),
+        session=session,
+        sizer=AdaptiveBatchSizer(initial=2, max_size=2),
+    )
+
+    with pytest.raises(ValueError, match="Expected 2 outputs"):
+        client.run_per_item(paths)
+
+
+def inference_response(status_code, output=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.text = "error"
+    response.json.return_value = {"output": output}
+    return response
+
+
+def test_batch_inference_client_keeps_input_order_and_retries(tmp_path):
+    paths = []
+    for i in range(10):
+        (tmp_path / f"image{i}.png").write_bytes(b"x")
+        paths.append(str(tmp_path / f"image{i}.png"))
+    failed_once = set()
+
+    def post(endpoint, timeout, data, headers):
+        # Later batches finish first, and each batch fails once before succeeding
+        batch = tuple(frame.decode() for frame in decode_frames(data))
+        if batch not in failed_once:
+            failed_once.add(batch)
+            return inference_response(503)
+        time.sleep(0.01 * (10 - int(batch[0][-5])))
+        return inference_response(200, list(batch))
+
+    session = mock.Mock()
+    session.post.side_effect = post
+    client = BatchInferenceClient(
+        "http://model_api:8000/infer",
+        load=lambda path: path.encode(),
+        session=session,
+        sizer=AdaptiveBatchSizer(initial=3, max_size=3),
+        max_in_flight=3,
+        backoff=0,
+    )
+
+    results = client.run(paths)
+
+    assert results == [paths[0:3], paths[3:6], paths[6:9], paths[9:10]]
+    assert session.post.call_count == 8
+
+
+def test_batch_inference_client_gives_up_after_retries(tmp_path):
+    (tmp_path / "image.png").write_bytes(b"x")
+    session = mock.Mock()
+    session.post.return_value = inference_response(500)
+    client = BatchInferenceClient(
+        "http://model_api:8000/infer",
+        load=lambda path: path.encode(),
+        session=session,
+        retries=2,
+        backoff=0,
+    )
+
+    with pytest.raises(Exception, match="Status code: 500"):
+        client.run([str(tmp_path / "image.png")])
+    assert session.post.call_count == 3
+
+
+def test_batch_inference_client_falls_back_to_json(tmp_path):
+    paths = []
+    for i in range(2):
+        (tmp_path / f"image{i}.png").write_bytes(b"\x89PNG")
+        paths.append(str(tmp_path / f"image{i}.png"))
+
+    def post(endpoint, timeout, **body):
+        # A model_api that predates frames rejects them
+        if "json" not in body:
+            return inference_response(415)
+        return inference_response(200, body["json"]["data"])
+
+    session = mock.Mock()
+    session.post.side_effect = post
+    client = BatchInferenceClient(
+        "http://model_api:8000/infer",
+        load=read_file,
+        session=session,
+        sizer=AdaptiveBatchSizer(initial=1, max_size=1),
+        max_in_flight=1,
+        retries=0,
+    )
+
+    results = client.run(paths)
+
+    assert results == [["iVBORw=="], ["iVBORw=="]]
+    assert client.encoding == "json"
+    # Only the first batch tried frames
+    assert session.post.call_count == 3
+
+
+def test_frames_round_trip():
+    items = [b"", b"\x00\x01", os.urandom(1000)]
+    assert decode_frames(encode_frames(items)) == items
+    with pytest.raises(ValueError):
+        decode_frames(encode_frames(items)[:-1])
+
+
+def test_read_file_maps_tiles(tmp_path):
+    (tmp_path / "tile.tif").write_bytes(b"\x00\x01tile")
+    (tmp_path / "empty.tif").write_bytes(b"")
+    contents = [read_file(str(tmp_path / name)) for name in ("tile.tif", "empty.tif")]
+
+    assert decode_frames(encode_frames(contents)) == [b"\x00\x01tile", b""]
+
+
+def test_adaptive_batch_sizer_caps_bytes_and_follows_latency(tmp_path):
+    paths = []
+    for i in range(6):
+        (tmp_path / f"image{i}.png").write_bytes(b"x" * 300)
+        paths.append(str(tmp_path / f"image{i}.png"))
+    sizer = AdaptiveBatchSizer(
+        initial=4, max_size=8, max_bytes=1000, target_latency=1.0
+    )
+
+    # 400 encoded bytes per file, so only two fit under the byte budget
+    assert sizer.take(paths, 0) == 2
+
+    sizer.max_bytes = 10_000
+    sizer.record(4, latency=0.1)
+    assert sizer.size == 6
+    sizer.record(6, latency=2.0)
+    assert sizer.size == 3
+
+
 def test_write_csv_op():
     context = build_op_context()
     data = DUMMY_DF.copy()
@@ -127,41 +338,153 @@ def test_write_csv_op():
         assert output_file == "output.csv"
 
 
-def test_import_from_google_drive_op():
+def write_archive(path, files=DUMMY_FILES):
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+
+
+def fake_download(archive_path):
+    def download(url, output, quiet):
+        shutil.copy(archive_path, output)
+
+    return download
+
+
+def test_import_from_google_drive_op(tmp_path):
     context = build_op_context()
     file_id = DUMMY_FILE_ID
+    archive_path = tmp_path / "source.zip"
+    write_archive(archive_path)
+    scratch_root = tmp_path / "scratch"
+
+    with mock.patch(
+        "gdown.download", side_effect=fake_download(archive_path)
+    ) as mock_download, mock.patch(
+        "orchestrator.assets.ops.SCRATCH_ROOT", str(scratch_root)
+    ):
+        output = import_from_google_drive(context, file_id, DUMMY_UNIQUE_ID)
+
+    download_url = f"https://drive.google.com/uc?id={file_id}"
+    assert mock_download.call_args.args[0] == download_url
+
+    # The manifest points into a scratch directory of its own, and the archive is gone
+    assert output["root"].startswith(str(scratch_root))
+    assert output["files"] == ["file1.txt", "file2.txt", "subdir/file3.txt"]
+    for name, content in DUMMY_FILES.items():
+        with open(os.path.join(output["root"], name), "rb") as f:
+            assert f.read() == content
+    assert not os.path.exists(os.path.join(output["root"], "..", "download.zip"))
 
-    with mock.patch("gdown.download") as mock_download, mock.patch(
-        "zipfile.ZipFile"
-    ) as mock_zipfile, mock.patch("os.walk") as mock_walk, mock.patch(
-        "builtins.open", new_callable=mock.mock_open, read_data=b"file content"
+
+def test_import_from_google_drive_failure_keeps_run_scratch(tmp_path):
+    context = build_op_context()
+    scratch_root = tmp_path / "scratch"
+    # Written by another branch of the same run, which may still be reading it
+    sibling_dir = scratch_root / context.run_id / "import_from_s3-1"
+    sibling_dir.mkdir(parents=True)
+
+    with mock.patch(
+        "gdown.download", side_effect=RuntimeError("quota exceeded")
+    ), mock.patch("orchestrator.assets.ops.SCRATCH_ROOT", str(scratch_root)), mock.patch(
+        "requests.put"
     ):
+        with pytest.raises(Exception):
+            import_from_google_drive(context, DUMMY_FILE_ID, DUMMY_UNIQUE_ID)
+
+    assert sibling_dir.exists()
+
+
+def test_cleanup_failed_run_scratch_sensor(tmp_path):
+    run_dir = tmp_path / "failed-run" / "import_from_s3-1"
+    run_dir.mkdir(parents=True)
+    sensor_context = mock.Mock()
+    sensor_context.dagster_run.run_id = "failed-run"
+
+    with mock.patch("orchestrator.assets.ops.SCRATCH_ROOT", str(tmp_path)):
+        cleanup_failed_run_scratch._run_status_sensor_fn(sensor_context)
+
+    assert not (tmp_path / "failed-run").exists()
+
+
+def test_extract_zip_rejects_paths_outside_target(tmp_path):
+    archive_path = tmp_path / "evil.zip"
+    write_archive(archive_path, {"../outside.txt": b"data"})
 
-        mock_download.return_value = None  # Assuming it returns None on success
+    with pytest.raises(ValueError):
+        extract_zip(str(archive_path), str(tmp_path / "data"))
+    assert not (tmp_path / "outside.txt").exists()
 
-        mock_zip_instance = mock_zipfile.return_value.__enter__.return_value
-        mock_zip_instance.namelist.return_value = [
-            "file1.txt",
-            "file2.txt",
-            "subdir/file3.txt",
-        ]
 
-        mock_walk.return_value = [
-            ("data", ("subdir",), ("file1.txt", "file2.txt")),
-            ("data/subdir", (), ("file3.txt",)),
-        ]
+def test_import_from_local_dir_op(tmp_path):
+    for name, content in DUMMY_FILES.items():
+        os.makedirs(os.path.dirname(tmp_path / name), exist_ok=True)
+        (tmp_path / name).write_bytes(content)
+    context = build_op_context()
+
+    output = import_from_local_dir(context, str(tmp_path), DUMMY_UNIQUE_ID)
+
+    # Nothing is copied; the manifest points at the directory itself
+    assert output == {
+        "root": os.path.realpath(tmp_path),
+        "files": ["file1.txt", "file2.txt", "subdir/file3.txt"],
+    }
+
+
+@mock_aws
+def test_s3_prefix_source_downloads_large_objects_in_ranges(tmp_path):
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="tiles")
+    large = os.urandom(10_000)
+    client.put_object(Bucket="tiles", Key="run/a/large.tif", Body=large)
+    client.put_object(Bucket="tiles", Key="run/small.tif", Body=b"small")
+    client.put_object(Bucket="tiles", Key="other/skipped.tif", Body=b"skipped")
+
+    source = S3PrefixSource(client, "tiles", "run/", part_size=4096, max_workers=4)
+    with mock.patch.object(client, "get_object", wraps=client.get_object) as get_object:
+        manifest = source.fetch(str(tmp_path))
+
+    assert manifest["files"] == ["a/large.tif", "small.tif"]
+    assert (tmp_path / "a" / "large.tif").read_bytes() == large
+    assert (tmp_path / "small.tif").read_bytes() == b"small"
+    ranges = sorted(
+        call.kwargs["Range"]
+        for call in get_object.call_args_list
+        if "Range" in call.kwargs
+    )
+    assert ranges == ["bytes=0-4095", "bytes=4096-8191", "bytes=8192-9999"]
 
-        output = import_from_google_drive(context, file_id)
 
-        download_url = f"https://drive.google.com/uc?id={file_id}"
-        mock_download.assert_called_once_with(download_url, "download.zip", quiet=False)
+@mock_aws
+def test_import_from_s3_op(tmp_path):
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="tiles")
+    for name, content in DUMMY_FILES.items():
+        client.put_object(Bucket="tiles", Key=f"dataset/{name}", Body=content)
+    context = build_op_context(resources={"s3_resource": client})
 
-        mock_zipfile.assert_called_once_with("download.zip", "r")
+    with mock.patch("orchestrator.assets.ops.SCRATCH_ROOT", str(tmp_path)):
+        output = import_from_s3(context, "tiles", "dataset/", DUMMY_UNIQUE_ID)
 
-        mock_walk.assert_any_call("data")
+    assert output["root"].startswith(str(tmp_path))
+    assert output["files"] == ["file1.txt", "file2.txt", "subdir/file3.txt"]
+    for name, content in DUMMY_FILES.items():
+        with open(os.path.join(output["root"], name), "rb") as f:
+            assert f.read() == content
+
+
+def test_export_to_local_dir_op(tmp_path):
+    inference_results = {"label": "cat", "confidence": 0.95}
+    context = build_op_context()
+
+    output = export_to_local_dir(
+        context, inference_results, str(tmp_path / "exports"), DUMMY_UNIQUE_ID
+    )
 
-        expected_files = ["file1.txt", "file2.txt", os.path.join("subdir", "file3.txt")]
-        assert set(output.keys()) == set(expected_files)
+    assert output == str(tmp_path / "exports" / "inference_results.json")
+    with open(output) as f:
+        assert json.load(f) == inference_results
+    assert os.listdir(tmp_path / "exports") == ["inference_results.json"]
 
 
 def test_mock_csv_data_op():
@@ -178,91 +501,57 @@ def test_mock_csv_data_op():
 # Composite job tests. Testing the functionality of our dynamic job generation. Tested multiple operations to ensure the correct job construction.
 
 
-def test_define_composite_job_import_from_google_drive():
+def test_compiled_job_import_from_google_drive(tmp_path):
     """
-    Test define_composite_job with the 'import_from_google_drive' operation to ensure correct job construction and execution.
+    Test compile_instructions with the 'import_from_google_drive' operation to ensure correct job construction and execution.
     """
     raw_input = {
         "operation": "import_from_google_drive",
         "parameters": {"file_id": DUMMY_FILE_ID},
     }
 
-    job, run_config = define_composite_job(name="import_job", raw_input=raw_input)
+    compiled = compile_instructions([raw_input], unique_id=DUMMY_UNIQUE_ID)
+    run_config = compiled.run_config
 
-    assert job.name == "import_job", "Job name does not match the expected name."
+    assert compiled.root_aliases == ["import_from_google_drive (1)"]
     assert "ops" in run_config, "'ops' key not found in run_config."
-    assert (
-        "import_from_google_drive (1)" in run_config["ops"]
-    ), "'import_from_google_drive (1)' op not found in run_config."
-    assert (
-        "inputs" in run_config["ops"]["import_from_google_drive (1)"]
-    ), "'inputs' key not found for 'import_from_google_drive (1)' op."
-
     assert run_config["ops"]["import_from_google_drive (1)"]["inputs"] == {
         "file_id": {"value": DUMMY_FILE_ID},
+        "unique_id": {"value": DUMMY_UNIQUE_ID},
     }, "Run config inputs do not match the expected value serialization."
 
-    with mock.patch("gdown.download") as mock_download, mock.patch(
-        "zipfile.ZipFile"
-    ) as mock_zipfile, mock.patch("os.walk") as mock_walk, mock.patch(
-        "builtins.open", new_callable=mock.mock_open, read_data=b"file content"
-    ):
-
-        mock_download.return_value = None
-
-        mock_zip_instance = mock_zipfile.return_value.__enter__.return_value
-        mock_zip_instance.namelist.return_value = [
-            "file1.txt",
-            "file2.txt",
-            "subdir/file3.txt",
-        ]
+    archive_path = tmp_path / "source.zip"
+    write_archive(archive_path)
 
-        mock_walk.return_value = [
-            ("data", ("subdir",), ("file1.txt", "file2.txt")),
-            ("data/subdir", (), ("file3.txt",)),
-        ]
-
-        result = job.execute_in_process(run_config=run_config)
+    with mock.patch(
+        "gdown.download", side_effect=fake_download(archive_path)
+    ), mock.patch(
+        "orchestrator.assets.ops.SCRATCH_ROOT", str(tmp_path / "scratch")
+    ), mock.patch(
+        "requests.put"
+    ):
+        result = compiled.job.execute_in_process(run_config=run_config)
 
         assert result.success, "Job execution failed."
 
-        expected_download_url = f"https://drive.google.com/uc?id={DUMMY_FILE_ID}"
-        mock_download.assert_called_once_with(
-            expected_download_url, "download.zip", quiet=False
-        )
-
-        mock_zipfile.assert_called_once_with("download.zip", "r")
-
-        mock_walk.assert_any_call("data")
-
-        # Optionally, verify the output of the op if applicable
-        # For example, if import_from_google_drive returns a dict of file paths:
-        # output = result.output_for_node("import_from_google_drive (1)")
-        # expected_output = {
-        #     'file1.txt': b'file content',
-        #     'file2.txt': b'file content',
-        #     'subdir/file3.txt': b'file content',
-        # }
-        # assert output == expected_output, "The output of import_from_google_drive op does not match the expected output."
+        output = result.output_for_node("import_from_google_drive (1)")
+        assert output["files"] == ["file1.txt", "file2.txt", "subdir/file3.txt"]
 
 
-def test_define_composite_job_deploy_model():
+def test_compiled_job_deploy_model():
     raw_input = {
         "operation": "deploy_model",
         "parameters": {"model": DUMMY_MODEL_NAME},
     }
-    job, run_config = define_composite_job(name="deploy_model_job", raw_input=raw_input)
+    compiled = compile_instructions([raw_input], unique_id=DUMMY_UNIQUE_ID)
 
-    assert job.name == "deploy_model_job"
-    assert "ops" in run_config
-    assert "deploy_model (1)" in run_config["ops"]
-    assert "inputs" in run_config["ops"]["deploy_model (1)"]
-    assert run_config["ops"]["deploy_model (1)"]["inputs"] == {
+    assert compiled.run_config["ops"]["deploy_model (1)"]["inputs"] == {
         "model": {"value": DUMMY_MODEL_NAME},
+        "unique_id": {"value": DUMMY_UNIQUE_ID},
     }
 
     # Mock requests.get
-    with mock.patch("requests.get") as mock_get:
+    with mock.patch("requests.get") as mock_get, mock.patch("requests.put"):
         # Set up mock response
         mock_response = mock.Mock()
         mock_response.status_code = 200
@@ -270,27 +559,24 @@ def test_define_composite_job_deploy_model():
         mock_get.return_value = mock_response
 
         # Execute the job
-        result = job.execute_in_process(run_config=run_config)
+        result = compiled.job.execute_in_process(run_config=compiled.run_config)
         assert result.success
 
 
-def test_define_composite_job_delete_model():
+def test_compiled_job_delete_model():
     raw_input = {
         "operation": "delete_model",
         "parameters": {"model": DUMMY_MODEL_NAME},
     }
-    job, run_config = define_composite_job(name="delete_model_job", raw_input=raw_input)
+    compiled = compile_instructions([raw_input], unique_id=DUMMY_UNIQUE_ID)
 
-    assert job.name == "delete_model_job"
-    assert "ops" in run_config
-    assert "delete_model (1)" in run_config["ops"]
-    assert "inputs" in run_config["ops"]["delete_model (1)"]
-    assert run_config["ops"]["delete_model (1)"]["inputs"] == {
+    assert compiled.run_config["ops"]["delete_model (1)"]["inputs"] == {
         "model": {"value": DUMMY_MODEL_NAME},
+        "unique_id": {"value": DUMMY_UNIQUE_ID},
     }
 
     # Mock requests.delete
-    with mock.patch("requests.delete") as mock_delete:
+    with mock.patch("requests.delete") as mock_delete, mock.patch("requests.put"):
         # Set up mock response
         mock_response = mock.Mock()
         mock_response.status_code = 200
@@ -298,7 +584,7 @@ def test_define_composite_job_delete_model():
         mock_delete.return_value = mock_response
 
         # Execute the job
-        result = job.execute_in_process(run_config=run_config)
+        result = compiled.job.execute_in_process(run_config=compiled.run_config)
         assert result.success
 
 
@@ -322,3 +608,212 @@ def test_export_to_s3_op():
     assert (
         output == expected_uri
     ), "The returned S3 URI does not match the expected value."
+
+
+
+# Composed job tests. The whole instruction list compiles to one DAG with shared nodes.
+
+
+def fire_detection_instructions(model, file_id=DUMMY_FILE_ID):
+    def inference(model_name):
+        return {
+            "operation": "model_inference",
+            "parameters": {
+                "model": model_name,
+                "data": {
+                    "operation": "dict_to_list",
+                    "parameters": {
+                        "data": {
+                            "operation": "import_from_google_drive",
+                            "parameters": {"file_id": file_id},
+                        }
+                    },
+                },
+            },
+        }
+
+    return [
+        {"operation": "deploy_model", "parameters": {"model": model}},
+        inference(model),
+        inference("other-model"),
+        {"operation": "delete_model", "parameters": {"model": model}},
+    ]
+
+
+def test_plan_instructions_shares_nodes_and_orders_models():
+    nodes, roots = plan_instructions(fire_detection_instructions(DUMMY_MODEL_NAME))
+    aliases = [node.alias for node in nodes]
+
+    # One import and one dict_to_list feed both inference nodes
+    assert aliases == [
+        "deploy_model (1)",
+        "import_from_google_drive (2)",
+        "dict_to_list (3)",
+        "model_inference (4)",
+        "model_inference (5)",
+        "delete_model (6)",
+        "publish_success (7)",
+    ]
+    assert nodes[3].inputs == {"data": 2} and nodes[4].inputs == {"data": 2}
+    # Inference and deletion of the deployed model wait for the model's earlier uses
+    assert nodes[3].after == [0]
+    assert nodes[4].after == []
+    assert nodes[5].after == [3]
+    assert roots == [0, 3, 4, 5]
+    assert nodes[-1].after == roots
+
+
+def test_compile_instructions_reuses_job_for_same_shape():
+    first = compile_instructions(fire_detection_instructions("model-a", "file-a"), "1")
+    second = compile_instructions(fire_detection_instructions("model-b", "file-b"), "2")
+
+    assert first.shape_key == second.shape_key
+    assert first.job is second.job
+    assert first.run_config["ops"]["deploy_model (1)"]["inputs"] == {
+        "model": {"value": "model-a"},
+        "unique_id": {"value": "1"},
+    }
+    assert second.run_config["ops"]["import_from_google_drive (2)"]["inputs"] == {
+        "file_id": {"value": "file-b"},
+        "unique_id": {"value": "2"},
+    }
+    assert first.root_aliases == [
+        "deploy_model (1)",
+        "model_inference (4)",
+        "model_inference (5)",
+        "delete_model (6)",
+    ]
+
+
+def test_plan_launch_starts_template_job_by_name():
+    # Same shape as the fire_detection template, with different values
+    instructions = fire_detection_instructions(DUMMY_MODEL_NAME)
+    del instructions[2]
+
+    job_name, run_config = plan_launch(instructions, DUMMY_UNIQUE_ID)
+
+    job = deploy_docker_repository.get_job(job_name)
+    assert job.name == compile_instructions(instructions).job.name
+    assert run_config == compile_instructions(instructions, DUMMY_UNIQUE_ID).run_config
+    assert run_config["ops"]["import_from_google_drive (2)"]["inputs"]["file_id"] == {
+        "value": DUMMY_FILE_ID
+    }
+
+
+def test_plan_launch_compiles_other_shapes_in_the_run():
+    instructions = [{"operation": "mock_csv_data"}]
+
+    job_name, run_config = plan_launch(instructions, DUMMY_UNIQUE_ID)
+
+    assert job_name == "build_execute_job"
+    assert run_config["ops"]["generate_dynamic_job_configs"]["config"] == {
+        "raw_input": instructions,
+        "unique_id": DUMMY_UNIQUE_ID,
+    }
+    with pytest.raises(ValueError):
+        plan_launch([{"operation": "not_an_op"}], DUMMY_UNIQUE_ID)
+
+
+def test_composed_job_executes_in_process():
+    compiled = compile_instructions(
+        [
+            {"operation": "deploy_model", "parameters": {"model": "model-a"}},
+            {"operation": "deploy_model", "parameters": {"model": "model-b"}},
+        ],
+        "123",
+    )
+
+    with mock.patch("requests.get") as mock_get, mock.patch("requests.put"):
+        mock_get.return_value.status_code = 200
+        result = compiled.job.execute_in_process(run_config=compiled.run_config)
+
+    assert result.success
+    assert mock_get.call_count == 2
+
+
+@pytest.fixture
+def main_api_proxy(monkeypatch):
+    """
+    Serves every request the ops send to main_api, including from executor
+    subprocesses, which mock.patch cannot reach: they inherit the proxy settings.
+    """
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_PUT(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            requests_seen.append(self.path)
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    proxy = f"http://127.0.0.1:{server.server_port}"
+    for name in ("HTTP_PROXY", "http_proxy"):
+        monkeypatch.setenv(name, proxy)
+    for name in ("NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    yield requests_seen
+    server.shutdown()
+
+
+def test_composed_job_executes_as_its_own_run(tmp_path, main_api_proxy):
+    branches = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f"{name}.tif").write_bytes(b"tile")
+        branches.append(
+            {
+                "operation": "dict_to_list",
+                "parameters": {
+                    "data": {
+                        "operation": "import_from_local_dir",
+                        "parameters": {"path": str(tmp_path / name)},
+                    }
+                },
+            }
+        )
+
+    (tmp_path / "dagster_home").mkdir()
+    with DagsterInstance.local_temp(str(tmp_path / "dagster_home")) as instance:
+        context = build_op_context(instance=instance)
+        outputs = execute_composed_job(context, branches, DUMMY_UNIQUE_ID)
+
+        runs = instance.get_runs()
+
+    # One output per instruction, in instruction order
+    assert outputs == [
+        [str(tmp_path / "a" / "a.tif")],
+        [str(tmp_path / "b" / "b.tif")],
+    ]
+    # The composed job ran as a separate run of the instance, not in process
+    assert [run.job_name for run in runs] == [compile_instructions(branches).job.name]
+    assert runs[0].tags["constellation/parent_run_id"] == context.run_id
+    assert main_api_proxy == [
+        f"http://main_api:8000/pipelines/status/{DUMMY_UNIQUE_ID}/completed"
+    ]
+
+
+def test_job_definition_cache_evicts_least_recently_used():
+    cache = JobDefinitionCache(max_size=2)
+    built = []
+
+    def builder(key):
+        def build():
+            built.append(key)
+            return mock.Mock(name=key)
+
+        return build
+
+    first = cache.get_or_build("a", builder("a"))
+    cache.get_or_build("b", builder("b"))
+    assert cache.get_or_build("a", builder("a")) is first
+    cache.get_or_build("c", builder("c"))  # evicts "b", the least recently used
+    cache.get_or_build("a", builder("a"))
+    cache.get_or_build("b", builder("b"))
+
+    assert built == ["a", "b", "c", "b"]
+    assert cache.stats() == {"hits": 2, "misses": 4, "size": 2}
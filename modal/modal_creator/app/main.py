@@ -1,27 +1,54 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from modal_creator.assets.utils import (
-    deploy_model_service,
-    delete_model_service,
-    post_model_inference,
+    FRAMES_CONTENT_TYPE,
+    decode_frames,
+    get_backend,
     get_service_code,
 )
 
 app = FastAPI()
 
+# Modal, or this host with INFERENCE_BACKEND=local
+backend = get_backend()
+
+
+@app.on_event("startup")
+async def on_startup():
+    await backend.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await backend.close()
+
 
 @app.get("/deploy")
 async def deploy(model_name: str):
-    output = deploy_model_service(model_name)
+    output = await backend.deploy(model_name)
     return output
 
 
 @app.post("/infer")
-async def infer(model_name: str, data: dict):
-    output = post_model_inference(model_name, data)
+async def infer(model_name: str, request: Request):
+    # Images arrive as raw bytes in frames, or as base64 strings in JSON
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type == FRAMES_CONTENT_TYPE:
+        try:
+            data = {"data": decode_frames(await request.body())}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    elif content_type == "application/json":
+        data = await request.json()
+    else:
+        raise HTTPException(
+            status_code=415, detail=f"Unsupported content type: {content_type}"
+        )
+
+    output = await backend.infer(model_name, data)
     return output
 
 
 @app.delete("/delete")
 async def delete(model_name: str):
-    output = delete_model_service(model_name)
+    output = await backend.delete(model_name)
     return output
@@ -0,0 +1,262 @@
+import modal
+
+import base64
+import json
+import os
+import queue
+import struct
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# The Modal app serving one model. Every model deploys this same file; what differs is
+# the environment `modal deploy` runs with (see deployment_env in utils.py), which also
+# reaches the containers through a Secret. The image therefore never changes between
+# models and is built once.
+HF_MODEL_NAME = os.environ["HF_MODEL_NAME"]
+SERVICE_NAME = os.environ["MODEL_SERVICE_NAME"]
+MODEL_HASH = os.environ["MODEL_HASH"]
+FRAMES_CONTENT_TYPE = os.environ["FRAMES_CONTENT_TYPE"]
+
+# Concurrent requests are merged into pipeline calls of up to BATCH_SIZE images, waiting
+# at most BATCH_WAIT seconds for more after the first arrives
+BATCH_SIZE = int(os.environ["MODAL_PIPELINE_BATCH_SIZE"])
+BATCH_WAIT = float(os.environ["MODAL_BATCH_WAIT_MS"]) / 1000
+DECODE_WORKERS = int(os.environ["MODAL_DECODE_WORKERS"])
+
+app = modal.App(name=SERVICE_NAME)
+image = (
+    modal.Image.debian_slim(python_version="3.11")
+    .pip_install(
+        "flask",
+        "Pillow",
+        "torch",
+        "torchvision",
+        "transformers",
+        "tensorflow",
+        "tf-keras",
+    )
+    .env({"HF_HOME": "/weights"})
+)
+# Downloaded weights outlive the app, so redeploying a deleted model skips the download
+weights = modal.Volume.from_name(
+    os.environ["MODAL_WEIGHTS_VOLUME"], create_if_missing=True
+)
+settings = modal.Secret.from_dict(
+    {
+        name: os.environ[name]
+        for name in [
+            "HF_MODEL_NAME",
+            "MODEL_SERVICE_NAME",
+            "MODEL_HASH",
+            "FRAMES_CONTENT_TYPE",
+            "MODAL_PIPELINE_BATCH_SIZE",
+            "MODAL_BATCH_WAIT_MS",
+            "MODAL_DECODE_WORKERS",
+            "MODAL_WEIGHTS_VOLUME",
+            "MODAL_KEEP_WARM",
+            "MODAL_CONTAINER_IDLE_TIMEOUT",
+            "MODAL_CONCURRENT_INPUTS",
+        ]
+    }
+)
+
+# Loaded on first use and kept for the life of the container
+pipe = None
+load_lock = threading.Lock()
+
+decode_pool = ThreadPoolExecutor(max_workers=DECODE_WORKERS)
+
+
+def get_pipeline():
+    global pipe
+
+    with load_lock:
+        if pipe is not None:
+            return pipe
+
+        import torch
+        from transformers import (
+            pipeline,
+            AutoModelForImageClassification,
+            AutoImageProcessor,
+        )
+
+        import logging
+
+        logging.basicConfig(level=logging.INFO)
+        logger = logging.getLogger(__name__)
+
+        logger.info("Downloading and loading Model...")
+        device = 0 if torch.cuda.is_available() else -1
+
+        try:
+            loaded = pipeline(
+                "image-classification", model=HF_MODEL_NAME, device=device
+            )
+        except Exception as e:  # Catch any exception during model loading
+            logger.error(f"Model loading failed: {e}")
+            if "huggingface_hub.errors.RepositoryNotFoundError" in str(e):
+                raise  # The specified model does not exist
+            logger.info("Trying to load using tensorflow.")
+            model = AutoModelForImageClassification.from_pretrained(
+                HF_MODEL_NAME, from_tf=True
+            )
+            processor = AutoImageProcessor.from_pretrained(HF_MODEL_NAME)
+            loaded = pipeline(
+                "image-classification",
+                model=model,
+                image_processor=processor,
+                device=device,
+            )
+
+        weights.commit()
+        logger.info("Model loaded.")
+        pipe = loaded
+        return pipe
+
+
+def run_pipeline(images):
+    return get_pipeline()(images, batch_size=BATCH_SIZE)
+
+
+def split_frames(body):
+    items = []
+    offset = 0
+    while offset < len(body):
+        if offset + 4 > len(body):
+            raise ValueError("Truncated frame header")
+        (length,) = struct.unpack_from(">I", body, offset)
+        offset += 4
+        if offset + length > len(body):
+            raise ValueError("Truncated frame")
+        items.append(body[offset : offset + length])
+        offset += length
+    return items
+
+
+def decode_image(item):
+    from io import BytesIO
+    from PIL import Image as PILImage
+
+    # JSON requests carry base64 strings, frames carry raw bytes
+    if isinstance(item, str):
+        item = base64.b64decode(item)
+    return PILImage.open(BytesIO(item)).convert("RGB")
+
+
+class MicroBatcher:
+    def __init__(self, run, batch_size, max_wait):
+        self.run = run
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def submit(self, images):
+        # Returns the outputs for `images`, the seconds they queued and the seconds
+        # the pipeline call that served them took
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.serve, daemon=True)
+                self.thread.start()
+        future = Future()
+        self.queue.put((images, future, time.perf_counter()))
+        return future.result()
+
+    def serve(self):
+        pending = None
+        while True:
+            batch = [pending or self.queue.get()]
+            pending = None
+            count = len(batch[0][0])
+            deadline = time.perf_counter() + self.max_wait
+            while count < self.batch_size:
+                timeout = max(0, deadline - time.perf_counter())
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if count + len(item[0]) > self.batch_size:
+                    pending = item
+                    break
+                batch.append(item)
+                count += len(item[0])
+
+            images = [image for item in batch for image in item[0]]
+            started = time.perf_counter()
+            try:
+                outputs = self.run(images)
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            forward = time.perf_counter() - started
+
+            offset = 0
+            for images, future, queued in batch:
+                result = outputs[offset : offset + len(images)]
+                future.set_result((result, started - queued, forward))
+                offset += len(images)
+
+
+batcher = MicroBatcher(run_pipeline, BATCH_SIZE, BATCH_WAIT)
+
+
+@app.function(
+    image=image,
+    volumes={"/weights": weights},
+    secrets=[settings],
+    keep_warm=int(os.environ["MODAL_KEEP_WARM"]),
+    container_idle_timeout=int(os.environ["MODAL_CONTAINER_IDLE_TIMEOUT"]),
+    allow_concurrent_inputs=int(os.environ["MODAL_CONCURRENT_INPUTS"]),
+)
+@modal.wsgi_app()
+def flask_app():
+    from flask import Flask, request
+
+    web_app = Flask(__name__)
+
+    @web_app.get("/health")
+    def health():
+        # Answers without loading the model, so deploys can compare hashes cheaply
+        return {"model_hash": MODEL_HASH, "loaded": pipe is not None}
+
+    @web_app.post("/infer")
+    def infer():
+        started = time.perf_counter()
+        if request.mimetype == FRAMES_CONTENT_TYPE:
+            try:
+                items = split_frames(request.get_data())
+            except ValueError:
+                return {"error": "Malformed frames."}, 400
+        else:
+            data = request.json
+            items = data.get("images")
+        if not items:
+            return {"output": "No images provided."}
+
+        try:
+            images = list(decode_pool.map(decode_image, items))
+        except Exception:
+            return {"error": "Malformed image."}, 400
+        decode = time.perf_counter() - started
+
+        try:
+            output, queued, forward = batcher.submit(images)
+        except Exception:
+            return {"error": "Model inference failed."}, 500
+
+        started = time.perf_counter()
+        body = json.dumps({"output": output})
+        encode = time.perf_counter() - started
+
+        response = web_app.response_class(body, mimetype="application/json")
+        response.headers["X-Decode-Ms"] = f"{decode * 1000:.1f}"
+        response.headers["X-Queue-Ms"] = f"{queued * 1000:.1f}"
+        response.headers["X-Forward-Ms"] = f"{forward * 1000:.1f}"
+        response.headers["X-Encode-Ms"] = f"{encode * 1000:.1f}"
+        return response
+
+    return web_app
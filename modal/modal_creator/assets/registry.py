@@ -0,0 +1,107 @@
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from contextlib import asynccontextmanager
+
+# Which model services are deployed is kept in memory, so inference requests never
+# shell out to the Modal CLI. The state is loaded at startup, updated by deploy/delete,
+# and reloaded from `modal app list` in the background every DEPLOYMENT_TTL seconds to
+# pick up apps started or stopped outside this service.
+
+DEPLOYMENT_TTL = float(os.getenv("DEPLOYMENT_TTL", "60"))
+
+logger = logging.getLogger(__name__)
+
+
+def list_deployed_services():
+    """Names of the apps Modal reports as deployed."""
+    output = subprocess.check_output(
+        ["modal", "app", "list", "--json"], stderr=subprocess.PIPE
+    )
+    return {
+        app["Description"] for app in json.loads(output) if app["State"] == "deployed"
+    }
+
+
+class DeploymentRegistry:
+    """
+    In-memory set of deployed service names.
+
+    Deploys and deletes of a service hold its asyncio lock (`service_lock`), so
+    concurrent requests for the same model run one after the other and see each
+    other's result.
+    A background refresh never overwrites a service that changed while it was listing.
+    """
+
+    def __init__(self, ttl=DEPLOYMENT_TTL, list_services=list_deployed_services):
+        self.ttl = ttl
+        self.list_services = list_services
+        self.deployed = set()
+        self.changed_at = {}
+        self.loaded = False
+        self.lock = threading.Lock()
+        self.service_locks = {}
+        self.stopped = threading.Event()
+        self.refresher = None
+
+    def refresh(self):
+        started_at = time.monotonic()
+        try:
+            services = self.list_services()
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            logger.error(f"Failed to list deployed services: {e}")
+            return False
+
+        with self.lock:
+            # Keep what deploy/delete recorded after the listing started
+            changed = {name for name, at in self.changed_at.items() if at >= started_at}
+            self.deployed = (services - changed) | (self.deployed & changed)
+            self.changed_at = {name: self.changed_at[name] for name in changed}
+            self.loaded = True
+        return True
+
+    def is_deployed(self, service_name):
+        if not self.loaded and self.refresher is None:
+            # Only when the startup hook did not run; otherwise a failed load is
+            # retried by the background refresher, not on the request path
+            self.refresh()
+        with self.lock:
+            return service_name in self.deployed
+
+    def mark(self, service_name, deployed):
+        with self.lock:
+            if deployed:
+                self.deployed.add(service_name)
+            else:
+                self.deployed.discard(service_name)
+            self.changed_at[service_name] = time.monotonic()
+
+    @asynccontextmanager
+    async def service_lock(self, service_name):
+        with self.lock:
+            lock = self.service_locks.setdefault(service_name, asyncio.Lock())
+        async with lock:
+            yield
+
+    def start(self):
+        self.refresh()
+        self.stopped.clear()
+        self.refresher = threading.Thread(target=self.run_refresher, daemon=True)
+        self.refresher.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.refresher:
+            self.refresher.join()
+            self.refresher = None
+
+    def run_refresher(self):
+        while not self.stopped.wait(self.ttl):
+            self.refresh()
+
+
+DEPLOYMENTS = DeploymentRegistry()
@@ -1,90 +1,206 @@
+import asyncio
 import base64
+import hashlib
+import json
+import multiprocessing
 import os
-import subprocess
+import struct
 import shutil
-
-import requests
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import httpx
 from fastapi import HTTPException
 import uuid
 
+from modal_creator.assets.registry import DEPLOYMENTS, DeploymentRegistry
 
-def generate_main_py(hf_model_name, service_name):
-    content = f"""import modal
-from pathlib import Path
-
-app = modal.App(name="{service_name}")
-image = modal.Image.debian_slim(python_version="3.11").pip_install(
-    "flask", "Pillow", "torch", "torchvision", "transformers", "tensorflow", "tf-keras"
+# Calls to the deployed services share one pooled, keep-alive async client, and Modal
+# CLI commands run as asyncio subprocesses, so a slow deploy or inference never holds
+# up other requests.
+MODAL_ENDPOINT_TEMPLATE = os.getenv(
+    "MODAL_ENDPOINT_TEMPLATE",
+    "https://wdorji--{service_name}-flask-app.modal.run/infer",
 )
+MODAL_TIMEOUT = float(os.getenv("MODAL_TIMEOUT", "300"))
+MODAL_MAX_CONNECTIONS = int(os.getenv("MODAL_MAX_CONNECTIONS", "100"))
+
+http_client = None
+http_client_loop = None
+
+# Every model deploys the same app file, model_app.py, with the model and settings
+# passed in its environment, so Modal builds its image once. With
+# MODAL_DEPLOY_ARTIFACT=codegen, each deploy writes a per-model copy with the settings
+# written in instead.
+MODEL_APP_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "model_app.py"
+)
+MODAL_DEPLOY_ARTIFACT = os.getenv("MODAL_DEPLOY_ARTIFACT", "template")
+
+# Model apps keep MODAL_KEEP_WARM containers running and cache HuggingFace weights in
+# the MODAL_WEIGHTS_VOLUME volume, which survives app deletion. Each app reports the
+# hash of its source and settings at /health; with MODAL_DEPLOY_MODE=hash, a deploy
+# whose hash matches the live app's returns without redeploying or verifying it.
+MODAL_KEEP_WARM = int(os.getenv("MODAL_KEEP_WARM", "1"))
+MODAL_CONTAINER_IDLE_TIMEOUT = int(os.getenv("MODAL_CONTAINER_IDLE_TIMEOUT", "300"))
+MODAL_CONCURRENT_INPUTS = int(os.getenv("MODAL_CONCURRENT_INPUTS", "16"))
+MODAL_WEIGHTS_VOLUME = os.getenv("MODAL_WEIGHTS_VOLUME", "constellation-hf-weights")
+MODAL_DEPLOY_MODE = os.getenv("MODAL_DEPLOY_MODE", "history")
+
+# Inside a model app, images are decoded on MODAL_DECODE_WORKERS threads and
+# concurrent requests are merged into pipeline calls of up to MODAL_PIPELINE_BATCH_SIZE
+# images, waiting at most MODAL_BATCH_WAIT_MS for more after the first arrives.
+MODAL_PIPELINE_BATCH_SIZE = int(os.getenv("MODAL_PIPELINE_BATCH_SIZE", "16"))
+MODAL_BATCH_WAIT_MS = float(os.getenv("MODAL_BATCH_WAIT_MS", "10"))
+MODAL_DECODE_WORKERS = int(os.getenv("MODAL_DECODE_WORKERS", "8"))
+
+# Model services run on Modal, or on this host with INFERENCE_BACKEND=local (offline
+# load tests, on-prem). The local backend keeps a process pool per deployed model and
+# shuts pools down after LOCAL_IDLE_TIMEOUT seconds without requests; the next request
+# starts them again.
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "modal")
+LOCAL_WORKERS_PER_MODEL = int(os.getenv("LOCAL_WORKERS_PER_MODEL", "1"))
+LOCAL_IDLE_TIMEOUT = float(os.getenv("LOCAL_IDLE_TIMEOUT", "600"))
+
+# /infer accepts images as base64 strings in JSON or, more cheaply, as a length-prefixed
+# frame stream: each image's raw bytes preceded by its length as a 4-byte big-endian
+# integer. Deployed apps that predate frames answer 415, and get JSON instead.
+FRAMES_CONTENT_TYPE = "application/x-constellation-frames"
+
+
+def encode_frames(items):
+    return b"".join(struct.pack(">I", len(item)) + item for item in items)
+
+
+def decode_frames(body):
+    items = []
+    offset = 0
+    while offset < len(body):
+        if offset + 4 > len(body):
+            raise ValueError("Truncated frame header")
+        (length,) = struct.unpack_from(">I", body, offset)
+        offset += 4
+        if offset + length > len(body):
+            raise ValueError("Truncated frame")
+        items.append(body[offset : offset + length])
+        offset += length
+    return items
+
+
+def model_app_source():
+    with open(MODEL_APP_PATH) as f:
+        return f.read()
+
+
+def deployment_env(hf_model_name, service_name):
+    """
+    The environment a model's app is deployed with. MODEL_HASH digests the app source
+    and the other settings, so it changes whenever the deployed app would.
+    """
+    env = {
+        "HF_MODEL_NAME": hf_model_name,
+        "MODEL_SERVICE_NAME": service_name,
+        "FRAMES_CONTENT_TYPE": FRAMES_CONTENT_TYPE,
+        "MODAL_PIPELINE_BATCH_SIZE": str(MODAL_PIPELINE_BATCH_SIZE),
+        "MODAL_BATCH_WAIT_MS": str(MODAL_BATCH_WAIT_MS),
+        "MODAL_DECODE_WORKERS": str(MODAL_DECODE_WORKERS),
+        "MODAL_WEIGHTS_VOLUME": MODAL_WEIGHTS_VOLUME,
+        "MODAL_KEEP_WARM": str(MODAL_KEEP_WARM),
+        "MODAL_CONTAINER_IDLE_TIMEOUT": str(MODAL_CONTAINER_IDLE_TIMEOUT),
+        "MODAL_CONCURRENT_INPUTS": str(MODAL_CONCURRENT_INPUTS),
+    }
+    digest = hashlib.sha256(model_app_source().encode("utf-8"))
+    digest.update(json.dumps(env, sort_keys=True).encode("utf-8"))
+    env["MODEL_HASH"] = digest.hexdigest()[:16]
+    return env
 
-@app.function(image=image)
-@modal.wsgi_app()
-def flask_app():
-    from flask import Flask, request
 
-    web_app = Flask(__name__)
+def render_main_py(hf_model_name, service_name):
+    """
+    A standalone copy of the model app with the model's settings written in (the
+    MODAL_DEPLOY_ARTIFACT=codegen path), and its model hash.
+    """
+    env = deployment_env(hf_model_name, service_name)
+    header = f"import os\n\nos.environ.update({json.dumps(env, indent=4)})\n\n"
+    return header + model_app_source(), env["MODEL_HASH"]
 
-    from transformers import pipeline, AutoModelForImageClassification, AutoImageProcessor
 
-    from io import BytesIO
-    from PIL import Image as PILImage
+def generate_main_py(hf_model_name, service_name):
+    content, model_hash = render_main_py(hf_model_name, service_name)
+    with open(f"{service_name}/main.py", "w") as f:
+        f.write(content)
+    return model_hash
 
-    import logging
 
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
+def service_endpoint(service_name):
+    return MODAL_ENDPOINT_TEMPLATE.format(service_name=service_name)
 
-    logger.info("Downloading and loading Model...")
 
-    # Initialize the pipeline
+def get_http_client():
+    """
+    The shared client for calls to the deployed services, created on first use. There
+    is one per event loop; the server runs a single loop, so in practice only one.
+    """
+    global http_client, http_client_loop
 
-    try:
-        pipe = pipeline("image-classification", model="{hf_model_name}")
-    except Exception as e:  # Catch any exception during model loading
-        logger.error(f"Model loading failed: {{e}}")
-        if "huggingface_hub.errors.RepositoryNotFoundError" in str(e):  
-            return {{"error": "The specified model does not exist."}}  # Return error if model does not exist
-        try:
-            logger.info("Trying to load using tensorflow.")
-            model = AutoModelForImageClassification.from_pretrained("{hf_model_name}", from_tf=True)
-            processor = AutoImageProcessor.from_pretrained("{hf_model_name}")
-            pipe = pipeline("image-classification", model=model, image_processor=processor)
-        except Exception as tf_exception:
-            logger.error(f"TensorFlow model loading failed: {{tf_exception}}")
-            return {{"error": "Failed to load model using TensorFlow."}}  # Return error if TensorFlow loading fails
-            
-    logger.info("Model loaded.")
-
-    @web_app.post("/infer")
-    def infer():
-        data = request.json
-        images = data.get('images')
-        if not images:
-            return {{"output": "No images provided."}}
-        
-        try:
-            output = pipe(images)
-            return {{"output": output}}
-        
-        except Exception as e:
-            raise HTTPException(status_code=500, detail="Model inference failed")
-
-    return web_app
-"""
-    with open(f"{service_name}/main.py", "w") as f:
-        f.write(content)
+    loop = asyncio.get_running_loop()
+    if http_client is None or http_client_loop is not loop:
+        http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(MODAL_TIMEOUT, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=MODAL_MAX_CONNECTIONS,
+                max_keepalive_connections=MODAL_MAX_CONNECTIONS,
+            ),
+        )
+        http_client_loop = loop
+    return http_client
+
+
+async def close_http_client():
+    global http_client, http_client_loop
+
+    if http_client is not None:
+        await http_client.aclose()
+    http_client = None
+    http_client_loop = None
+
+
+async def run_modal(*args, env=None):
+    """
+    Runs a Modal CLI command without blocking the event loop. `env` is added to this
+    process's environment.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "modal",
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env={**os.environ, **env} if env else None,
+    )
+    output, _ = await process.communicate()
+    return process.returncode, output
 
 
-def check_service_deployed(service_name):
+async def check_service_deployed(service_name):
 
-    try:
-        subprocess.check_output(
-            ["modal", "app", "history", service_name], stderr=subprocess.STDOUT
-        )
+    returncode, _ = await run_modal("app", "history", service_name)
+    return returncode == 0
 
-        return True
-    except subprocess.CalledProcessError as e:
-        return False
+
+async def live_model_hash(service_name):
+    """The model hash reported by the deployed app, or None if it does not answer."""
+    health = service_endpoint(service_name).rsplit("/", 1)[0] + "/health"
+    try:
+        response = await get_http_client().get(health)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    return response.json().get("model_hash")
 
 
 def convert_image_to_base64(image_path):
@@ -97,81 +213,399 @@ def get_service_code(hf_model_name):
     return str(uuid.uuid5(uuid.NAMESPACE_URL, hf_model_name))
 
 
-def deploy_model_service(hf_model_name):
+async def stop_model_service(hf_model_name, service_name):
+
+    returncode, output = await run_modal("app", "stop", service_name)
+    if returncode != 0:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Issue with deleting {hf_model_name} deployment: {output.decode()}",
+        )
+    DEPLOYMENTS.mark(service_name, False)
+
+
+async def deploy_model_service(hf_model_name):
 
     service_name = get_service_code(hf_model_name)
+    endpoint = service_endpoint(service_name)
+
+    async with DEPLOYMENTS.service_lock(service_name):
+        # Concurrent deploys of the same model wait here, then find it deployed
+        if MODAL_DEPLOY_MODE == "hash":
+            # Only an app generated from the same source counts; any other is replaced
+            model_hash = deployment_env(hf_model_name, service_name)["MODEL_HASH"]
+            deployed = await live_model_hash(service_name) == model_hash
+        else:
+            deployed = await check_service_deployed(service_name)
+        if deployed:
+            DEPLOYMENTS.mark(service_name, True)
+            return {
+                "message": f"{hf_model_name} has already been deployed.",
+                "endpoint": endpoint,
+                "service_name": service_name,
+            }
+
+        if MODAL_DEPLOY_ARTIFACT == "codegen":
+            # Create the directory if it doesn't exist
+            os.makedirs(service_name, exist_ok=True)
+            try:
+                generate_main_py(hf_model_name, service_name)
+                returncode, _ = await run_modal("deploy", f"{service_name}/main.py")
+            finally:
+                # delete directory and its contents
+                shutil.rmtree(service_name)
+        else:
+            returncode, _ = await run_modal(
+                "deploy",
+                MODEL_APP_PATH,
+                env=deployment_env(hf_model_name, service_name),
+            )
+
+        if returncode != 0:
+            raise HTTPException(
+                status_code=500, detail=f"Issue with deploying model on modal"
+            )
+
+        try:
+            verify_model_service = await get_http_client().post(
+                endpoint,
+                json={
+                    "images": [
+                        convert_image_to_base64("modal_creator/assets/forest.jpg")
+                    ]
+                },
+            )
+            verified = verify_model_service.status_code == 200
+        except httpx.HTTPError:
+            verified = False
+
+        DEPLOYMENTS.mark(service_name, True)
+
+        if not verified:
+            await stop_model_service(hf_model_name, service_name)
+            raise HTTPException(
+                status_code=500, detail=f"Issue with deploying model on modal"
+            )
 
-    if check_service_deployed(service_name):
         return {
-            "message": f"{hf_model_name} has already been deployed.",
-            "endpoint": f"https://wdorji--{service_name}-flask-app.modal.run/infer",
+            "message": f"{hf_model_name} has been deployed succesfully!",
+            "endpoint": endpoint,
             "service_name": service_name,
         }
 
-    # Create the directory if it doesn't exist
-    os.makedirs(service_name, exist_ok=True)
-    generate_main_py(hf_model_name, service_name)
 
+async def delete_model_service(hf_model_name):
+
+    service_name = get_service_code(hf_model_name)
+
+    async with DEPLOYMENTS.service_lock(service_name):
+        if not await check_service_deployed(service_name):
+            DEPLOYMENTS.mark(service_name, False)
+            return {"message": f"{hf_model_name} has not been deployed yet."}
+
+        await stop_model_service(hf_model_name, service_name)
+        return {"message": f"{hf_model_name} has been deleted succesfully!"}
+
+
+async def post_model_inference(model_name, data):
+
+    service_name = get_service_code(model_name)
+
+    # In-memory lookup: the hot path never runs the Modal CLI
+    if not DEPLOYMENTS.is_deployed(service_name):
+        return {"message": f"{model_name} has not been deployed yet."}
+
+    endpoint = service_endpoint(service_name)
+    client = get_http_client()
+    images = data["data"]
     try:
-        subprocess.check_output(
-            ["modal", "deploy", f"{service_name}/main.py"], stderr=subprocess.STDOUT
-        )
-    except subprocess.CalledProcessError as e:
-        raise HTTPException(
-            status_code=500, detail=f"Issue with deploying model on modal"
-        )
+        response = None
+        if images and isinstance(images[0], bytes):
+            response = await client.post(
+                endpoint,
+                content=encode_frames(images),
+                headers={"Content-Type": FRAMES_CONTENT_TYPE},
+            )
+            if response.status_code == 415:
+                # Deployed before frames existed
+                images = [base64.b64encode(image).decode("utf-8") for image in images]
+                response = None
+        if response is None:
+            response = await client.post(endpoint, json={"images": images})
+    except httpx.HTTPError:
+        raise HTTPException(status_code=500, detail=f"Model inference failed")
+
+    if response.status_code == 200:
+        return response.json()
+    raise HTTPException(status_code=500, detail=f"Model inference failed")
 
-    # delete directory and its contents
-    shutil.rmtree(service_name)
 
-    verify_model_service = requests.post(
-        f"https://wdorji--{service_name}-flask-app.modal.run/infer",
-        json={"images": [convert_image_to_base64("modal_creator/assets/forest.jpg")]},
-    )
+class InferenceBackend(ABC):
+    """
+    Where model services run. deploy, delete and infer return the same responses
+    whatever the backend, so callers (the dagster ops) do not need to know which one
+    is configured.
+    """
 
-    if not verify_model_service.status_code == 200:
-        delete_model_service(hf_model_name)
-        raise HTTPException(
-            status_code=500, detail=f"Issue with deploying model on modal"
-        )
+    async def start(self):
+        pass
 
-    return {
-        "message": f"{hf_model_name} has been deployed succesfully!",
-        "endpoint": f"https://wdorji--{service_name}-flask-app.modal.run/infer",
-        "service_name": service_name,
-    }
+    async def close(self):
+        pass
 
+    @abstractmethod
+    async def deploy(self, hf_model_name):
+        pass
 
-def delete_model_service(hf_model_name):
+    @abstractmethod
+    async def delete(self, hf_model_name):
+        pass
 
-    service_name = get_service_code(hf_model_name)
+    @abstractmethod
+    async def infer(self, model_name, data):
+        pass
 
-    if not check_service_deployed(service_name):
-        return {"message": f"{hf_model_name} has not been deployed yet."}
 
-    try:
-        subprocess.check_output(
-            ["modal", "app", "stop", service_name], stderr=subprocess.STDOUT
+class ModalBackend(InferenceBackend):
+    """Generated Modal apps, deployed with the Modal CLI."""
+
+    async def start(self):
+        # Load which services are deployed, then keep it fresh in the background
+        DEPLOYMENTS.start()
+
+    async def close(self):
+        DEPLOYMENTS.stop()
+        await close_http_client()
+
+    async def deploy(self, hf_model_name):
+        return await deploy_model_service(hf_model_name)
+
+    async def delete(self, hf_model_name):
+        return await delete_model_service(hf_model_name)
+
+    async def infer(self, model_name, data):
+        return await post_model_inference(model_name, data)
+
+
+def load_hf_pipeline(hf_model_name):
+    """Loads an image-classification pipeline that takes raw image bytes."""
+    from io import BytesIO
+
+    from PIL import Image as PILImage
+    from transformers import pipeline
+
+    pipe = pipeline("image-classification", model=hf_model_name)
+
+    def classify(images):
+        return pipe([PILImage.open(BytesIO(image)) for image in images])
+
+    return classify
+
+
+# Set in each local worker process by init_worker
+worker_pipeline = None
+
+
+def init_worker(load_pipeline, hf_model_name):
+    global worker_pipeline
+
+    worker_pipeline = load_pipeline(hf_model_name)
+
+
+def worker_ready():
+    return worker_pipeline is not None
+
+
+def run_worker_pipeline(images):
+    return worker_pipeline(images)
+
+
+class LocalModelPool:
+    """The worker processes of one model, each holding its own loaded pipeline."""
+
+    def __init__(self, hf_model_name, load_pipeline, workers, mp_context):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=init_worker,
+            initargs=(load_pipeline, hf_model_name),
         )
-    except subprocess.CalledProcessError as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Issue with deleting {hf_model_name} deployment: {e.output.decode()}",
+        self.last_used = time.monotonic()
+        self.in_flight = 0
+
+    async def warm_up(self):
+        # Each submission starts one more worker, until all of them are loaded
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(self.executor, worker_ready)
+                for _ in range(self.workers)
+            ]
         )
 
-    return {"message": f"{hf_model_name} has been deleted succesfully!"}
+    async def run(self, images):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, run_worker_pipeline, images)
+
+    def acquire(self):
+        self.in_flight += 1
+
+    def release(self):
+        self.in_flight -= 1
+        self.last_used = time.monotonic()
+
+    def idle_for(self):
+        return 0 if self.in_flight else time.monotonic() - self.last_used
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LocalBackend(InferenceBackend):
+    """
+    HuggingFace pipelines in process pools on this host. A deployed model stays
+    deployed when its pool is evicted for idleness; only its workers are stopped.
+    """
+
+    def __init__(
+        self,
+        load_pipeline=load_hf_pipeline,
+        workers_per_model=LOCAL_WORKERS_PER_MODEL,
+        idle_timeout=LOCAL_IDLE_TIMEOUT,
+        mp_context="spawn",
+    ):
+        self.load_pipeline = load_pipeline
+        self.workers_per_model = workers_per_model
+        self.idle_timeout = idle_timeout
+        self.mp_context = mp_context
+        self.deployments = DeploymentRegistry(list_services=set)
+        self.models = {}
+        self.pools = {}
+        self.pool_locks = defaultdict(asyncio.Lock)
+        self.evictor = None
+
+    async def start(self):
+        self.evictor = asyncio.create_task(self.run_evictor())
+
+    async def close(self):
+        if self.evictor:
+            self.evictor.cancel()
+        for pool in self.pools.values():
+            pool.shutdown()
+        self.pools.clear()
+
+    async def run_evictor(self):
+        while True:
+            await asyncio.sleep(min(self.idle_timeout / 4, 30))
+            self.evict_idle()
+
+    def evict_idle(self):
+        for service_name, pool in list(self.pools.items()):
+            if pool.idle_for() >= self.idle_timeout:
+                pool.shutdown()
+                del self.pools[service_name]
+
+    @asynccontextmanager
+    async def use_pool(self, service_name):
+        """
+        The model's pool, started (and warmed) if it is not running. The pool counts
+        as in flight from the moment it is fetched until the block exits, so the idle
+        evictor cannot shut it down underneath the caller.
+        """
+        async with self.pool_locks[service_name]:
+            pool = self.pools.get(service_name)
+            started = pool is None
+            if started:
+                pool = LocalModelPool(
+                    self.models[service_name],
+                    self.load_pipeline,
+                    self.workers_per_model,
+                    self.mp_context,
+                )
+                self.pools[service_name] = pool
+            pool.acquire()
+            if started:
+                try:
+                    await pool.warm_up()
+                except BrokenProcessPool:
+                    # A worker failed to load the model
+                    pool.release()
+                    pool.shutdown()
+                    self.pools.pop(service_name, None)
+                    raise
+        try:
+            yield pool
+        finally:
+            pool.release()
+
+    async def deploy(self, hf_model_name):
+        service_name = get_service_code(hf_model_name)
+        endpoint = f"local://{service_name}"
+
+        async with self.deployments.service_lock(service_name):
+            if self.deployments.is_deployed(service_name):
+                return {
+                    "message": f"{hf_model_name} has already been deployed.",
+                    "endpoint": endpoint,
+                    "service_name": service_name,
+                }
+
+            self.models[service_name] = hf_model_name
+            try:
+                async with self.use_pool(service_name):
+                    pass
+            except BrokenProcessPool:
+                raise HTTPException(
+                    status_code=500, detail=f"Issue with deploying model locally"
+                )
+            self.deployments.mark(service_name, True)
+
+            return {
+                "message": f"{hf_model_name} has been deployed succesfully!",
+                "endpoint": endpoint,
+                "service_name": service_name,
+            }
+
+    async def delete(self, hf_model_name):
+        service_name = get_service_code(hf_model_name)
+
+        async with self.deployments.service_lock(service_name):
+            if not self.deployments.is_deployed(service_name):
+                return {"message": f"{hf_model_name} has not been deployed yet."}
+
+            pool = self.pools.pop(service_name, None)
+            if pool:
+                pool.shutdown()
+            self.deployments.mark(service_name, False)
+            return {"message": f"{hf_model_name} has been deleted succesfully!"}
+
+    async def infer(self, model_name, data):
+        service_name = get_service_code(model_name)
+
+        if not self.deployments.is_deployed(service_name):
+            return {"message": f"{model_name} has not been deployed yet."}
+
+        images = data["data"]
+        if not images:
+            return {"output": "No images provided."}
+        # Workers take raw bytes; JSON requests carry base64
+        images = [
+            image if isinstance(image, bytes) else base64.b64decode(image)
+            for image in images
+        ]
 
+        try:
+            async with self.use_pool(service_name) as pool:
+                return {"output": await pool.run(images)}
+        except Exception:
+            raise HTTPException(status_code=500, detail=f"Model inference failed")
 
-def post_model_inference(model_name, data):
 
-    service_name = get_service_code(model_name)
+INFERENCE_BACKENDS = {"modal": ModalBackend, "local": LocalBackend}
 
-    if not check_service_deployed(service_name):
-        return {"message": f"{model_name} has not been deployed yet."}
-
-    endpoint = f"https://wdorji--{service_name}-flask-app.modal.run/infer"
-    response = requests.post(endpoint, json={"images": data["data"]})
 
-    if response.status_code == 200:
-        return response.json()
-    raise HTTPException(status_code=500, detail=f"Model inference failed")
+def get_backend(name=INFERENCE_BACKEND):
+    if name not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unknown inference backend: {name}")
+    return INFERENCE_BACKENDS[name]()
@@ -0,0 +1,121 @@
+"""
+Benchmark: deploy-time cost of the shared model app vs a generated main.py per model.
+
+For `--models` model names, prepares each deploy the way `deploy_model_service` does:
+
+- "codegen": writes `{service_name}/main.py` with the settings written in, hashes it as
+  Modal does before uploading it, then removes the directory;
+- "template": builds the deploy environment for the shared `model_app.py`.
+
+and reports the local time per deploy and how many distinct bytes Modal would have to
+upload. With `--deploy`, it also runs `modal deploy` for the first `--deploy-models`
+models along each path, timing each deploy and stopping the apps afterwards (this
+needs Modal credentials).
+
+Usage (from the modal/ directory):
+    python -m modal_creator.scripts.benchmark_deploy --models 200
+    python -m modal_creator.scripts.benchmark_deploy --models 200 --deploy
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+from modal_creator.assets.utils import (
+    MODEL_APP_PATH,
+    deployment_env,
+    generate_main_py,
+    get_service_code,
+    run_modal,
+)
+
+
+def digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest(), os.path.getsize(path)
+
+
+def prepare_codegen(hf_model_name, uploads):
+    service_name = get_service_code(hf_model_name)
+    os.makedirs(service_name, exist_ok=True)
+    try:
+        generate_main_py(hf_model_name, service_name)
+        key, size = digest(f"{service_name}/main.py")
+        uploads[key] = size
+    finally:
+        shutil.rmtree(service_name)
+
+
+def prepare_template(hf_model_name, uploads):
+    deployment_env(hf_model_name, get_service_code(hf_model_name))
+    key, size = digest(MODEL_APP_PATH)
+    uploads[key] = size
+
+
+def report(label, prepare, models):
+    uploads = {}
+    start = time.perf_counter()
+    for model in models:
+        prepare(model, uploads)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<10} {elapsed / len(models) * 1000:8.3f} ms/deploy  "
+        f"{len(uploads):>5} distinct files  {sum(uploads.values()) / 1024:9.1f} KiB "
+        "to upload"
+    )
+
+
+async def deploy(label, hf_model_name):
+    service_name = get_service_code(hf_model_name)
+    start = time.perf_counter()
+    if label == "codegen":
+        os.makedirs(service_name, exist_ok=True)
+        try:
+            generate_main_py(hf_model_name, service_name)
+            returncode, output = await run_modal("deploy", f"{service_name}/main.py")
+        finally:
+            shutil.rmtree(service_name)
+    else:
+        returncode, output = await run_modal(
+            "deploy",
+            MODEL_APP_PATH,
+            env=deployment_env(hf_model_name, service_name),
+        )
+    elapsed = time.perf_counter() - start
+    await run_modal("app", "stop", service_name)
+    if returncode != 0:
+        raise RuntimeError(output.decode())
+    print(f"{label:<10} {hf_model_name:<40} modal deploy {elapsed:7.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, default=200)
+    parser.add_argument(
+        "--deploy", action="store_true", help="Also run modal deploy for real."
+    )
+    parser.add_argument("--deploy-models", type=int, default=2)
+    args = parser.parse_args()
+
+    models = [f"benchmark/model-{i:05d}" for i in range(args.models)]
+    workdir = tempfile.mkdtemp(prefix="benchmark-deploy-")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        report("codegen", prepare_codegen, models)
+        report("template", prepare_template, models)
+        if args.deploy:
+            for label in ["codegen", "template"]:
+                for model in models[: args.deploy_models]:
+                    asyncio.run(deploy(label, model))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,16 @@
+import asyncio
+import base64
+import io
+import json
 import subprocess
+import threading
+import time
+import types
+import httpx
 import pytest
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
 from fastapi.testclient import TestClient
 
 import os
@@ -10,7 +21,19 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..",
 os.chdir("..")
 
 from modal_creator.app.main import app
-from modal_creator.assets.utils import get_service_code, convert_image_to_base64
+from modal_creator.assets.registry import DEPLOYMENTS, DeploymentRegistry
+from modal_creator.assets.utils import (
+    FRAMES_CONTENT_TYPE,
+    MODAL_MAX_CONNECTIONS,
+    InferenceBackend,
+    LocalBackend,
+    close_http_client,
+    encode_frames,
+    get_service_code,
+    convert_image_to_base64,
+    render_main_py,
+    MODEL_APP_PATH,
+)
 
 
 client = TestClient(app)
@@ -82,6 +105,43 @@ def test_infer():
     subprocess.run(["modal", "app", "stop", service_name])
 
 
+def test_infer_frames():
+
+    with open("modal_creator/assets/forest.jpg", "rb") as image_file:
+        frames = encode_frames([image_file.read()])
+    headers = {"Content-Type": FRAMES_CONTENT_TYPE}
+
+    # A frame header promising more bytes than were sent
+    response = client.post(
+        "/infer?model_name=" + VALID_MODEL_NAME,
+        content=b"\x00\x00\x00\x09",
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        "/infer?model_name=" + VALID_MODEL_NAME,
+        content=b"images",
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 415
+
+    service_name = get_service_code(VALID_MODEL_NAME)
+    subprocess.run(["modal", "app", "stop", service_name])
+
+    client.get("/deploy?model_name=" + VALID_MODEL_NAME)
+
+    response = client.post(
+        "/infer?model_name=" + VALID_MODEL_NAME, content=frames, headers=headers
+    )
+    assert response.status_code == 200
+    assert (
+        max(response.json()["output"][0], key=lambda x: x["score"])["label"] == "Normal"
+    )
+
+    subprocess.run(["modal", "app", "stop", service_name])
+
+
 def test_delete():
 
     response = client.delete("/delete?model_name=" + VALID_MODEL_NAME)
@@ -100,3 +160,396 @@ def test_delete():
     assert response.json() == {
         "message": f"{VALID_MODEL_NAME} has been deleted succesfully!"
     }
+
+
+@contextmanager
+def fake_model_service(delay):
+    """
+    A local stand-in for the deployed Modal apps: answers /infer after `delay` seconds
+    and records the peak number of requests in flight and of connections opened.
+    """
+    stats = {"in_flight": 0, "peak": 0, "connections": 0, "model_hash": None}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with lock:
+                stats["connections"] += 1
+
+        def do_GET(self):
+            # /health of the generated apps
+            body = json.dumps({"model_hash": stats["model_hash"], "loaded": True})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            with lock:
+                stats["in_flight"] += 1
+                stats["peak"] = max(stats["peak"], stats["in_flight"])
+            time.sleep(delay)
+            with lock:
+                stats["in_flight"] -= 1
+
+            body = json.dumps({"output": [[{"label": "Normal", "score": 1.0}]]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        # The default listen backlog of 5 would refuse most of a burst
+        request_queue_size = 128
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    template = f"http://127.0.0.1:{server.server_address[1]}/{{service_name}}/infer"
+    try:
+        with mock.patch.object(DEPLOYMENTS, "loaded", True), mock.patch.object(
+            DEPLOYMENTS, "deployed", {get_service_code(VALID_MODEL_NAME)}
+        ), mock.patch("modal_creator.assets.utils.MODAL_ENDPOINT_TEMPLATE", template):
+            yield stats
+    finally:
+        server.shutdown()
+
+
+def test_infer_does_not_run_modal_cli():
+
+    data = {"data": [convert_image_to_base64("modal_creator/assets/forest.jpg")]}
+
+    with fake_model_service(delay=0), mock.patch(
+        "asyncio.create_subprocess_exec"
+    ) as create_subprocess_exec, mock.patch("subprocess.check_output") as check_output:
+        for _ in range(10):
+            response = client.post("/infer?model_name=" + VALID_MODEL_NAME, json=data)
+            assert response.status_code == 200
+            assert response.json()["output"][0][0]["label"] == "Normal"
+
+    create_subprocess_exec.assert_not_called()
+    check_output.assert_not_called()
+
+
+def test_concurrent_inference_load():
+
+    # 100 inferences of 0.2 s each would take 20 s one after the other, and a slow
+    # deploy must not hold them up
+    requests_count = 100
+    data = {"data": [convert_image_to_base64("modal_creator/assets/forest.jpg")]}
+
+    async def slow_modal_cli(*args):
+        await asyncio.sleep(2)
+        return 0, b""
+
+    async def load():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            deploy = asyncio.create_task(
+                c.get("/deploy?model_name=" + INVALID_MODEL_NAME)
+            )
+            start = time.perf_counter()
+            responses = await asyncio.gather(
+                *[
+                    c.post("/infer?model_name=" + VALID_MODEL_NAME, json=data)
+                    for _ in range(requests_count)
+                ]
+            )
+            elapsed = time.perf_counter() - start
+            await deploy
+        await close_http_client()
+        return responses, elapsed
+
+    with fake_model_service(delay=0.2) as stats, mock.patch(
+        "modal_creator.assets.utils.run_modal", side_effect=slow_modal_cli
+    ):
+        responses, elapsed = asyncio.run(load())
+
+    assert [response.status_code for response in responses] == [200] * requests_count
+    assert elapsed < 2
+    assert stats["peak"] > 10
+    # Keep-alive connections are reused rather than opened per request
+    assert stats["connections"] <= MODAL_MAX_CONNECTIONS
+
+
+def test_generated_app():
+
+    service_name = get_service_code(VALID_MODEL_NAME)
+    content, model_hash = render_main_py(VALID_MODEL_NAME, service_name)
+
+    compile(content, "main.py", "exec")
+    assert f'"MODEL_HASH": "{model_hash}"' in content
+    assert "keep_warm=" in content
+    assert "modal.Volume.from_name(" in content
+    assert render_main_py(VALID_MODEL_NAME, service_name)[1] == model_hash
+    assert render_main_py(INVALID_MODEL_NAME, service_name)[1] != model_hash
+
+
+@contextmanager
+def load_generated_app(content):
+    """Runs a generated main.py against a stand-in for the Modal client library."""
+
+    class Builder:
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: self
+
+    fake_modal = types.ModuleType("modal")
+    fake_modal.App = lambda name: types.SimpleNamespace(
+        function=lambda **kwargs: lambda f: f
+    )
+    fake_modal.Image = Builder()
+    fake_modal.Volume = Builder()
+    fake_modal.Secret = Builder()
+    fake_modal.wsgi_app = lambda: lambda f: f
+
+    generated = types.ModuleType("main")
+    generated.__file__ = os.path.abspath("main.py")
+    with mock.patch.dict(
+        "sys.modules", {"modal": fake_modal, "main": generated}
+    ), mock.patch.dict(os.environ):
+        exec(compile(content, "main.py", "exec"), generated.__dict__)
+        yield generated.__dict__
+
+
+def test_generated_app_batches_concurrent_requests():
+    from PIL import Image as PILImage
+
+    content, _ = render_main_py(VALID_MODEL_NAME, get_service_code(VALID_MODEL_NAME))
+    with load_generated_app(content) as generated:
+        web_app = generated["flask_app"]().test_client()
+
+    calls = []
+
+    def fake_pipe(images, batch_size):
+        calls.append((len(images), batch_size))
+        time.sleep(0.05)
+        return [[{"label": f"{image.width}x{image.height}"}] for image in images]
+
+    generated["get_pipeline"] = lambda: fake_pipe
+
+    def image_bytes(size):
+        buffer = io.BytesIO()
+        PILImage.new("RGB", (size, size)).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    responses = {}
+
+    def post(size):
+        if size % 2:
+            responses[size] = web_app.post(
+                "/infer",
+                data=encode_frames([image_bytes(size)] * 2),
+                content_type=FRAMES_CONTENT_TYPE,
+            )
+        else:
+            image = base64.b64encode(image_bytes(size)).decode("utf-8")
+            responses[size] = web_app.post("/infer", json={"images": [image] * 2})
+
+    threads = [threading.Thread(target=post, args=(size,)) for size in range(1, 21)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for size, response in responses.items():
+        assert response.status_code == 200
+        assert response.json == {"output": [[{"label": f"{size}x{size}"}]] * 2}
+        for header in ["X-Decode-Ms", "X-Queue-Ms", "X-Forward-Ms", "X-Encode-Ms"]:
+            assert float(response.headers[header]) >= 0
+
+    # 20 requests of 2 images were merged into fewer pipeline calls, none over the
+    # batch size
+    batch_size = generated["BATCH_SIZE"]
+    assert sum(images for images, _ in calls) == 40
+    assert len(calls) < 20
+    assert all(images <= batch_size and size == batch_size for images, size in calls)
+
+    response = web_app.post(
+        "/infer", data=b"\x00\x00\x00\x09abc", content_type=FRAMES_CONTENT_TYPE
+    )
+    assert response.status_code == 400
+
+
+def test_deploy_skips_live_model_with_same_hash():
+
+    service_name = get_service_code(VALID_MODEL_NAME)
+    _, model_hash = render_main_py(VALID_MODEL_NAME, service_name)
+
+    with fake_model_service(delay=0) as stats, mock.patch(
+        "modal_creator.assets.utils.MODAL_DEPLOY_MODE", "hash"
+    ), mock.patch(
+        "modal_creator.assets.utils.run_modal", side_effect=Exception("redeployed")
+    ) as run_modal:
+        stats["model_hash"] = model_hash
+        response = client.get("/deploy?model_name=" + VALID_MODEL_NAME)
+        assert response.status_code == 200
+        assert response.json()["message"] == (
+            f"{VALID_MODEL_NAME} has already been deployed."
+        )
+        run_modal.assert_not_called()
+
+        # A live app generated from other source is redeployed
+        stats["model_hash"] = "stale"
+        with pytest.raises(Exception, match="redeployed"):
+            client.get("/deploy?model_name=" + VALID_MODEL_NAME)
+
+
+def test_deploy_from_template():
+
+    service_name = get_service_code(VALID_MODEL_NAME)
+    deploys = []
+
+    async def fake_modal_cli(*args, env=None):
+        if args[0] == "deploy":
+            deploys.append((args, env))
+            return 0, b""
+        return 1, b""
+
+    with fake_model_service(delay=0), mock.patch(
+        "modal_creator.assets.utils.run_modal", side_effect=fake_modal_cli
+    ):
+        response = client.get("/deploy?model_name=" + VALID_MODEL_NAME)
+        assert response.status_code == 200
+        assert response.json()["message"] == (
+            f"{VALID_MODEL_NAME} has been deployed succesfully!"
+        )
+
+    # The shared app file is deployed as is; nothing is written per model
+    [(args, env)] = deploys
+    assert args == ("deploy", MODEL_APP_PATH)
+    assert env["HF_MODEL_NAME"] == VALID_MODEL_NAME
+    assert env["MODEL_SERVICE_NAME"] == service_name
+    assert not os.path.exists(service_name)
+
+
+def test_registry_keeps_changes_made_during_refresh():
+
+    listing = threading.Event()
+    release = threading.Event()
+
+    def list_services():
+        listing.set()
+        release.wait()
+        return {"stale-service", "stopped-service"}
+
+    registry = DeploymentRegistry(ttl=60, list_services=list_services)
+    refresh = threading.Thread(target=registry.refresh)
+    refresh.start()
+    listing.wait()
+
+    # Deploy and delete while `modal app list` is still running
+    registry.mark("new-service", True)
+    registry.mark("stopped-service", False)
+    release.set()
+    refresh.join()
+
+    assert registry.is_deployed("new-service")
+    assert registry.is_deployed("stale-service")
+    assert not registry.is_deployed("stopped-service")
+
+
+def fake_pipeline(hf_model_name):
+    """Stands in for a HuggingFace pipeline in the local backend's workers."""
+    if hf_model_name == INVALID_MODEL_NAME:
+        raise OSError(f"{hf_model_name} is not a valid model")
+
+    def classify(images):
+        return [[{"label": "Normal", "score": len(image)}] for image in images]
+
+    return classify
+
+
+def test_local_backend():
+
+    backend = LocalBackend(load_pipeline=fake_pipeline, mp_context="fork")
+    service_name = get_service_code(VALID_MODEL_NAME)
+    image = open("modal_creator/assets/forest.jpg", "rb").read()
+    expected = [[{"label": "Normal", "score": len(image)}]]
+
+    with mock.patch("modal_creator.app.main.backend", backend), mock.patch(
+        "modal_creator.assets.utils.run_modal"
+    ) as run_modal:
+        response = client.post(
+            "/infer?model_name=" + VALID_MODEL_NAME, json={"data": []}
+        )
+        assert response.json() == {
+            "message": f"{VALID_MODEL_NAME} has not been deployed yet."
+        }
+
+        response = client.get("/deploy?model_name=" + VALID_MODEL_NAME)
+        assert response.status_code == 200
+        assert response.json() == {
+            "message": f"{VALID_MODEL_NAME} has been deployed succesfully!",
+            "endpoint": f"local://{service_name}",
+            "service_name": service_name,
+        }
+
+        response = client.get("/deploy?model_name=" + INVALID_MODEL_NAME)
+        assert response.status_code == 500
+
+        # Frames and JSON requests reach the pipeline as the same raw bytes
+        response = client.post(
+            "/infer?model_name=" + VALID_MODEL_NAME,
+            content=encode_frames([image]),
+            headers={"Content-Type": FRAMES_CONTENT_TYPE},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"output": expected}
+
+        data = {"data": [convert_image_to_base64("modal_creator/assets/forest.jpg")]}
+        response = client.post("/infer?model_name=" + VALID_MODEL_NAME, json=data)
+        assert response.json() == {"output": expected}
+
+        # An idle model loses its workers but stays deployed
+        backend.idle_timeout = 0
+        backend.evict_idle()
+        assert service_name not in backend.pools
+        response = client.post("/infer?model_name=" + VALID_MODEL_NAME, json=data)
+        assert response.status_code == 200
+        assert service_name in backend.pools
+
+        response = client.delete("/delete?model_name=" + VALID_MODEL_NAME)
+        assert response.json() == {
+            "message": f"{VALID_MODEL_NAME} has been deleted succesfully!"
+        }
+        assert backend.pools == {}
+
+    run_modal.assert_not_called()
+
+
+def test_local_backend_keeps_pools_in_use():
+    backend = LocalBackend(
+        load_pipeline=fake_pipeline, mp_context="fork", idle_timeout=0.01
+    )
+    service_name = get_service_code(VALID_MODEL_NAME)
+    backend.models[service_name] = VALID_MODEL_NAME
+
+    async def use_while_evicting():
+        async with backend.use_pool(service_name) as pool:
+            # Unused for longer than the timeout, but fetched for a request
+            time.sleep(0.05)
+            backend.evict_idle()
+            assert backend.pools[service_name] is pool
+            assert await pool.run([b"abc"]) == [[{"label": "Normal", "score": 3}]]
+        time.sleep(0.05)
+        backend.evict_idle()
+        assert service_name not in backend.pools
+
+    asyncio.run(use_while_evicting())
+
+
+def test_incomplete_backend_cannot_be_instantiated():
+    class DeployOnlyBackend(InferenceBackend):
+        async def deploy(self, hf_model_name):
+            return {}
+
+    with pytest.raises(TypeError):
+        DeployOnlyBackend()